@@ -1,29 +1,51 @@
 import json
-import boto3
 import os
+import sys
 import base64
 import re
+import bisect
+import tempfile
+import threading
 from datetime import datetime
 
-# Initialize AWS clients
-AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
-MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
+# Deployed packages bundle the backend/shared modules alongside this file; in a checkout they are two levels up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'shared'))
+from lambda_clients import get_client
 
-if not MOCK_MODE:
-    s3_client = boto3.client('s3', region_name=AWS_REGION)
-    transcribe_client = boto3.client('transcribe', region_name=AWS_REGION)
-else:
-    s3_client = None
-    transcribe_client = None
+MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
 
 # Environment variables
 S3_BUCKET = os.environ.get('AUDIO_BUCKET', 'ai-interview-audio')
 TRANSCRIBE_OUTPUT_BUCKET = os.environ.get('TRANSCRIBE_OUTPUT_BUCKET', 'ai-interview-transcripts')
 
+# 'aws' starts an Amazon Transcribe job; 'faster-whisper' decodes in this Lambda on CPU
+TRANSCRIPTION_ENGINE = os.environ.get('TRANSCRIPTION_ENGINE', 'aws')
+# Same variables and defaults as backend_api/speech_to_text.py - change both together.
+# Multilingual by default: handle_transcription accepts es/fr/de, which the English-only *.en models can't decode
+WHISPER_MODEL_SIZE = os.environ.get('WHISPER_MODEL_SIZE', 'base')
+WHISPER_COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE', 'int8')
+WHISPER_CPU_THREADS = int(os.environ.get('WHISPER_CPU_THREADS', '0'))  # 0 = let CTranslate2 decide
+WHISPER_BEAM_SIZE = int(os.environ.get('WHISPER_BEAM_SIZE', '1'))
+WHISPER_VAD_FILTER = os.environ.get('WHISPER_VAD_FILTER', 'true').lower() == 'true'
+WHISPER_CHUNK_SECONDS = int(os.environ.get('WHISPER_CHUNK_SECONDS', '30'))
+
+# Loaded on first local transcription and reused across warm invocations
+whisper_model = None
+# Concurrent first transcriptions (the orchestrator's in-process mode) would each load the model
+_whisper_lock = threading.Lock()
+
 # Filler words to detect
 FILLER_WORDS = ['um', 'uh', 'like', 'you know', 'basically', 'actually', 'literally', 
                 'sort of', 'kind of', 'i mean', 'so', 'well', 'right']
 
+# All fillers in one alternation, compiled once per container. Longest first so
+# a multi-word filler wins over any filler it starts with; whitespace inside
+# multi-word fillers matches any run of spaces/newlines.
+FILLER_PATTERN = re.compile(
+    r'\b(' + '|'.join(r'\s+'.join(map(re.escape, filler.split()))
+                       for filler in sorted(FILLER_WORDS, key=len, reverse=True)) + r')\b'
+)
+
 
 def assess_pace(wpm):
     """
@@ -45,13 +67,58 @@ def assess_pace(wpm):
         return "very fast"
 
 
-def analyze_speech_metrics(transcript, duration):
+def find_fillers(text, word_starts=None):
+    """
+    Count filler words in a single scan of the text
+    
+    Args:
+        text (str): Lowercased transcript
+        word_starts (list): Optional (char offset, start_time) per word, sorted by offset
+        
+    Returns:
+        dict: filler -> {'count': n, 'timestamps': [...]} (timestamps only with word_starts)
+    """
+    found = {}
+    offsets = [offset for offset, _ in word_starts] if word_starts else None
+    for match in FILLER_PATTERN.finditer(text):
+        filler = ' '.join(match.group(1).split())
+        entry = found.setdefault(filler, {'count': 0, 'timestamps': []})
+        entry['count'] += 1
+        if offsets:
+            entry['timestamps'].append(word_starts[bisect.bisect_right(offsets, match.start()) - 1][1])
+    return found
+
+
+def timed_text(word_timings):
+    """
+    Join timed words into lowercase text, remembering where each word starts
+    
+    Args:
+        word_timings (list): [{'word' or 'content': str, 'start_time': seconds}], e.g.
+            Amazon Transcribe items or faster-whisper words
+        
+    Returns:
+        tuple: (text, [(char offset, start_time)])
+    """
+    parts, word_starts, offset = [], [], 0
+    for item in word_timings:
+        word = str(item.get('word', item.get('content', ''))).strip().lower()
+        if not word or item.get('start_time') is None:
+            continue
+        word_starts.append((offset, round(float(item['start_time']), 2)))
+        parts.append(word)
+        offset += len(word) + 1
+    return ' '.join(parts), word_starts
+
+
+def analyze_speech_metrics(transcript, duration, word_timings=None):
     """
     Analyze speech metrics from transcript and duration
     
     Args:
         transcript (str): The speech transcript
-        duration (float): Duration in seconds
+        duration (float): Duration in seconds, or None if unknown (no pace metrics)
+        word_timings (list): Optional per-word start times; adds filler timestamps
         
     Returns:
         dict: Speech metrics including pace, filler words, etc.
@@ -60,45 +127,39 @@ def analyze_speech_metrics(transcript, duration):
     words = transcript.split()
     word_count = len(words)
     
-    # Calculate pace (words per minute)
-    pace_wpm = int((word_count / duration) * 60) if duration > 0 else 0
-    
     # Count filler words
-    transcript_lower = transcript.lower()
-    filler_count = 0
+    if word_timings:
+        found = find_fillers(*timed_text(word_timings))
+    else:
+        found = find_fillers(transcript.lower())
+    filler_count = sum(entry['count'] for entry in found.values())
     filler_details = []
     
     for filler in FILLER_WORDS:
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(filler) + r'\b'
-        matches = re.findall(pattern, transcript_lower)
-        count = len(matches)
-        if count > 0:
-            filler_count += count
-            filler_details.append({
-                'word': filler,
-                'count': count
-            })
+        if filler in found:
+            detail = {'word': filler, 'count': found[filler]['count']}
+            if word_timings:
+                detail['timestamps'] = found[filler]['timestamps']
+            filler_details.append(detail)
     
     # Calculate filler rate (percentage)
     filler_rate = round((filler_count / word_count * 100), 2) if word_count > 0 else 0
     
-    # Assess pace
-    pace_assessment = assess_pace(pace_wpm)
-    
     # Calculate additional metrics
     avg_word_length = sum(len(word) for word in words) / word_count if word_count > 0 else 0
     
-    return {
+    metrics = {
         'word_count': word_count,
-        'pace_wpm': pace_wpm,
-        'pace_assessment': pace_assessment,
         'filler_count': filler_count,
         'filler_rate': filler_rate,
         'filler_details': filler_details,
-        'duration': duration,
         'avg_word_length': round(avg_word_length, 2)
     }
+    if duration is not None:
+        # Calculate and assess pace (words per minute)
+        pace_wpm = int((word_count / duration) * 60) if duration > 0 else 0
+        metrics.update({'pace_wpm': pace_wpm, 'pace_assessment': assess_pace(pace_wpm), 'duration': duration})
+    return metrics
 
 
 def lambda_handler(event, context):
@@ -107,8 +168,8 @@ def lambda_handler(event, context):
     Handles audio upload, transcription, and analysis
     """
     try:
-        # Parse the incoming event
-        body = json.loads(event.get('body', '{}'))
+        # Parse the incoming event (API Gateway wraps the request in 'body'; direct invokes send it as the event)
+        body = json.loads(event['body']) if isinstance(event.get('body'), str) else event
         action = body.get('action', '')
         
         # Route to appropriate handler
@@ -144,12 +205,17 @@ def handle_speech_analysis(body):
         if len(transcript) > 10000:
             return response(400, {'error': 'Transcript too long (max 10KB)'})
         
-        duration = body.get('duration', 0)
-        if not isinstance(duration, (int, float)) or duration <= 0:
-            return response(400, {'error': 'Valid duration (>0) is required'})
+        # Optional: without it the metrics leave out pace
+        duration = body.get('duration')
+        if duration is not None and (not isinstance(duration, (int, float)) or duration <= 0):
+            return response(400, {'error': 'duration must be a number > 0'})
+        
+        word_timings = body.get('word_timings')
+        if word_timings is not None and not isinstance(word_timings, list):
+            return response(400, {'error': 'word_timings must be a list'})
         
         # Analyze the speech
-        metrics = analyze_speech_metrics(transcript, duration)
+        metrics = analyze_speech_metrics(transcript, duration, word_timings)
         
         return response(200, {
             'message': 'Speech analysis completed',
@@ -197,7 +263,7 @@ def handle_audio_upload(body):
         s3_key = f"interviews/{interview_id}/questions/{question_id}/audio_{timestamp}.{audio_format}"
         
         # Upload to S3
-        s3_client.put_object(
+        get_client('s3').put_object(
             Bucket=S3_BUCKET,
             Key=s3_key,
             Body=audio_bytes,
@@ -255,8 +321,19 @@ def handle_transcription(body):
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')
         job_name = f"interview_{interview_id}_q_{question_id}_{timestamp}"
         
+        if TRANSCRIPTION_ENGINE == 'faster-whisper':
+            transcript = transcribe_locally(audio_url, language_code)
+            return response(200, {
+                'message': 'Transcription completed',
+                'job_name': job_name,
+                'interview_id': interview_id,
+                'question_id': question_id,
+                'status': 'COMPLETED',
+                'transcript': transcript
+            })
+        
         # Start transcription job
-        transcribe_client.start_transcription_job(
+        get_client('transcribe').start_transcription_job(
             TranscriptionJobName=job_name,
             Media={'MediaFileUri': audio_url},
             MediaFormat='webm',  # Adjust based on your audio format
@@ -281,6 +358,58 @@ def handle_transcription(body):
         return response(500, {'error': str(e)})
 
 
+def whisper_language(model_size, language_code):
+    """
+    Whisper language for a Transcribe-style code; None for English-only *.en models,
+    which take no language argument
+    """
+    return None if model_size.endswith('.en') else language_code.split('-')[0]
+
+
+def load_whisper_model():
+    """Load the faster-whisper model once per container"""
+    global whisper_model
+    with _whisper_lock:
+        if whisper_model is None:
+            from faster_whisper import WhisperModel
+            whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device='cpu', compute_type=WHISPER_COMPUTE_TYPE,
+                                         cpu_threads=WHISPER_CPU_THREADS, download_root='/tmp/whisper-models')
+    return whisper_model
+
+
+def transcribe_locally(audio_url, language_code):
+    """
+    Download audio from S3 and transcribe it on CPU with faster-whisper
+    
+    Args:
+        audio_url (str): s3://bucket/key of the recorded answer
+        language_code (str): Transcribe-style language code, e.g. en-US
+        
+    Returns:
+        str: The transcript
+    """
+    model = load_whisper_model()
+    
+    bucket, key = audio_url[len('s3://'):].split('/', 1)
+    # Upload keys only have second resolution, so answers transcribed concurrently
+    # could share a basename; each download gets its own file
+    fd, local_path = tempfile.mkstemp(suffix=os.path.splitext(key)[1])
+    os.close(fd)
+    try:
+        get_client('s3').download_file(bucket, key, local_path)
+        segments, _info = model.transcribe(
+            local_path,
+            language=whisper_language(WHISPER_MODEL_SIZE, language_code),
+            beam_size=WHISPER_BEAM_SIZE,
+            vad_filter=WHISPER_VAD_FILTER,
+            chunk_length=WHISPER_CHUNK_SECONDS,
+            condition_on_previous_text=False
+        )
+        return ' '.join(segment.text.strip() for segment in segments)
+    finally:
+        os.remove(local_path)
+
+
 def handle_transcription_status(body):
     """
     Check status of transcription job
@@ -292,7 +421,7 @@ def handle_transcription_status(body):
             return response(400, {'error': 'Valid job_name is required'})
         
         # Get job status
-        result = transcribe_client.get_transcription_job(
+        result = get_client('transcribe').get_transcription_job(
             TranscriptionJobName=job_name
         )
         
@@ -336,11 +465,14 @@ def handle_audio_analysis(body):
             return response(400, {'error': 'Invalid transcript format'})
         if duration and not isinstance(duration, (int, float)):
             return response(400, {'error': 'Invalid duration format'})
+        word_timings = body.get('word_timings')
+        if word_timings is not None and not isinstance(word_timings, list):
+            return response(400, {'error': 'word_timings must be a list'})
         
         # If transcript and duration provided, do speech analysis
         speech_metrics = {}
         if transcript and duration > 0:
-            speech_metrics = analyze_speech_metrics(transcript, duration)
+            speech_metrics = analyze_speech_metrics(transcript, duration, word_timings)
         
         # Placeholder for additional audio analysis
         # In production, you might use:
@@ -3,32 +3,32 @@ Feedback Generator Lambda Function
 Uses AWS Bedrock (Claude) to generate personalized interview feedback
 Based on Professor Henry's Interview Framework
 """
+import functools
 import json
-import boto3
 import os
+import sys
 from datetime import datetime
 
-# AWS Region Configuration
-AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
+# Deployed packages bundle the backend/shared modules alongside this file; in a checkout they are two levels up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'shared'))
+import lambda_clients
+from json_extraction import extract_json
+
 MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
 
-# Initialize AWS clients
-if not MOCK_MODE:
-    bedrock = boto3.client('bedrock-runtime', region_name=AWS_REGION)
-    dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-else:
-    bedrock = None
-    dynamodb = None
+# Claude calls run longer than the default read timeout
+get_client = functools.partial(lambda_clients.get_client, read_timeout=120)
 
 TABLE_NAME = os.environ.get('SESSIONS_TABLE', 'InterviewSessions')
 MODEL_ID = 'anthropic.claude-3-5-sonnet-20241022-v2:0'  # Latest Claude model
+MAX_BATCH_QUESTIONS = 10
 
 
 def lambda_handler(event, context):
     """Generate feedback for interview responses"""
     try:
-        # Validate event structure
-        if not event or 'body' not in event:
+        # Validate event structure (API Gateway wraps the request in 'body'; direct invokes send it as the event)
+        if not event:
             return error_response(400, "Invalid request format")
             
         body = json.loads(event['body']) if isinstance(event.get('body'), str) else event
@@ -40,7 +40,8 @@ def lambda_handler(event, context):
         action = body.get('action', 'analyze_response')
         
         # Validate action
-        valid_actions = ['analyze_response', 'generate_question', 'overall_feedback']
+        valid_actions = ['analyze_response', 'generate_question', 'generate_questions', 'generate_followup',
+                         'save_response', 'overall_feedback']
         if action not in valid_actions:
             return error_response(400, f"Invalid action. Must be one of: {valid_actions}")
         
@@ -48,6 +49,12 @@ def lambda_handler(event, context):
             return analyze_response(body)
         elif action == 'generate_question':
             return generate_interview_question(body)
+        elif action == 'generate_questions':
+            return generate_interview_questions(body)
+        elif action == 'generate_followup':
+            return generate_followup_question(body)
+        elif action == 'save_response':
+            return save_response(body)
         elif action == 'overall_feedback':
             return generate_overall_feedback(body)
             
@@ -56,6 +63,8 @@ def lambda_handler(event, context):
         return error_response(400, "Invalid JSON format")
     except Exception as e:
         print(f"Error in feedback generator: {str(e)}")
+        if isinstance(event, dict) and event.get('raise_errors'):
+            raise
         return error_response(500, "Internal server error")
 
 
@@ -111,8 +120,8 @@ def analyze_response(body):
             if not feedback or "Error generating feedback" in feedback:
                 return error_response(500, "Failed to generate feedback")
         
-        # Save feedback to DynamoDB (skip in mock mode)
-        if not MOCK_MODE:
+        # Save feedback to DynamoDB (skip in mock mode, or when the caller persists it separately)
+        if not MOCK_MODE and body.get('save', True):
             save_feedback(session_id, question, response_text, feedback, response_metrics)
         
         return success_response({
@@ -274,7 +283,7 @@ def call_claude(prompt):
             ]
         }
         
-        response = bedrock.invoke_model(
+        response = get_client('bedrock-runtime').invoke_model(
             modelId=MODEL_ID,
             body=json.dumps(request_body)
         )
@@ -321,6 +330,113 @@ Return only the question text, nothing else."""
     })
 
 
+def generate_interview_questions(body):
+    """Generate one interview question per competency in a single Claude call"""
+    
+    job_description = body.get('job_description', '')
+    question_type = body.get('question_type', 'behavioral')
+    competencies = body.get('competencies', [])
+    
+    if not isinstance(competencies, list) or not competencies or not all(isinstance(c, str) for c in competencies):
+        return error_response(400, "competencies must be a non-empty list of strings")
+    competencies = competencies[:MAX_BATCH_QUESTIONS]
+    
+    if MOCK_MODE:
+        return success_response({
+            'questions': {c: f"Mock question assessing {c}." for c in competencies},
+            'question_type': question_type
+        })
+    
+    example = json.dumps({c: "question text" for c in competencies}, indent=2)
+    prompt = f"""You are an expert interviewer. Generate relevant interview questions.
+
+JOB DESCRIPTION:
+{job_description[:500]}
+
+QUESTION TYPE: {question_type}
+COMPETENCIES TO ASSESS: {', '.join(competencies)}
+
+Generate ONE interview question per competency. Each question must:
+1. Be relevant to this specific job
+2. Follow the {question_type} format
+3. Assess its competency
+4. Be clear and professional
+
+Return only a JSON object mapping each competency to its question text, nothing else:
+{example}"""
+
+    questions = parse_questions(call_claude(prompt), competencies)
+    if not questions:
+        return error_response(500, "Failed to generate questions")
+    
+    return success_response({
+        'questions': questions,
+        'question_type': question_type
+    })
+
+
+def parse_questions(text, competencies):
+    """Question text per requested competency from Claude's JSON reply; competencies it skipped are left out"""
+    data = extract_json(text) or {}
+    return {c: data[c].strip() for c in competencies if isinstance(data.get(c), str) and data[c].strip()}
+
+
+def generate_followup_question(body):
+    """Generate a follow-up question that probes the candidate's answer"""
+    
+    question = str(body.get('question', ''))[:1000]
+    response_text = str(body.get('response_text', ''))[:5000]
+    job_description = str(body.get('job_description', ''))[:500]
+    
+    if not question or not response_text:
+        return error_response(400, "Question and response_text are required")
+    
+    prompt = f"""You are an expert interviewer conducting a mock interview.
+
+Original Question: {question}
+Candidate's Answer: {response_text}
+Job Context: {job_description}
+
+Based on the candidate's answer, generate ONE specific follow-up question that:
+- Digs deeper into their response
+- Probes for specific examples or details
+- Clarifies any vague points
+
+Return ONLY the follow-up question text, nothing else."""
+
+    followup = call_claude(prompt)
+    if not followup or "Error generating feedback" in followup:
+        followup = "Can you elaborate more on that aspect?"
+    
+    return success_response({
+        'followup_question': followup.strip()
+    })
+
+
+def save_response(body):
+    """Persist an analyzed response; the orchestrator sends this after answering the candidate"""
+    try:
+        session_id = body.get('session_id')
+        if not session_id or not isinstance(session_id, str):
+            return error_response(400, "Valid session_id is required")
+        
+        if not MOCK_MODE:
+            save_feedback(session_id, body.get('question', ''), body.get('response_text', ''),
+                          body.get('feedback', ''), body.get('metrics', {}))
+        
+        return success_response({
+            'session_id': session_id,
+            'saved': True
+        })
+    except Exception as e:
+        print(f"Error saving response for session {body.get('session_id')}, "
+              f"question {body.get('question', '')[:80]!r}: {str(e)}")
+        if body.get('raise_errors'):
+            # Asynchronous invocations are only retried by Lambda when the function raises
+            raise
+        return error_response(500, "Failed to save response")
+
+
 def generate_overall_feedback(body):
     """Generate overall interview performance feedback"""
     try:
@@ -337,7 +453,7 @@ def generate_overall_feedback(body):
             })
         
         # Retrieve session data from DynamoDB
-        table = dynamodb.Table(TABLE_NAME)
+        table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
         response = table.get_item(Key={'session_id': session_id})
         
         if 'Item' not in response:
@@ -408,7 +524,7 @@ def save_feedback(session_id, question, response_text, feedback, metrics):
         if not session_id or not isinstance(session_id, str):
             raise ValueError("Invalid session_id")
             
-        table = dynamodb.Table(TABLE_NAME)
+        table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
         
         # Sanitize data before saving
         response_data = {
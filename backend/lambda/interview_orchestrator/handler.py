@@ -3,25 +3,67 @@ Interview Orchestrator Lambda Function
 Main coordinator for interview sessions
 """
 import json
-import boto3
 import os
+import sys
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# AWS Region Configuration
-AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
+# Deployed packages bundle the backend/shared modules alongside this file; in a checkout they are two levels up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'shared'))
+from lambda_clients import get_client
+
 MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
 
-# Initialize AWS clients only if not in mock mode
-if not MOCK_MODE:
-    dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-    lambda_client = boto3.client('lambda', region_name=AWS_REGION)
-else:
-    # Mock storage for local testing
+# 'lambda' invokes audio_processor and feedback_generator through the Lambda API; 'inprocess' imports
+# their handlers and calls them directly, for a single monolith function or a local server
+DISPATCH_MODE = os.environ.get('DISPATCH_MODE', 'lambda').lower()
+# inprocess mode loads <LAMBDA_HANDLERS_DIR>/<function_name>/handler.py: subdirectories of this package when
+# deployed as a monolith (deploy.sh with DISPATCH_MODE=inprocess), sibling directories in a checkout
+_handler_dir = os.path.dirname(os.path.abspath(__file__))
+LAMBDA_HANDLERS_DIR = os.environ.get('LAMBDA_HANDLERS_DIR', _handler_dir if os.path.isdir(os.path.join(_handler_dir, 'feedback_generator'))
+                                     else os.path.dirname(_handler_dir))
+_handlers = {}
+_handlers_lock = threading.Lock()
+BACKGROUND_WORKERS = int(os.environ.get('BACKGROUND_WORKERS', '4'))
+# Attempts for in-process fire-and-forget calls (e.g. saving a response); nothing else retries them
+BACKGROUND_ATTEMPTS = int(os.environ.get('BACKGROUND_ATTEMPTS', '2'))
+# Must match the audio_processor function's setting: only faster-whisper returns a transcript inline,
+# while 'aws' just starts an Amazon Transcribe job, so audio answers need a client-side transcript
+TRANSCRIPTION_ENGINE = os.environ.get('TRANSCRIPTION_ENGINE', 'aws')
+_background_pool = None
+
+
+def get_handler(function_name):
+    """lambda_handler of a sibling function, imported once per container"""
+    with _handlers_lock:
+        if function_name not in _handlers:
+            import importlib.util
+            path = os.path.join(LAMBDA_HANDLERS_DIR, function_name, 'handler.py')
+            # Every function's module is called handler, so each gets its own name
+            spec = importlib.util.spec_from_file_location(f"{function_name}_handler", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _handlers[function_name] = module.lambda_handler
+    return _handlers[function_name]
+
+
+# Mock storage for local testing
+if MOCK_MODE:
     MOCK_SESSIONS = {}
 
 TABLE_NAME = os.environ.get('SESSIONS_TABLE', 'InterviewSessions')
 
+BEHAVIORAL_COMPETENCIES = ['problem_solving', 'leadership', 'teamwork', 'communication', 'adaptability']
+QUESTIONS_PER_TYPE = 2
+# One Claude call for every competency's question; false fans out one call per competency instead,
+# which finishes sooner (each reply is short) but pays the prompt and an invoke per question
+QUESTION_BATCH_ENABLED = os.environ.get('QUESTION_BATCH_ENABLED', 'true').lower() == 'true'
+# Concurrent generate_question invokes when the batched call comes back incomplete
+QUESTION_FANOUT_WORKERS = int(os.environ.get('QUESTION_FANOUT_WORKERS', '8'))
+
 # Common interview questions bank from framework
 QUESTION_BANK = {
     'behavioral': [
@@ -156,7 +198,7 @@ def start_interview_session(body):
         if MOCK_MODE:
             MOCK_SESSIONS[session_id] = session_data
         else:
-            table = dynamodb.Table(TABLE_NAME)
+            table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
             table.put_item(Item=session_data)
         
         return success_response({
@@ -183,7 +225,7 @@ def get_next_question(body):
                 return error_response(404, "Session not found")
             session = MOCK_SESSIONS[session_id]
         else:
-            table = dynamodb.Table(TABLE_NAME)
+            table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
             response = table.get_item(Key={'session_id': session_id})
             
             if 'Item' not in response:
@@ -206,7 +248,7 @@ def get_next_question(body):
             if MOCK_MODE:
                 MOCK_SESSIONS[session_id] = session
             else:
-                table = dynamodb.Table(TABLE_NAME)
+                table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
                 table.update_item(
                     Key={'session_id': session_id},
                     UpdateExpression='SET question_list = :ql',
@@ -234,7 +276,7 @@ def get_next_question(body):
         if MOCK_MODE:
             MOCK_SESSIONS[session_id] = session
         else:
-            table = dynamodb.Table(TABLE_NAME)
+            table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
             table.update_item(
                 Key={'session_id': session_id},
                 UpdateExpression='SET current_question = :q, current_question_index = :i, updated_at = :t',
@@ -266,36 +308,19 @@ def build_question_list(question_types, job_title="", job_description=""):
     # Use LLM to generate contextual questions if job info provided
     if job_title and not MOCK_MODE:
         try:
-            # Generate questions using feedback generator
+            # All behavioral questions come from one feedback generator call
+            competencies = BEHAVIORAL_COMPETENCIES[:QUESTIONS_PER_TYPE]
+            behavioral = generate_questions(competencies, 'behavioral', job_title, job_description) if 'behavioral' in question_types else {}
+            
             for qtype in question_types:
                 if qtype == 'behavioral':
-                    competencies = ['problem_solving', 'leadership', 'teamwork', 'communication', 'adaptability']
-                    for comp in competencies[:2]:  # Limit to 2 per type
-                        question_result = invoke_lambda('feedback_generator', {
-                            'action': 'generate_question',
-                            'job_description': job_description,
-                            'job_title': job_title,
-                            'question_type': qtype,
-                            'competency': comp
+                    for comp in competencies:
+                        question_list.append({
+                            'question': behavioral.get(comp) or f"Tell me about a time when you demonstrated {comp} in your work.",
+                            'type': qtype,
+                            'competency': comp,
+                            'expected_duration': '2-3 minutes'
                         })
-                        
-                        if question_result.get('statusCode') == 200:
-                            try:
-                                question_body = json.loads(question_result['body'])
-                                question_list.append({
-                                    'question': question_body.get('question', f"Tell me about a time when you demonstrated {comp} in your work."),
-                                    'type': qtype,
-                                    'competency': comp,
-                                    'expected_duration': '2-3 minutes'
-                                })
-                            except (json.JSONDecodeError, KeyError):
-                                # Fallback to default question
-                                question_list.append({
-                                    'question': f"Tell me about a time when you demonstrated {comp} in your work.",
-                                    'type': qtype,
-                                    'competency': comp,
-                                    'expected_duration': '2-3 minutes'
-                                })
                 elif qtype == 'tell_me_about':
                     question_list.append({
                         'question': f"Tell me about yourself and why you're interested in this {job_title} position.",
@@ -330,17 +355,80 @@ def build_question_list(question_types, job_title="", job_description=""):
     return question_list
 
 
+def generate_questions(competencies, question_type, job_title, job_description):
+    """
+    Question text per competency: one batched generate_questions call, then
+    concurrent generate_question calls for any competency the batch missed
+    """
+    questions = {}
+    batch_result = invoke_lambda('feedback_generator', {
+        'action': 'generate_questions',
+        'job_description': job_description,
+        'job_title': job_title,
+        'question_type': question_type,
+        'competencies': competencies
+    }) if QUESTION_BATCH_ENABLED else {}
+    if batch_result.get('statusCode') == 200:
+        try:
+            questions = json.loads(batch_result['body']).get('questions', {})
+        except (json.JSONDecodeError, TypeError, KeyError, AttributeError) as e:
+            print(f"Error parsing batched questions: {str(e)}")
+    
+    missing = [comp for comp in competencies if not questions.get(comp)]
+    if not missing:
+        return questions
+    
+    if QUESTION_BATCH_ENABLED:
+        print(f"Generating {len(missing)} questions individually: {missing}")
+    prepare_dispatch('feedback_generator')
+    with ThreadPoolExecutor(max_workers=min(len(missing), QUESTION_FANOUT_WORKERS)) as pool:
+        results = pool.map(lambda comp: invoke_lambda('feedback_generator', {
+            'action': 'generate_question',
+            'job_description': job_description,
+            'job_title': job_title,
+            'question_type': question_type,
+            'competency': comp
+        }), missing)
+        for comp, result in zip(missing, results):
+            if result.get('statusCode') != 200:
+                continue
+            try:
+                questions[comp] = json.loads(result['body']).get('question')
+            except (json.JSONDecodeError, TypeError, KeyError, AttributeError):
+                pass
+    return questions
+
+
 def process_response(body):
-    """Process candidate's response and generate feedback"""
+    """
+    Process candidate's response and generate feedback
+    
+    Stages run as soon as their inputs exist: transcript, then speech metrics,
+    then feedback and the optional follow-up question together. The response
+    is saved by an async invoke, so the candidate doesn't wait on DynamoDB.
+    """
     try:
+        request_start = time.perf_counter()
+        timings = {}
+        
         # Validate inputs
         session_id = body.get('session_id')
         if not session_id or not isinstance(session_id, str):
             return error_response(400, "Valid session_id is required")
         
+        # A transcript from client-side speech-to-text skips the transcription stage
+        transcript = body.get('transcript')
         audio_data = body.get('audio_data')
-        if not MOCK_MODE and (not audio_data or not isinstance(audio_data, str)):
-            return error_response(400, "Valid audio_data is required")
+        if transcript is not None and (not transcript or not isinstance(transcript, str)):
+            return error_response(400, "transcript must be a non-empty string")
+        if not MOCK_MODE and not transcript and (not audio_data or not isinstance(audio_data, str)):
+            return error_response(400, "Valid audio_data or transcript is required")
+        if not MOCK_MODE and not transcript and TRANSCRIPTION_ENGINE != 'faster-whisper':
+            # Rejected before uploading, so no S3 object or Transcribe job is left behind
+            return error_response(400, f"transcript is required: the {TRANSCRIPTION_ENGINE} engine does not transcribe inline")
+        
+        # Without a usable duration the metrics have no pace, only filler words
+        duration = answer_duration(body.get('duration'), body.get('word_timings'))
         
         # Retrieve session data
         if MOCK_MODE:
@@ -348,8 +436,8 @@ def process_response(body):
                 return error_response(404, "Session not found")
             session = MOCK_SESSIONS[session_id]
         else:
-            table = dynamodb.Table(TABLE_NAME)
-            response = table.get_item(Key={'session_id': session_id})
+            table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
+            response = timed_stage('load_session', table.get_item, request_start, timings, Key={'session_id': session_id})
             
             if 'Item' not in response:
                 return error_response(404, "Session not found")
@@ -378,26 +466,20 @@ def process_response(body):
                 'processed': True
             })
         
-        # Step 1: Transcribe audio
-        audio_result = invoke_lambda('audio_processor', {
-            'action': 'transcribe',
-            'audio_data': audio_data,
-            'session_id': session_id
-        })
-        
-        if audio_result.get('statusCode') != 200:
-            return error_response(500, "Audio transcription failed")
+        # Stage 1: Transcribe audio
+        if not transcript:
+            question_id = str(session.get('current_question_index', 0))
+            transcript = timed_stage('transcribe', transcribe_answer, request_start, timings,
+                                     session_id, question_id, audio_data, body.get('format', 'webm'))
+            if not transcript:
+                return error_response(500, "Audio transcription failed")
         
-        try:
-            audio_body = json.loads(audio_result['body'])
-            transcript = audio_body.get('transcript', '')
-            metrics = audio_body.get('metrics', {})
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
-            print(f"Error parsing audio processor response: {str(e)}")
-            return error_response(500, "Invalid response from audio processor")
+        # Stage 2: Speech metrics, which the feedback prompt uses
+        metrics = timed_stage('speech_metrics', speech_metrics, request_start, timings,
+                              transcript, duration, body.get('word_timings'))
         
-        # Step 2: Generate feedback
-        feedback_result = invoke_lambda('feedback_generator', {
+        # Stage 3: Feedback and follow-up question are independent Claude calls - run them together
+        feedback_payload = {
             'action': 'analyze_response',
             'session_id': session_id,
             'question': current_question.get('question', ''),
@@ -405,8 +487,23 @@ def process_response(body):
             'response_text': transcript,
             'metrics': metrics,
             'job_description': job_description,
-            'resume_text': resume_text
-        })
+            'resume_text': resume_text,
+            'save': False
+        }
+        followup_payload = {
+            'action': 'generate_followup',
+            'question': current_question.get('question', ''),
+            'response_text': transcript,
+            'job_description': job_description
+        }
+        prepare_dispatch('feedback_generator')
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            feedback_future = pool.submit(timed_stage, 'feedback', invoke_lambda, request_start, timings,
+                                          'feedback_generator', feedback_payload)
+            followup_future = pool.submit(timed_stage, 'followup', invoke_lambda, request_start, timings,
+                                          'feedback_generator', followup_payload) if body.get('request_followup') else None
+            feedback_result = feedback_future.result()
+            followup_result = followup_future.result() if followup_future else None
         
         if feedback_result.get('statusCode') != 200:
             return error_response(500, "Feedback generation failed")
@@ -417,18 +514,112 @@ def process_response(body):
             print(f"Error parsing feedback generator response: {str(e)}")
             return error_response(500, "Invalid response from feedback generator")
         
+        followup_question = None
+        if followup_result and followup_result.get('statusCode') == 200:
+            try:
+                followup_question = json.loads(followup_result['body']).get('followup_question')
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                print(f"Error parsing follow-up response: {str(e)}")
+        
+        # Stage 4: Persist without waiting for the write
+        timed_stage('persist', invoke_lambda_async, request_start, timings, 'feedback_generator', {
+            'action': 'save_response',
+            'session_id': session_id,
+            'question': current_question.get('question', ''),
+            'response_text': transcript,
+            'feedback': feedback_body.get('feedback', ''),
+            'metrics': metrics
+        })
+        
         return success_response({
             'session_id': session_id,
             'transcript': transcript,
             'metrics': metrics,
             'feedback': feedback_body.get('feedback', ''),
-            'processed': True
+            'followup_question': followup_question,
+            'processed': True,
+            'timings_ms': timings,
+            'total_ms': round((time.perf_counter() - request_start) * 1000, 1)
         })
     except Exception as e:
         print(f"Error processing response: {str(e)}")
         return error_response(500, "Failed to process response")
 
 
+def timed_stage(name, func, request_start, timings, *args, **kwargs):
+    """Run a stage and record its start offset and duration (ms) relative to the request"""
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[name] = {
+            'start_ms': round((start - request_start) * 1000, 1),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 1)
+        }
+
+
+def transcribe_answer(session_id, question_id, audio_data, audio_format):
+    """Upload the answer audio and transcribe it inline (faster-whisper engine); None if no transcript came back"""
+    upload_result = invoke_lambda('audio_processor', {
+        'action': 'upload',
+        'interview_id': session_id,
+        'question_id': question_id,
+        'audio_data': audio_data,
+        'format': audio_format
+    })
+    if upload_result.get('statusCode') != 200:
+        return None
+    
+    try:
+        audio_url = json.loads(upload_result['body'])['audio_url']
+        transcribe_result = invoke_lambda('audio_processor', {
+            'action': 'transcribe',
+            'audio_url': audio_url,
+            'interview_id': session_id,
+            'question_id': question_id
+        })
+        if transcribe_result.get('statusCode') != 200:
+            return None
+        transcribe_body = json.loads(transcribe_result['body'])
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        print(f"Error parsing audio processor response: {str(e)}")
+        return None
+    
+    if not transcribe_body.get('transcript'):
+        print(f"No transcript for {transcribe_body.get('job_name')} ({transcribe_body.get('status')})")
+    return transcribe_body.get('transcript')
+
+
+def answer_duration(duration, word_timings=None):
+    """Seconds the answer lasted: the client's duration, else the last word's end time; None if neither is usable"""
+    if isinstance(duration, (int, float)) and not isinstance(duration, bool) and duration > 0:
+        return duration
+    try:
+        end = max(float(item.get('end_time', item.get('end', item.get('start_time')))) for item in word_timings or []
+                  if item.get('end_time', item.get('end', item.get('start_time'))) is not None)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return end if end > 0 else None
+
+
+def speech_metrics(transcript, duration, word_timings=None):
+    """Pace and filler-word metrics (no pace when duration is None); empty if the audio processor fails"""
+    result = invoke_lambda('audio_processor', {
+        'action': 'analyze_speech',
+        'transcript': transcript,
+        'duration': duration,
+        'word_timings': word_timings
+    })
+    if result.get('statusCode') != 200:
+        return {}
+    
+    try:
+        return json.loads(result['body']).get('metrics', {})
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        print(f"Error parsing speech metrics: {str(e)}")
+        return {}
+
+
 def end_interview_session(body):
     """End interview session and generate overall feedback"""
     try:
@@ -468,7 +659,7 @@ def end_interview_session(body):
             return error_response(500, "Invalid response from feedback generator")
         
         # Update session status
-        table = dynamodb.Table(TABLE_NAME)
+        table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
         table.update_item(
             Key={'session_id': session_id},
             UpdateExpression='SET #status = :status, completed_at = :time',
@@ -506,7 +697,7 @@ def get_session_data(body):
                 'session': MOCK_SESSIONS[session_id]
             })
         
-        table = dynamodb.Table(TABLE_NAME)
+        table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
         response = table.get_item(Key={'session_id': session_id})
         
         if 'Item' not in response:
@@ -521,13 +712,21 @@ def get_session_data(body):
 
 
 def invoke_lambda(function_name, payload):
-    """Invoke another Lambda function"""
+    """Invoke another Lambda function, or call its handler directly in inprocess mode"""
     
     if MOCK_MODE:
         return {'statusCode': 500, 'body': json.dumps({'error': 'Lambda invocation not available in mock mode'})}
     
+    if DISPATCH_MODE == 'inprocess':
+        try:
+            # Same response shape as a remote invoke, without serializing the payload or a network hop
+            return get_handler(function_name)(payload, None)
+        except Exception as e:
+            print(f"Error calling {function_name} in-process: {str(e)}")
+            return {'statusCode': 500, 'body': json.dumps({'error': str(e)})}
+    
     try:
-        response = lambda_client.invoke(
+        response = get_client('lambda').invoke(
             FunctionName=function_name,
             InvocationType='RequestResponse',
             Payload=json.dumps(payload)
@@ -539,6 +738,69 @@ def invoke_lambda(function_name, payload):
         return {'statusCode': 500, 'body': json.dumps({'error': str(e)})}
 
 
+def invoke_lambda_async(function_name, payload):
+    """Start another function without waiting for its result"""
+    
+    if MOCK_MODE:
+        return
+    
+    if DISPATCH_MODE == 'inprocess':
+        if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+            # Lambda freezes background threads once the response is returned, so run it now
+            invoke_with_retries(function_name, payload)
+        else:
+            get_background_pool().submit(invoke_with_retries, function_name, payload)
+        return
+    
+    # Lambda retries failed Event invocations itself, so only the hand-off needs retrying here;
+    # raise_errors makes the target raise instead of returning a 500 it would otherwise swallow
+    for attempt in range(1, BACKGROUND_ATTEMPTS + 1):
+        try:
+            get_client('lambda').invoke(
+                FunctionName=function_name,
+                InvocationType='Event',
+                Payload=json.dumps({**payload, 'raise_errors': True})
+            )
+            return
+        except Exception as e:
+            log_failure(function_name, payload, attempt, str(e))
+
+
+def get_background_pool():
+    """Worker threads for in-process fire-and-forget calls on a long-running server"""
+    global _background_pool
+    with _handlers_lock:
+        if _background_pool is None:
+            _background_pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS)
+    return _background_pool
+
+
+def invoke_with_retries(function_name, payload):
+    """invoke_lambda for fire-and-forget work, retried since no caller is waiting to retry it"""
+    for attempt in range(1, BACKGROUND_ATTEMPTS + 1):
+        result = invoke_lambda(function_name, payload)
+        if result.get('statusCode') == 200:
+            return result
+        log_failure(function_name, payload, attempt, result.get('body'))
+        if attempt < BACKGROUND_ATTEMPTS:
+            time.sleep(0.5 * attempt)
+    return result
+
+
+def log_failure(function_name, payload, attempt, error):
+    # Enough to find the lost write: which session and question it was for
+    print(f"Background {payload.get('action')} via {function_name} failed (attempt {attempt}/{BACKGROUND_ATTEMPTS}) "
+          f"for session {payload.get('session_id')}, question {payload.get('question', '')[:80]!r}: {error}")
+
+
+def prepare_dispatch(function_name):
+    """Import the handler or create the lambda client up front, before threads share it"""
+    if DISPATCH_MODE == 'inprocess':
+        get_handler(function_name)
+    else:
+        get_client('lambda')
+
+
 def success_response(data):
     """Return success response"""
     return {
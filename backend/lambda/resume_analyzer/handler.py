@@ -5,20 +5,24 @@ Extracts text from resumes using AWS Textract OCR or direct text input
 import json
 import os
 import re
+import sys
 from datetime import datetime
-import boto3
 
-AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
-MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
+# Deployed packages bundle the backend/shared modules alongside this file; in a checkout they are two levels up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'shared'))
+from lambda_clients import get_client
+from skill_matching import (DEFAULT_TAXONOMY_PATH, MAX_HEADER_LENGTH, RESUME_SECTIONS, build_skill_index,
+                            find_skills, load_skill_taxonomy, section_header)
 
-# Initialize clients only if not in mock mode
-if not MOCK_MODE:
-    textract = boto3.client('textract', region_name=AWS_REGION)
-    s3 = boto3.client('s3', region_name=AWS_REGION)
-    dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+MOCK_MODE = os.environ.get('MOCK_MODE', 'false').lower() == 'true'
 
 BUCKET_NAME = os.environ.get('RESUME_BUCKET', 'interview-coach-resumes')
 TABLE_NAME = os.environ.get('SESSIONS_TABLE', 'InterviewSessions')
+SKILLS_TAXONOMY_PATH = os.environ.get('SKILLS_TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+
+# Built once per container so per-request cost doesn't grow with the taxonomy
+SKILL_TAXONOMY = load_skill_taxonomy(SKILLS_TAXONOMY_PATH)
+SKILL_INDEX = build_skill_index(SKILL_TAXONOMY)
 
 
 def lambda_handler(event, context):
@@ -37,7 +41,7 @@ def lambda_handler(event, context):
         action = body.get('action', 'analyze')
         
         # Validate action
-        valid_actions = ['analyze', 'analyze_text', 'extract_skills']
+        valid_actions = ['analyze', 'analyze_text', 'analyze_batch', 'extract_skills']
         if action not in valid_actions:
             return error_response(400, f"Invalid action. Must be one of: {valid_actions}")
         
@@ -45,6 +49,8 @@ def lambda_handler(event, context):
             return analyze_resume(body)
         elif action == 'analyze_text':
             return analyze_resume_text(body)
+        elif action == 'analyze_batch':
+            return analyze_resume_batch(body)
         elif action == 'extract_skills':
             return extract_skills(body)
             
@@ -80,7 +86,7 @@ def analyze_resume_text(body):
         
         # Save to DynamoDB (skip in mock mode)
         if not MOCK_MODE:
-            table = dynamodb.Table(TABLE_NAME)
+            table = get_client('dynamodb', 'resource').Table(TABLE_NAME)
             table.update_item(
                 Key={'session_id': session_id},
                 UpdateExpression='SET resume_text = :text, resume_data = :data, updated_at = :time',
@@ -123,65 +129,84 @@ def analyze_resume(body):
         return error_response(500, "Failed to analyze resume")
 
 
+MAX_BATCH_RESUMES = 25
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Various formats: +1 (555) 123-4567, 555.123.4567, 5551234567. The lookahead
+# changes no matches but lets the regex engine skip positions that can't start one.
+PHONE_PATTERN = re.compile(r'(?=[+(\d])(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+
+def empty_resume_sections():
+    sections = {name: [] for name, _ in RESUME_SECTIONS}
+    sections['contact'] = {}
+    return sections
+
+
 def parse_resume_content(text):
-    """Parse resume content into structured data"""
+    """Parse resume content into structured data in a single pass over its lines"""
     try:
         if not text or not isinstance(text, str):
-            return {'education': [], 'experience': [], 'skills': [], 'contact': {}}
-        
-        sections = {
-            'education': [],
-            'experience': [],
-            'skills': [],
-            'contact': {}
-        }
+            return empty_resume_sections()
         
-        lines = text.split('\n')
+        sections = empty_resume_sections()
+        contact = sections['contact']
         current_section = None
         
-        # Keywords for section detection
-        education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
-        experience_keywords = ['experience', 'employment', 'work history', 'professional', 'career']
-        skills_keywords = ['skills', 'technical skills', 'competencies', 'expertise', 'technologies']
-        
-        for line in lines:
+        for line in text.split('\n'):
             line_stripped = line.strip()
-            line_lower = line_stripped.lower()
-            
             if not line_stripped:
                 continue
             
             # Detect sections (look for section headers)
-            if any(keyword in line_lower for keyword in education_keywords) and len(line_stripped) < 50:
-                current_section = 'education'
-                continue
-            elif any(keyword in line_lower for keyword in experience_keywords) and len(line_stripped) < 50:
-                current_section = 'experience'
-                continue
-            elif any(keyword in line_lower for keyword in skills_keywords) and len(line_stripped) < 50:
-                current_section = 'skills'
-                continue
+            if len(line_stripped) < MAX_HEADER_LENGTH:
+                header = section_header(line_stripped.lower())
+                if header:
+                    current_section = header
+                    continue
             
             # Add content to current section
-            if current_section and line_stripped:
+            if current_section:
                 sections[current_section].append(line_stripped)
             
-            # Extract email using regex
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_match = re.search(email_pattern, line)
-            if email_match:
-                sections['contact']['email'] = email_match.group()
+            # An '@' check skips the email regex on almost every line
+            if '@' in line:
+                email_match = EMAIL_PATTERN.search(line)
+                if email_match:
+                    contact['email'] = email_match.group()
             
-            # Extract phone using regex (various formats)
-            phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-            phone_match = re.search(phone_pattern, line)
+            phone_match = PHONE_PATTERN.search(line)
             if phone_match:
-                sections['contact']['phone'] = phone_match.group()
+                contact['phone'] = phone_match.group()
         
         return sections
     except Exception as e:
         print(f"Error parsing resume content: {str(e)}")
-        return {'education': [], 'experience': [], 'skills': [], 'contact': {}}
+        return empty_resume_sections()
+
+
+def parse_resume_batch(texts):
+    """Parse several resumes in one call; results are in input order"""
+    return [parse_resume_content(text) for text in texts]
+
+
+def analyze_resume_batch(body):
+    """Parse a batch of plain-text resumes without storing them"""
+    try:
+        resume_texts = body.get('resume_texts')
+        if not isinstance(resume_texts, list) or not resume_texts:
+            return error_response(400, "resume_texts must be a non-empty list")
+        if len(resume_texts) > MAX_BATCH_RESUMES:
+            return error_response(400, f"At most {MAX_BATCH_RESUMES} resumes per batch")
+        if not all(isinstance(text, str) and len(text) <= 50000 for text in resume_texts):
+            return error_response(400, "Each resume must be text of at most 50KB")
+        
+        return success_response({
+            'parsed_data': parse_resume_batch(text.strip() for text in resume_texts)
+        })
+    except Exception as e:
+        print(f"Error analyzing resume batch: {str(e)}")
+        return error_response(500, "Failed to analyze resume batch")
 
 
 def extract_skills(body):
@@ -197,51 +222,23 @@ def extract_skills(body):
         if len(text) > 50000:
             return error_response(400, "Resume text too long (max 50KB)")
         
-        # Comprehensive technical skills list
-        tech_skills = {
-            'Programming Languages': [
-                'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust',
-                'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala', 'R', 'MATLAB', 'SQL'
-            ],
-            'Web Technologies': [
-                'React', 'Angular', 'Vue.js', 'Node.js', 'Express', 'Django', 'Flask',
-                'Spring Boot', 'HTML', 'CSS', 'REST API', 'GraphQL', 'WebSockets'
-            ],
-            'Cloud & DevOps': [
-                'AWS', 'Azure', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins',
-                'GitLab CI', 'GitHub Actions', 'Terraform', 'Ansible', 'CircleCI'
-            ],
-            'Databases': [
-                'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'DynamoDB', 'Cassandra',
-                'Oracle', 'SQL Server', 'Elasticsearch', 'Neo4j'
-            ],
-            'Data & ML': [
-                'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Scikit-learn',
-                'Pandas', 'NumPy', 'Data Analysis', 'Data Science', 'NLP', 'Computer Vision'
-            ],
-            'Soft Skills': [
-                'Leadership', 'Project Management', 'Communication', 'Team Collaboration',
-                'Problem Solving', 'Critical Thinking', 'Agile', 'Scrum'
-            ]
-        }
-        
+        mentions = find_skills(text, SKILL_INDEX)
         found_skills = {}
-        text_lower = text.lower()
+        skill_details = {}
         
-        for category, skills in tech_skills.items():
-            category_skills = []
-            for skill in skills:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    category_skills.append(skill)
-            
+        # Report skills in taxonomy order
+        for category, skills in SKILL_TAXONOMY.items():
+            category_skills = [skill for skill in skills if (category, skill) in mentions]
             if category_skills:
                 found_skills[category] = category_skills
+                for skill in category_skills:
+                    positions = sorted(set(mentions[(category, skill)]))
+                    skill_details[skill] = {'count': len(positions), 'positions': positions}
         
         return success_response({
             'skills_by_category': found_skills,
-            'total_skills_found': sum(len(skills) for skills in found_skills.values())
+            'total_skills_found': sum(len(skills) for skills in found_skills.values()),
+            'skill_details': skill_details
         })
     except Exception as e:
         print(f"Error extracting skills: {str(e)}")
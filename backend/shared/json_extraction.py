@@ -0,0 +1,38 @@
+"""
+Pulling the JSON object out of a Claude reply, shared by the API's
+structured_output module and the feedback_generator Lambda.
+
+deploy.sh/deploy.bat copy this file into the feedback_generator package;
+the API imports it from the checkout.
+"""
+import json
+
+# Each attempt can scan to the end of the text, so trying every '{' is quadratic on long malformed
+# replies; real replies open their object within the first few braces (a preamble or fence)
+MAX_OBJECT_STARTS = 32
+
+_decoder = json.JSONDecoder()
+
+
+def extract_json(text):
+    """
+    First complete JSON object in the text; tolerates preambles, code fences
+    and trailing commentary
+    
+    Returns:
+        dict or None: None if none of the first MAX_OBJECT_STARTS braces
+            opens a valid object
+    """
+    start = text.find('{')
+    for _ in range(MAX_OBJECT_STARTS):
+        if start == -1:
+            break
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+            if isinstance(value, dict):
+                return value
+        except (json.JSONDecodeError, RecursionError):
+            # RecursionError: a truncated reply nested deeper than the decoder allows
+            pass
+        start = text.find('{', start + 1)
+    return None
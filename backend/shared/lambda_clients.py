@@ -0,0 +1,53 @@
+"""
+boto3 clients shared by every Lambda handler in backend/lambda/.
+
+deploy.sh/deploy.bat copy this file into each function's package. The
+API has its own registry in backend_api/aws_clients.py.
+"""
+import os
+import threading
+
+AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
+# Read timeout for most calls; feedback_generator passes a longer one because Claude calls run longer
+DEFAULT_READ_TIMEOUT = 60
+
+# Created on first use and reused across warm invocations, so actions that
+# never touch a service skip creating its client on cold start
+_clients = {}
+# generate_questions fans out over threads, and the orchestrator's in-process
+# mode calls the other handlers from a background pool
+_clients_lock = threading.Lock()
+
+
+def boto_config(read_timeout=DEFAULT_READ_TIMEOUT):
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=int(os.environ.get('AWS_MAX_POOL_CONNECTIONS', '50')),
+        tcp_keepalive=True,
+        connect_timeout=float(os.environ.get('AWS_CONNECT_TIMEOUT', '5')),
+        read_timeout=read_timeout,
+        retries={'mode': os.environ.get('AWS_RETRY_MODE', 'adaptive'), 'max_attempts': int(os.environ.get('AWS_MAX_ATTEMPTS', '5'))}
+    )
+
+
+def get_client(service_name, kind='client', read_timeout=DEFAULT_READ_TIMEOUT):
+    """
+    Shared boto3 client (or resource, with kind='resource') for this container
+
+    Args:
+        service_name (str): e.g. 's3', 'dynamodb'
+        kind (str): 'client' or 'resource'
+        read_timeout (float): Seconds; AWS_READ_TIMEOUT overrides it
+
+    Returns:
+        The client or resource. Handlers with different timeouts get separate ones,
+        since a monolith deployment runs them all in one container
+    """
+    read_timeout = float(os.environ.get('AWS_READ_TIMEOUT', read_timeout))
+    key = (kind, service_name, read_timeout)
+    with _clients_lock:
+        if key not in _clients:
+            import boto3
+            factory = boto3.client if kind == 'client' else boto3.resource
+            _clients[key] = factory(service_name, region_name=AWS_REGION, config=boto_config(read_timeout))
+    return _clients[key]
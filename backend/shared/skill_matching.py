@@ -0,0 +1,96 @@
+"""
+Skill and resume-section matching shared by the resume_analyzer Lambda and
+the API's local resume parser, so both extract the same skills and sections.
+
+deploy.sh/deploy.bat copy this file and skills_taxonomy.json into the
+resume_analyzer package; the API imports it from the checkout.
+"""
+import json
+import os
+import re
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.json')
+
+# Words plus the symbols that are part of skill names (C++, C#); '.', '-' and
+# whitespace separate tokens, so "Vue.js", "vue js" and "Vue-JS" all match
+SKILL_TOKEN_PATTERN = re.compile(r'[a-z0-9]+[+#]*')
+
+# Section headers in priority order: a header line matching several (e.g.
+# "Professional Summary") goes to the first. Only short lines are considered.
+RESUME_SECTIONS = [
+    ('summary', ['summary', 'objective', 'about me']),
+    ('education', ['education', 'academic', 'degree', 'university', 'college', 'school']),
+    ('experience', ['experience', 'employment', 'work history', 'professional', 'career']),
+    ('skills', ['skills', 'technical skills', 'competencies', 'expertise', 'technologies']),
+    ('projects', ['projects', 'portfolio']),
+    ('certifications', ['certification', 'certificate', 'licenses'])
+]
+SECTION_PRIORITY = {name: i for i, (name, _) in enumerate(RESUME_SECTIONS)}
+SECTION_HEADER_PATTERN = re.compile('|'.join(
+    f"(?P<{name}>{'|'.join(map(re.escape, keywords))})" for name, keywords in RESUME_SECTIONS
+))
+MAX_HEADER_LENGTH = 50
+
+
+def skill_tokens(text):
+    return SKILL_TOKEN_PATTERN.findall(text.lower())
+
+
+def load_skill_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def build_skill_index(taxonomy):
+    """
+    Build a token trie over every skill name and alias
+    
+    Args:
+        taxonomy (dict): {category: {canonical skill: [aliases]}}
+        
+    Returns:
+        dict: Nested {token: node} dicts; a node's None key holds the
+            (category, skill) pairs that end there
+    """
+    root = {}
+    for category, skills in taxonomy.items():
+        for skill, aliases in skills.items():
+            for name in [skill] + list(aliases):
+                node = root
+                for token in skill_tokens(name):
+                    node = node.setdefault(token, {})
+                node.setdefault(None, []).append((category, skill))
+    return root
+
+
+def find_skills(text, index):
+    """
+    Find every skill in one pass over the text's tokens
+    
+    Returns:
+        dict: (category, skill) -> list of character offsets where it was
+            mentioned, in order of first mention
+    """
+    matches = list(SKILL_TOKEN_PATTERN.finditer(text.lower()))
+    found = {}
+    i = 0
+    while i < len(matches):
+        node = index.get(matches[i].group())
+        j, longest, end = i, (), i + 1
+        # Keep only the longest skill starting here and skip the tokens it covers, so
+        # the "js" in "Node.js" is not also JavaScript and "SQL Server" is not also SQL
+        while node is not None:
+            j += 1
+            if None in node:
+                longest, end = node[None], j
+            node = node.get(matches[j].group()) if j < len(matches) else None
+        for key in longest:
+            found.setdefault(key, []).append(matches[i].start())
+        i = end
+    return found
+
+
+def section_header(line_lower):
+    """Return the section a header line starts, or None if it isn't a header"""
+    matched = {match.lastgroup for match in SECTION_HEADER_PATTERN.finditer(line_lower)}
+    return min(matched, key=SECTION_PRIORITY.get) if matched else None
@@ -0,0 +1,73 @@
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+from aws_executor import AWS_MAX_WORKERS
+
+AWS_REGION = os.getenv('AWS_REGION', 'us-west-2')
+# botocore defaults to 10 pooled connections per client, which caps in-flight calls
+# far below the executor size; match it so every worker thread can get a connection
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', str(AWS_MAX_WORKERS)))
+AWS_CONNECT_TIMEOUT = float(os.getenv('AWS_CONNECT_TIMEOUT', '5'))
+AWS_READ_TIMEOUT = float(os.getenv('AWS_READ_TIMEOUT', '60'))
+# Long Claude generations can exceed the default read timeout
+BEDROCK_READ_TIMEOUT = float(os.getenv('BEDROCK_READ_TIMEOUT', '120'))
+# 'adaptive' adds client-side rate limiting on throttling errors on top of standard retries
+AWS_RETRY_MODE = os.getenv('AWS_RETRY_MODE', 'adaptive')
+AWS_MAX_ATTEMPTS = int(os.getenv('AWS_MAX_ATTEMPTS', '5'))
+
+_clients: Dict[Tuple[str, str, str], Any] = {}
+_lock = threading.Lock()
+
+def client_config(service_name: str) -> Any:
+    """Connection pool, keep-alive, timeout and retry settings shared by every client"""
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=BEDROCK_READ_TIMEOUT if service_name == 'bedrock-runtime' else AWS_READ_TIMEOUT,
+        retries={'mode': AWS_RETRY_MODE, 'max_attempts': AWS_MAX_ATTEMPTS}
+    )
+
+def _get(kind: str, service_name: str, region_name: str) -> Any:
+    key = (kind, service_name, region_name)
+    existing = _clients.get(key)
+    if existing is not None:
+        return existing
+    # Creating clients isn't thread-safe on the shared default session, and each one is expensive
+    with _lock:
+        if key not in _clients:
+            import boto3
+            factory = boto3.client if kind == 'client' else boto3.resource
+            _clients[key] = factory(service_name, region_name=region_name, config=client_config(service_name))
+        return _clients[key]
+
+def get_client(service_name: str, region_name: str = AWS_REGION) -> Any:
+    """Process-wide boto3 client for a service, created on first use"""
+    return _get('client', service_name, region_name)
+
+def get_resource(service_name: str, region_name: str = AWS_REGION) -> Any:
+    """Process-wide boto3 resource for a service, created on first use"""
+    return _get('resource', service_name, region_name)
+
+class LazyClient:
+    """Module-level stand-in that creates the shared client on first attribute access,
+    so importing a module doesn't pay for boto3 and client construction up front"""
+
+    def __init__(self, kind: str, service_name: str, region_name: str = AWS_REGION):
+        self._kind = kind
+        self._service_name = service_name
+        self._region_name = region_name
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get(self._kind, self._service_name, self._region_name), name)
+
+    def __repr__(self) -> str:
+        return f"LazyClient({self._kind}, {self._service_name})"
+
+def lazy_client(service_name: str, region_name: str = AWS_REGION) -> LazyClient:
+    return LazyClient('client', service_name, region_name)
+
+def lazy_resource(service_name: str, region_name: str = AWS_REGION) -> LazyClient:
+    return LazyClient('resource', service_name, region_name)
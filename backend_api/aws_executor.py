@@ -0,0 +1,49 @@
+import asyncio
+import functools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Threads available for blocking boto3 calls. Each in-flight call holds one
+# thread while it waits on the network, so this bounds total in-flight AWS calls.
+AWS_MAX_WORKERS = int(os.getenv('AWS_MAX_WORKERS', '256'))
+# Per-service caps so a burst of slow Bedrock calls can't starve DynamoDB/Polly
+BEDROCK_MAX_CONCURRENCY = int(os.getenv('BEDROCK_MAX_CONCURRENCY', '200'))
+DYNAMODB_MAX_CONCURRENCY = int(os.getenv('DYNAMODB_MAX_CONCURRENCY', '64'))
+POLLY_MAX_CONCURRENCY = int(os.getenv('POLLY_MAX_CONCURRENCY', '32'))
+# Local speech-to-text is CPU bound, so more jobs than cores only adds latency
+STT_MAX_CONCURRENCY = int(os.getenv('STT_MAX_CONCURRENCY', str(os.cpu_count() or 1)))
+VISION_MAX_CONCURRENCY = int(os.getenv('VISION_MAX_CONCURRENCY', str(os.cpu_count() or 1)))
+
+_LIMITS = {
+    'bedrock': BEDROCK_MAX_CONCURRENCY,
+    'dynamodb': DYNAMODB_MAX_CONCURRENCY,
+    'polly': POLLY_MAX_CONCURRENCY,
+    'stt': STT_MAX_CONCURRENCY,
+    'vision': VISION_MAX_CONCURRENCY,
+}
+
+_executor = ThreadPoolExecutor(max_workers=AWS_MAX_WORKERS, thread_name_prefix='aws')
+# Semaphores belong to the loop they were first awaited on, so each running loop (uvicorn reload,
+# tests, repeated asyncio.run) gets its own set; they go away with the loop
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = weakref.WeakKeyDictionary()
+
+def _get_semaphore(service: str) -> asyncio.Semaphore:
+    """Return the running loop's concurrency limiter for a service, creating it on first use"""
+    loop_semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = loop_semaphores.get(service)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_LIMITS.get(service, AWS_MAX_WORKERS))
+        loop_semaphores[service] = semaphore
+    return semaphore
+
+async def run_blocking(func: Callable[..., Any], *args: Any, service: str = 'aws', **kwargs: Any) -> Any:
+    """Run a blocking boto3 call on the shared AWS executor without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    async with _get_semaphore(service):
+        return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+def shutdown_executor():
+    """Stop accepting work and wait for in-flight AWS calls to finish"""
+    _executor.shutdown(wait=True)
@@ -0,0 +1,106 @@
+"""
+Single-frame vs batched body-language analysis against a fake Bedrock client.
+
+The fake client counts tokens the way Claude bills them (images at
+width*height/750 tokens, text at ~4 chars/token) and sleeps for a modelled
+latency of base + input-token prefill + output-token decode time. Webcam
+frames arrive every --interval seconds per session, like the Mock Interview UI.
+
+Usage (from backend_api/):
+    python benchmarks/body_language_batch_benchmark.py --sessions 8 --frames 12 --batch-size 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from body_language import FRAME_INTERVAL_SECONDS, FrameBatcher, body_language_request_body, parse_body_language  # noqa: E402
+
+IMAGE_TOKENS = 640 * 480 // 750
+FRAME_RESULT = {"strengths": ["Good eye contact"], "improvements": ["Sit up straight"], "actionable_tip": "Sit up straight now",
+                "severity_level": "medium", "eye_contact_score": 7, "posture_score": 5, "engagement_score": 7, "professionalism_score": 7}
+
+
+class FakeBedrock:
+    def __init__(self, time_scale, base_latency=0.6, prefill_per_token=0.0003, decode_per_token=0.02):
+        self.time_scale = time_scale
+        self.base_latency = base_latency
+        self.prefill_per_token = prefill_per_token
+        self.decode_per_token = decode_per_token
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.modelled_seconds = 0.0
+
+    async def invoke(self, request_body):
+        content = request_body['messages'][0]['content']
+        images = sum(1 for block in content if block['type'] == 'image')
+        text_chars = sum(len(block['text']) for block in content if block['type'] == 'text')
+        if images == 1:
+            completion = json.dumps(FRAME_RESULT, indent=2)
+        else:
+            completion = json.dumps({"frames": [FRAME_RESULT] * images}, indent=2)
+        input_tokens = images * IMAGE_TOKENS + text_chars // 4
+        output_tokens = len(completion) // 4
+        latency = self.base_latency + input_tokens * self.prefill_per_token + output_tokens * self.decode_per_token
+
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.modelled_seconds += latency
+        await asyncio.sleep(latency * self.time_scale)
+        return completion
+
+
+async def run(mode, args):
+    bedrock = FakeBedrock(args.time_scale)
+    batcher = FrameBatcher(bedrock.invoke, window=args.window * args.time_scale, max_frames=args.batch_size)
+    latencies = []
+
+    async def analyze(frame):
+        start = time.perf_counter()
+        if mode == 'batched':
+            await batcher.submit(frame)
+        else:
+            parse_body_language(await bedrock.invoke(body_language_request_body(frame)))
+        latencies.append((time.perf_counter() - start) / args.time_scale)
+
+    async def session(session_id):
+        tasks = []
+        for i in range(args.frames):
+            frame = SimpleNamespace(session_id=session_id, image_base64='', timestamp=i * args.interval, question='Tell me about yourself.', user_state='speaking')
+            tasks.append(asyncio.create_task(analyze(frame)))
+            await asyncio.sleep(args.interval * args.time_scale)
+        await asyncio.gather(*tasks)
+
+    await asyncio.gather(*(session(f"session-{s}") for s in range(args.sessions)))
+    frames = args.sessions * args.frames
+    latencies.sort()
+    print(f"{mode:8s} calls={bedrock.calls:4d}  in_tok/frame={bedrock.input_tokens / frames:7.1f}  out_tok/frame={bedrock.output_tokens / frames:6.1f}  "
+          f"bedrock_s/frame={bedrock.modelled_seconds / frames:5.2f}  p50_latency={latencies[len(latencies) // 2]:5.2f}s  "
+          f"p95_latency={latencies[int(len(latencies) * 0.95)]:5.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--frames', type=int, default=12, help='Frames per session')
+    parser.add_argument('--interval', type=float, default=FRAME_INTERVAL_SECONDS, help='Seconds between frames per session')
+    parser.add_argument('--batch-size', type=int, default=4)
+    parser.add_argument('--window', type=float, help='Batch window in seconds (default: spans a full batch at --interval)')
+    parser.add_argument('--time-scale', type=float, default=0.02, help='Multiply all sleeps by this to run faster')
+    args = parser.parse_args()
+    if args.window is None:
+        args.window = args.interval * (args.batch_size - 1) + 1.0
+
+    for mode in ('single', 'batched'):
+        asyncio.run(run(mode, args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Effect of botocore's connection pool size under concurrent load.
+
+Starts a local HTTP server that answers DynamoDB GetItem after --latency
+seconds and counts TCP connections it accepts, then issues --requests
+concurrent calls through aws_executor with the botocore default pool (10)
+and with the aws_clients registry config. When the pool is smaller than the
+number of in-flight calls, botocore opens extra connections and throws them
+away afterwards, so every burst pays connection setup again (TLS in production).
+
+Usage (from backend_api/):
+    python benchmarks/connection_pool_benchmark.py --requests 400 --latency 0.05
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boto3  # noqa: E402
+from botocore.config import Config  # noqa: E402
+
+from aws_clients import client_config  # noqa: E402
+from aws_executor import run_blocking  # noqa: E402
+
+# botocore logs a warning for every discarded connection
+logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
+
+
+class FakeDynamoDB(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.05
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with FakeDynamoDB.lock:
+            FakeDynamoDB.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.latency)
+        body = b'{"Item": {"session_id": {"S": "s"}}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-amz-json-1.0')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def bursts(client, requests, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        await asyncio.gather(*(
+            run_blocking(client.get_item, TableName='InterviewSessions', Key={'session_id': {'S': str(i)}}, service='dynamodb')
+            for i in range(requests)
+        ))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=400, help='Concurrent calls per burst')
+    parser.add_argument('--bursts', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.05, help='Server-side latency per call in seconds')
+    args = parser.parse_args()
+
+    FakeDynamoDB.latency = args.latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeDynamoDB)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+    configs = {
+        'default (10)': Config(),
+        f"registry ({client_config('dynamodb').max_pool_connections})": client_config('dynamodb'),
+    }
+
+    async def run_all():
+        for label, config in configs.items():
+            client = boto3.client('dynamodb', region_name='us-west-2', endpoint_url=endpoint, config=config,
+                                  aws_access_key_id='test', aws_secret_access_key='test')
+            FakeDynamoDB.connections = 0
+            # Semaphores in aws_executor bind to one event loop, so run every burst in this one
+            elapsed = await bursts(client, args.requests, args.bursts)
+            total = args.requests * args.bursts
+            print(f"{label:16s} {total / elapsed:7.1f} calls/s  new connections: {FakeDynamoDB.connections}")
+
+    asyncio.run(run_all())
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Orchestrator dispatch: Lambda-to-Lambda invoke vs in-process handler calls.
+
+Runs interview_orchestrator.invoke_lambda in both DISPATCH_MODEs against
+audio_processor's analyze_speech action (no AWS calls). Remote mode goes
+through a fake Lambda client that serializes the payload and response the
+way the Lambda API does and sleeps --hop-latency per warm invoke; a cold
+start would add far more. process_response makes two hops per answer.
+
+Usage (from backend_api/):
+    python benchmarks/dispatch_benchmark.py --calls 200 --hop-latency 0.03
+"""
+import argparse
+import importlib.util
+import io
+import json
+import os
+import time
+
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                          'backend', 'lambda')
+
+spec = importlib.util.spec_from_file_location('interview_orchestrator_handler',
+                                              os.path.join(LAMBDA_DIR, 'interview_orchestrator', 'handler.py'))
+orchestrator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(orchestrator)
+
+TRANSCRIPT = ("So um in my last internship I was basically asked to migrate our reporting jobs to AWS, "
+              "and like I had never used Lambda before, so I you know read the docs and built a prototype. ") * 6
+
+
+class FakeLambda:
+    """boto3 Lambda client stand-in: JSON over the wire plus a fixed hop latency"""
+    def __init__(self, hop_latency):
+        self.hop_latency = hop_latency
+
+    def invoke(self, FunctionName, InvocationType, Payload):
+        time.sleep(self.hop_latency)
+        result = orchestrator.get_handler(FunctionName)(json.loads(Payload), None)
+        return {'Payload': io.BytesIO(json.dumps(result).encode())}
+
+
+def run(mode, calls):
+    orchestrator.DISPATCH_MODE = mode
+    payload = {'action': 'analyze_speech', 'transcript': TRANSCRIPT, 'duration': 60}
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = orchestrator.invoke_lambda('audio_processor', payload)
+        metrics = json.loads(result['body'])['metrics']
+    return (time.perf_counter() - start) / calls * 1000, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--hop-latency', type=float, default=0.03, help='Seconds per warm Lambda-to-Lambda invoke')
+    args = parser.parse_args()
+
+    fake_lambda = FakeLambda(args.hop_latency)
+    orchestrator.get_client = lambda service_name, kind='client': fake_lambda
+    # Import the sibling handler up front; that's a one-time cost per container in both modes
+    orchestrator.get_handler('audio_processor')
+
+    remote_ms, remote_metrics = run('lambda', args.calls)
+    local_ms, local_metrics = run('inprocess', args.calls)
+    assert remote_metrics == local_metrics
+    print(f"lambda invoke: {remote_ms:7.2f}ms per call ({args.hop_latency * 1000:.0f}ms modelled hop)")
+    print(f"in-process:    {local_ms:7.2f}ms per call")
+    print(f"saved per answer (2 hops): {2 * (remote_ms - local_ms):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
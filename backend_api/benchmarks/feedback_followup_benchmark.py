@@ -0,0 +1,143 @@
+"""
+/get-feedback with request_followup: the three serial round trips it made
+before (feedback call, session read, follow-up call) vs separate calls with
+the cached job context vs one fused feedback + follow-up completion.
+
+Claude and DynamoDB are fakes that sleep for modelled latencies scaled by
+--time-scale: a Claude call costs --claude-latency plus --decode-per-token
+per output token, a DynamoDB read or write costs --dynamodb-latency.
+Importing main needs the API requirements installed; nothing calls AWS.
+
+Every variant is compared with the serial flow get_feedback had before
+fusing. Fusing removes one call's fixed latency and the session read, but
+the fused reply still decodes the whole feedback, plus the JSON keys and
+escapes. When that decode dominates, the saving is small; lower
+--decode-per-token to see it approach half.
+
+Usage (from backend_api/):
+    python benchmarks/feedback_followup_benchmark.py --answers 5
+    python benchmarks/feedback_followup_benchmark.py --decode-per-token 0.002
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dynamodb_service  # noqa: E402
+import interview_generator  # noqa: E402
+import main  # noqa: E402
+
+FEEDBACK = """**Content Analysis:**
+You answered the question with a real example from your internship, but the situation took too long to set up.
+
+**Delivery Assessment:**
+Pace was good at 142 WPM with few filler words.
+
+**Strengths:**
+- Concrete example with a measurable result (failure rate from 20% to under 1%)
+
+**Areas for Improvement:**
+- Spend less time on the situation and more on the actions YOU took
+- Name the trade-offs you considered before choosing Lambda
+
+**Expected Answer:**
+A strong answer would briefly set up the failing jobs, explain the candidate's own decisions and trade-offs, and close with the measured impact and what they learned.
+
+**Score: 7/10**"""
+FOLLOWUP = "What trade-offs did you weigh before moving the reporting jobs to Lambda?"
+FUSED_REPLY = json.dumps({"feedback": FEEDBACK, "score": 7, "expected_answer": "A strong answer would...",
+                          "followup_question": FOLLOWUP}, indent=2)
+
+
+class Fakes:
+    def __init__(self, time_scale, dynamodb_latency, base_latency=0.8, decode_per_token=0.02):
+        self.time_scale = time_scale
+        self.dynamodb_latency = dynamodb_latency
+        self.base_latency = base_latency
+        self.decode_per_token = decode_per_token
+        self.claude_calls = 0
+        self.session_reads = 0
+
+    def claude(self, completion):
+        self.claude_calls += 1
+        time.sleep((self.base_latency + len(completion) // 4 * self.decode_per_token) * self.time_scale)
+        return completion
+
+    def invoke_claude(self, request_body):
+        prompt = request_body['messages'][0]['content']
+        if 'followup_question' in prompt:
+            return self.claude(FUSED_REPLY)
+        return self.claude(FEEDBACK)
+
+    def generate_followup_question(self, question, answer, job_context, model_id=None):
+        return self.claude(FOLLOWUP)
+
+    def get_session(self, session_id):
+        self.session_reads += 1
+        time.sleep(self.dynamodb_latency * self.time_scale)
+        return {'session_id': session_id, 'job_title': 'Backend Engineer', 'job_description': 'Python services on AWS'}
+
+    def add_conversation(self, *args):
+        time.sleep(self.dynamodb_latency * self.time_scale)
+
+
+async def before(req):
+    """get_feedback before fusing: feedback call, conversation write, session read, follow-up call in series"""
+    pace_wpm, pace_assessment = main.assess_pace(req)
+    prompt = main.build_feedback_prompt(req, pace_wpm, pace_assessment)
+    feedback = await main.run_blocking(main.invoke_claude, main.feedback_request_body(prompt), service='bedrock')
+    await dynamodb_service.add_conversation_async(req.session_id, req.question, req.response, feedback, {})
+    session = await dynamodb_service.get_session_async(req.session_id)
+    job_context = f"{session.get('job_title', '')} - {session.get('job_description', '')[:200]}"
+    return await interview_generator.generate_followup_question_async(req.question, req.response, job_context)
+
+
+async def run(args):
+    serial = None
+    for label, fused, handler in (('serial (before)', False, before),
+                                  ('separate calls', False, main.get_feedback),
+                                  ('fused', True, main.get_feedback)):
+        fakes = Fakes(args.time_scale, args.dynamodb_latency, args.claude_latency, args.decode_per_token)
+        main.invoke_claude = fakes.invoke_claude
+        interview_generator.generate_followup_question = fakes.generate_followup_question
+        dynamodb_service.get_session = fakes.get_session
+        dynamodb_service.add_conversation = fakes.add_conversation
+        dynamodb_service._job_contexts.clear()
+        main.FUSED_FEEDBACK_ENABLED = fused
+
+        start = time.perf_counter()
+        for _ in range(args.answers):
+            req = main.FeedbackRequest(session_id='bench', question='Tell me about a time you took ownership.',
+                                       response='In my last internship I migrated our reporting jobs to Lambda...',
+                                       word_count=180, duration=76, request_followup=True)
+            result = await handler(req)
+            assert (result if isinstance(result, str) else result['followup_question']) == FOLLOWUP
+        per_answer = (time.perf_counter() - start) / args.answers / args.time_scale
+        serial = serial or per_answer
+        print(f"{label:16s} {per_answer:5.2f}s per answer (modelled)  {serial / per_answer:4.2f}x vs serial  "
+              f"{fakes.claude_calls / args.answers:.0f} Claude calls, {fakes.session_reads} session reads")
+
+    separate_tokens = len(FEEDBACK) // 4 + len(FOLLOWUP) // 4
+    fused_tokens = len(FUSED_REPLY) // 4
+    print(f"decode: {separate_tokens} output tokens ({separate_tokens * args.decode_per_token:.2f}s) as two replies, "
+          f"{fused_tokens} ({fused_tokens * args.decode_per_token:.2f}s) as one JSON reply with its keys and escapes; "
+          f"fusing saves one {args.claude_latency:.2f}s call overhead and the session read")
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--answers', type=int, default=5, help='Answers per session')
+    parser.add_argument('--dynamodb-latency', type=float, default=0.015)
+    parser.add_argument('--claude-latency', type=float, default=0.8, help='Fixed seconds per Claude call')
+    parser.add_argument('--decode-per-token', type=float, default=0.02, help='Seconds per output token')
+    parser.add_argument('--time-scale', type=float, default=0.05, help='Multiplier on every modelled sleep')
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main_()
@@ -0,0 +1,76 @@
+"""
+Filler-word counting in the audio_processor Lambda: one compiled alternation
+vs the previous regex-per-filler loop.
+
+Generates long synthetic transcripts with a realistic filler density, checks
+both implementations agree, and times them.
+
+Usage (from backend_api/):
+    python benchmarks/filler_words_benchmark.py --words 2000 20000 --runs 20
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+AUDIO_PROCESSOR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                               'backend', 'lambda', 'audio_processor')
+sys.path.insert(0, AUDIO_PROCESSOR)
+
+from handler import FILLER_WORDS, find_fillers  # noqa: E402
+
+VOCABULARY = ("i led the migration of our payment service to kubernetes and we cut deploy time "
+              "from an hour to ten minutes the hardest part was convincing the team that the "
+              "rollback plan would work so we ran game days every sprint").split()
+
+
+def legacy_fillers(transcript):
+    """The per-filler loop analyze_speech_metrics used before"""
+    transcript_lower = transcript.lower()
+    counts = {}
+    for filler in FILLER_WORDS:
+        pattern = r'\b' + re.escape(filler) + r'\b'
+        count = len(re.findall(pattern, transcript_lower))
+        if count > 0:
+            counts[filler] = count
+    return counts
+
+
+def transcript(words, filler_rate=0.06, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(words):
+        out.append(rng.choice(FILLER_WORDS) if rng.random() < filler_rate else rng.choice(VOCABULARY))
+    return ' '.join(out).capitalize() + '.'
+
+
+def best_of(func, arg, runs):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, nargs='+', default=[300, 2000, 20000])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    for words in args.words:
+        text = transcript(words)
+        single_pass = {filler: entry['count'] for filler, entry in find_fillers(text.lower()).items()}
+        assert single_pass == legacy_fillers(text), "implementations disagree"
+
+        legacy_ms = best_of(legacy_fillers, text, args.runs)
+        compiled_ms = best_of(lambda t: find_fillers(t.lower()), text, args.runs)
+        print(f"{words:6d} words ({sum(single_pass.values()):4d} fillers): per-filler regex {legacy_ms:7.3f}ms  "
+              f"single pass {compiled_ms:7.3f}ms  -> {legacy_ms / compiled_ms:4.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Cold-start import cost of the API and the Lambda handlers.
+
+Each target is imported in a fresh interpreter with `python -X importtime`;
+the report shows the median wall time over --runs imports and the modules
+with the largest self time from the last run. Nothing here calls AWS, but
+importing main.py needs the API requirements installed.
+
+Usage (from backend_api/):
+    python benchmarks/import_time_benchmark.py --runs 5 --top 10
+    python benchmarks/import_time_benchmark.py --target audio_processor
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_API = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAMBDA_DIR = os.path.join(os.path.dirname(BACKEND_API), 'backend', 'lambda')
+
+TARGETS = {
+    'api': (BACKEND_API, 'main'),
+    **{name: (os.path.join(LAMBDA_DIR, name), 'handler')
+       for name in ('audio_processor', 'feedback_generator', 'interview_orchestrator', 'resume_analyzer')}
+}
+
+
+def profile(directory, module):
+    """(wall ms, [(self us, cumulative us, module name)]) for one fresh import"""
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=directory,
+                            capture_output=True, text=True, env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'})
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((int(self_us), int(cumulative_us), name.strip()))
+    return float(result.stdout.strip().splitlines()[-1]), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', choices=sorted(TARGETS), action='append', help='Defaults to all targets')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    for target in args.target or TARGETS:
+        directory, module = TARGETS[target]
+        try:
+            runs = [profile(directory, module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{target}: import failed ({e})\n")
+            continue
+        wall = statistics.median(ms for ms, _ in runs)
+        print(f"{target}: import {module} median {wall:.0f}ms over {args.runs} runs")
+        for self_us, cumulative_us, name in sorted(runs[-1][1], reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:7.1f}ms self  {cumulative_us / 1000:7.1f}ms cumulative  {name}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
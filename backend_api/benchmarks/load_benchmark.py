@@ -0,0 +1,123 @@
+"""
+Load benchmark for /start-interview against stubbed Bedrock and DynamoDB.
+
+Compares the old sync handler path (Starlette threadpool, 40 threads) with the
+async path that dispatches boto3 calls through aws_executor.
+
+Usage (from backend_api/):
+    python benchmarks/load_benchmark.py --requests 400 --latency 0.5
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STUB_COMPLETION = json.dumps({
+    "title": "Software Engineer",
+    "skills": ["Python"],
+    "technical_questions": ["How would you design a REST API?", "How do you profile slow code?"],
+    "behavioral_questions": ["Tell me about a time you missed a deadline.", "Describe a conflict on your team.", "Give me an example of learning fast."],
+    "rationale": "stub"
+})
+
+
+class StubBedrock:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def invoke_model(self, **kwargs):
+        time.sleep(self.latency)
+        body = json.dumps({"content": [{"text": STUB_COMPLETION}]}).encode()
+        return {"body": io.BytesIO(body)}
+
+
+class StubTable:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def put_item(self, **kwargs):
+        time.sleep(self.latency)
+
+    def update_item(self, **kwargs):
+        time.sleep(self.latency)
+
+    def get_item(self, **kwargs):
+        time.sleep(self.latency)
+        return {}
+
+
+class StubDynamoDB:
+    def __init__(self, latency):
+        self.table = StubTable(latency)
+
+    def Table(self, name):
+        return self.table
+
+
+def install_stubs(bedrock_latency, dynamodb_latency):
+    import dynamodb_service
+    import interview_generator
+    import main
+    import resume_parser
+
+    bedrock = StubBedrock(bedrock_latency)
+    resume_parser.bedrock_runtime = bedrock
+    interview_generator.bedrock_runtime = bedrock
+    main.bedrock = bedrock
+    dynamodb_service.dynamodb = StubDynamoDB(dynamodb_latency)
+
+
+def blocking_start_interview(req):
+    """The pre-async request path: every AWS call made serially on one worker thread"""
+    from dynamodb_service import create_session, update_session_fields
+    from interview_generator import generate_interview_questions
+    from resume_parser import parse_job_description, parse_resume
+
+    resume_data = parse_resume(req.resume_text)
+    job_data = parse_job_description(req.job_description, req.job_title)
+    questions = generate_interview_questions(resume_data, job_data)
+    session_id = create_session(req.job_title, req.job_description, req.resume_text)
+    update_session_fields(session_id, {'questions': questions})
+    return session_id
+
+
+async def run_sync_mode(req, total):
+    import anyio.to_thread
+    return await asyncio.gather(*(anyio.to_thread.run_sync(blocking_start_interview, req) for _ in range(total)))
+
+
+async def run_async_mode(req, total):
+    from main import start_interview
+    return await asyncio.gather(*(start_interview(req) for _ in range(total)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--latency', type=float, default=0.5, help='Stub Bedrock latency in seconds')
+    parser.add_argument('--dynamodb-latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+    # Measure the uncached Claude request path; repeated identical inputs would otherwise hit the parse cache
+    # and the hybrid resume parser would answer some fields locally
+    os.environ.setdefault('PARSE_CACHE_ENABLED', 'false')
+    os.environ.setdefault('RESUME_PARSER_MODE', 'llm')
+    install_stubs(args.latency, args.dynamodb_latency)
+    from main import InterviewRequest
+    req = InterviewRequest(job_title='Software Engineer', job_description='Build APIs in Python.', resume_text='Jane Doe\nPython developer')
+
+    for name, runner in [('sync (threadpool)', run_sync_mode), ('async (aws_executor)', run_async_mode)]:
+        start = time.perf_counter()
+        asyncio.run(runner(req, args.requests))
+        elapsed = time.perf_counter() - start
+        print(f"{name:22s} {args.requests} requests in {elapsed:6.2f}s -> {args.requests / elapsed:7.1f} req/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Per-frame latency of the local OpenCV body-language scorer.
+
+Pass one or more webcam JPEGs (a face looking at the camera is the common
+case); each is scored --runs times after a warm-up that loads the cascades.
+Compare against the ~2-4s of a Claude vision call for the same frame.
+
+Usage (from backend_api/, requires `pip install opencv-python-headless`):
+    python benchmarks/local_scorer_benchmark.py frame1.jpg frame2.jpg --runs 50
+"""
+import argparse
+import base64
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from local_scorer import LocalScorer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('images', nargs='+', help='JPEG webcam frames')
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    scorer = LocalScorer()
+    if not scorer.available:
+        sys.exit("OpenCV is not installed or LOCAL_SCORER_ENABLED=false")
+
+    for path in args.images:
+        with open(path, 'rb') as f:
+            image_base64 = base64.b64encode(f.read()).decode()
+        detection = scorer.detect(image_base64)
+        scores, reason = scorer.score(detection)
+
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            scorer.score(scorer.detect(image_base64))
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        decision = f"local {scores}" if scores else f"escalate ({reason})"
+        print(f"{os.path.basename(path)}: p50 {statistics.median(timings):.1f}ms  p95 {timings[int(len(timings) * 0.95)]:.1f}ms  -> {decision}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+PDF resume extraction: the old inline /upload-resume loop vs pdf_extraction.
+
+Generates a text PDF of --pages pages (dense resume-like text), then for each
+path measures the request latency and how long the event loop was blocked,
+using a heartbeat task that should tick every 5ms. The inline loop runs
+PyPDF2 on the event loop, so every other request waits for the whole file.
+
+Usage (from backend_api/):
+    python benchmarks/pdf_extraction_benchmark.py --pages 20 --runs 3
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.datastructures import UploadFile  # noqa: E402
+
+from pdf_extraction import PDF_EXTRACT_WORKERS, extract_pdf_text, shutdown_pdf_pool  # noqa: E402
+
+LINES = [
+    "Senior Software Engineer | Acme Corp | San Diego, CA | Jan 2021 - Present",
+    "- Led a team of 6 engineers building a real-time analytics pipeline on AWS Kinesis and Lambda",
+    "- Reduced p99 API latency from 900ms to 120ms by introducing Redis caching and query batching",
+    "- Migrated 40 microservices to Kubernetes with zero downtime using blue/green deployments",
+    "Python, Java, TypeScript, React, Node.js, PostgreSQL, DynamoDB, Docker, Terraform, GraphQL",
+]
+
+
+def make_pdf(pages, lines_per_page=55):
+    """Minimal multi-page PDF with Helvetica text, no dependencies"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        text = ' '.join(
+            f"({LINES[(page + i) % len(LINES)].replace('(', '[').replace(')', ']')}) Tj T*" for i in range(lines_per_page)
+        )
+        stream = f"BT /F1 9 Tf 11 TL 40 800 Td {text} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1'))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+async def inline_extract(upload):
+    """/upload-resume before pdf_extraction: read everything, extract on the event loop"""
+    import PyPDF2
+    content = await upload.read()
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return {"resume_text": text.strip(), "chars": len(text)}
+
+
+async def measure(extract, data):
+    max_gap = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal max_gap
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last - 0.005)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    result = await extract(UploadFile(io.BytesIO(data), filename='resume.pdf'))
+    latency = time.perf_counter() - start
+    running = False
+    await beat
+    return latency * 1000, max_gap * 1000, result['chars']
+
+
+async def run(args):
+    data = make_pdf(args.pages)
+    print(f"{args.pages}-page PDF, {len(data) // 1024}KB, {PDF_EXTRACT_WORKERS} extraction workers, {os.cpu_count()} CPUs")
+    # Start the worker processes so spawn cost isn't counted against the first run
+    await measure(extract_pdf_text, make_pdf(1))
+    for label, extract in (('inline (before)', inline_extract), ('pdf_extraction', extract_pdf_text)):
+        runs = [await measure(extract, data) for _ in range(args.runs)]
+        latency = min(r[0] for r in runs)
+        blocked = max(r[1] for r in runs)
+        print(f"{label:16s} latency {latency:7.1f}ms  longest event-loop stall {blocked:7.1f}ms  ({runs[0][2]} chars)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    finally:
+        shutdown_pdf_pool()
+
+
+if __name__ == '__main__':
+    main()
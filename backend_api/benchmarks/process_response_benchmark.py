@@ -0,0 +1,113 @@
+"""
+Orchestrator process_response: serial stages (before) vs the pipelined
+version, with the whole pipeline running in-process (DISPATCH_MODE=inprocess).
+
+Claude and DynamoDB are fakes that sleep for modelled latencies scaled by
+--time-scale: a Claude call costs base + output-token decode time, a
+DynamoDB read or write costs --dynamodb-latency. The candidate sends a
+transcript, so transcription (S3 + speech-to-text) is not part of either run.
+
+Usage (from backend_api/):
+    python benchmarks/process_response_benchmark.py --followup --runs 3
+"""
+import argparse
+import importlib.util
+import json
+import os
+import time
+
+os.environ['DISPATCH_MODE'] = 'inprocess'
+os.environ.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                          'backend', 'lambda')
+spec = importlib.util.spec_from_file_location('interview_orchestrator_handler',
+                                              os.path.join(LAMBDA_DIR, 'interview_orchestrator', 'handler.py'))
+orchestrator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(orchestrator)
+feedback_generator = orchestrator.get_handler('feedback_generator').__globals__
+
+TRANSCRIPT = ("In my last internship our nightly reporting jobs kept failing, so I um took ownership of the migration, "
+              "rewrote the jobs as Lambda functions and cut the failure rate from 20 percent to under 1 percent. ") * 3
+FEEDBACK = "**Overall Assessment** Strong STAR structure with a quantified result. " * 20
+SESSION = {'session_id': 'bench', 'job_description': 'Backend engineer on AWS', 'resume_text': '',
+           'current_question_index': 1,
+           'current_question': {'question': 'Tell me about a time you took ownership.', 'type': 'behavioral'}}
+
+
+class Fakes:
+    def __init__(self, time_scale, dynamodb_latency, base_latency=0.8, decode_per_token=0.02):
+        self.time_scale = time_scale
+        self.dynamodb_latency = dynamodb_latency
+        self.base_latency = base_latency
+        self.decode_per_token = decode_per_token
+        self.writes = 0
+
+    def claude(self, prompt):
+        completion = "Which part of the migration would you do differently?" if 'follow-up' in prompt else FEEDBACK
+        time.sleep((self.base_latency + len(completion) // 4 * self.decode_per_token) * self.time_scale)
+        return completion
+
+    def Table(self, name):
+        return self
+
+    def get_item(self, Key):
+        time.sleep(self.dynamodb_latency * self.time_scale)
+        return {'Item': SESSION}
+
+    def update_item(self, **kwargs):
+        time.sleep(self.dynamodb_latency * self.time_scale)
+        self.writes += 1
+
+
+def serial(body):
+    """process_response before pipelining: every stage waits for the previous one"""
+    start = time.perf_counter()
+    session = orchestrator.get_client('dynamodb', 'resource').Table(orchestrator.TABLE_NAME).get_item(Key={'session_id': 'bench'})['Item']
+    question = session['current_question']['question']
+    metrics = orchestrator.speech_metrics(body['transcript'], body['duration'])
+    orchestrator.invoke_lambda('feedback_generator', {
+        'action': 'analyze_response', 'session_id': 'bench', 'question': question, 'question_type': 'behavioral',
+        'response_text': body['transcript'], 'metrics': metrics, 'job_description': session['job_description']})
+    if body.get('request_followup'):
+        orchestrator.invoke_lambda('feedback_generator', {
+            'action': 'generate_followup', 'question': question, 'response_text': body['transcript']})
+    return time.perf_counter() - start, None
+
+
+def pipelined(body):
+    start = time.perf_counter()
+    result = json.loads(orchestrator.process_response(body)['body'])
+    return time.perf_counter() - start, result['timings_ms']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--followup', action='store_true', help='Ask for a follow-up question too')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--dynamodb-latency', type=float, default=0.015)
+    parser.add_argument('--time-scale', type=float, default=0.1, help='Multiplier on every modelled sleep')
+    args = parser.parse_args()
+
+    fakes = Fakes(args.time_scale, args.dynamodb_latency)
+    feedback_generator['call_claude'] = fakes.claude
+    # Both handlers only use DynamoDB here (Claude goes through call_claude)
+    feedback_generator['get_client'] = lambda service_name, kind='client': fakes
+    orchestrator.get_client = lambda service_name, kind='client': fakes
+
+    body = {'session_id': 'bench', 'transcript': TRANSCRIPT, 'duration': 45, 'request_followup': args.followup}
+    for label, run in (('serial (before)', serial), ('pipelined', pipelined)):
+        results = [run(body) for _ in range(args.runs)]
+        elapsed = min(seconds for seconds, _ in results) / args.time_scale
+        print(f"{label:16s} {elapsed:5.2f}s modelled")
+        timings = results[-1][1]
+        if timings:
+            for stage, timing in timings.items():
+                print(f"    {stage:15s} start {timing['start_ms'] / args.time_scale / 1000:5.2f}s  "
+                      f"took {timing['duration_ms'] / args.time_scale / 1000:5.2f}s")
+    orchestrator.get_background_pool().shutdown(wait=True)
+    print(f"responses saved: {fakes.writes} of {2 * args.runs}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Session-start question generation in the interview orchestrator: one
+generate_question Lambda call per competency in series (before) vs the
+concurrent per-competency fallback vs one batched generate_questions call.
+
+The orchestrator and feedback generator handlers run in-process; each
+Lambda hop sleeps --hop-latency seconds and the fake Claude sleeps for a
+modelled base + output-token decode time, all scaled by --time-scale.
+
+Usage (from backend_api/):
+    python benchmarks/question_generation_benchmark.py --competencies 2 5
+"""
+import argparse
+import importlib.util
+import json
+import os
+import threading
+import time
+
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                          'backend', 'lambda')
+
+
+def load_handler(name):
+    spec = importlib.util.spec_from_file_location(f"{name}_handler", os.path.join(LAMBDA_DIR, name, 'handler.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+orchestrator = load_handler('interview_orchestrator')
+feedback_generator = load_handler('feedback_generator')
+
+
+class FakeClaude:
+    def __init__(self, time_scale, base_latency=0.8, decode_per_token=0.02):
+        self.time_scale = time_scale
+        self.base_latency = base_latency
+        self.decode_per_token = decode_per_token
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt):
+        line = next(line for line in prompt.splitlines() if line.startswith('COMPETENC'))
+        competencies = [c.strip() for c in line.split(':', 1)[1].split(',')]
+        questions = {c: f"Tell me about a time your {c.replace('_', ' ')} changed the outcome of a project." for c in competencies}
+        completion = json.dumps(questions, indent=2) if line.startswith('COMPETENCIES') else questions[competencies[0]]
+        with self.lock:
+            self.calls += 1
+        time.sleep((self.base_latency + len(completion) // 4 * self.decode_per_token) * self.time_scale)
+        return completion
+
+
+def make_invoke(hop_latency, time_scale):
+    def invoke_lambda(function_name, payload):
+        time.sleep(hop_latency * time_scale)
+        return feedback_generator.lambda_handler(payload, None)
+    return invoke_lambda
+
+
+def sequential(competencies, job_title, job_description):
+    """build_question_list's behavioral loop before batching"""
+    questions = {}
+    for comp in competencies:
+        result = orchestrator.invoke_lambda('feedback_generator', {
+            'action': 'generate_question', 'job_description': job_description, 'job_title': job_title,
+            'question_type': 'behavioral', 'competency': comp
+        })
+        questions[comp] = json.loads(result['body']).get('question')
+    return questions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--competencies', type=int, nargs='+', default=[2, 5])
+    parser.add_argument('--hop-latency', type=float, default=0.05, help='Seconds per warm Lambda-to-Lambda invoke')
+    parser.add_argument('--time-scale', type=float, default=0.1, help='Multiplier on every modelled sleep')
+    args = parser.parse_args()
+
+    # Client creation is a cold-start cost, not part of any one strategy
+    orchestrator.get_client('lambda')
+    job_title, job_description = 'Backend Engineer', 'Build and operate Python services on AWS.'
+    for count in args.competencies:
+        competencies = orchestrator.BEHAVIORAL_COMPETENCIES[:count]
+        for label, batch_enabled, run in (
+                ('sequential (before)', False, sequential),
+                ('fan-out (no batch)', False, orchestrator.generate_questions),
+                ('batched', True, orchestrator.generate_questions)):
+            claude = FakeClaude(args.time_scale)
+            feedback_generator.call_claude = claude
+            orchestrator.QUESTION_BATCH_ENABLED = batch_enabled
+            orchestrator.invoke_lambda = make_invoke(args.hop_latency, args.time_scale)
+            start = time.perf_counter()
+            if run is sequential:
+                questions = run(competencies, job_title, job_description)
+            else:
+                questions = run(competencies, 'behavioral', job_title, job_description)
+            elapsed = (time.perf_counter() - start) / args.time_scale
+            assert all(questions.get(c) for c in competencies)
+            print(f"{count} competencies {label:20s} {elapsed:5.2f}s modelled  {claude.calls} Claude calls")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Section parsing in the resume_analyzer Lambda: the precompiled single-pass
+parse_resume_content vs the per-line keyword-list loop it replaced.
+
+Builds synthetic multi-page resumes of about --size characters (the
+endpoint's 50KB limit by default), checks both parsers agree on the
+sections they share, and times single resumes and a batch.
+
+Usage (from backend_api/):
+    python benchmarks/resume_sections_benchmark.py --size 50000 --batch 25
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+RESUME_ANALYZER = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                               'backend', 'lambda', 'resume_analyzer')
+sys.path.insert(0, RESUME_ANALYZER)
+
+from handler import parse_resume_batch, parse_resume_content  # noqa: E402
+
+HEADERS = ['EDUCATION', 'Work Experience', 'Technical Skills', 'Employment History', 'Core Competencies']
+BULLETS = [
+    "- Led a team of 6 engineers building a real-time analytics pipeline on AWS Kinesis and Lambda",
+    "- Reduced p99 API latency from 900ms to 120ms by introducing Redis caching and query batching",
+    "- Migrated 40 microservices to Kubernetes with zero downtime using blue/green deployments",
+    "B.S. Computer Science, San Diego State University, GPA 3.8/4.0, 2016 - 2020",
+    "Python, Java, TypeScript, React, Node.js, PostgreSQL, DynamoDB, Docker, Terraform",
+    "Senior Software Engineer | Acme Corp | San Diego, CA | Jan 2021 - Present",
+]
+
+
+def legacy_parse(text):
+    """parse_resume_content as it was before the single-pass rewrite"""
+    sections = {'education': [], 'experience': [], 'skills': [], 'contact': {}}
+    current_section = None
+    education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
+    experience_keywords = ['experience', 'employment', 'work history', 'professional', 'career']
+    skills_keywords = ['skills', 'technical skills', 'competencies', 'expertise', 'technologies']
+    for line in text.split('\n'):
+        line_stripped = line.strip()
+        line_lower = line_stripped.lower()
+        if not line_stripped:
+            continue
+        if any(keyword in line_lower for keyword in education_keywords) and len(line_stripped) < 50:
+            current_section = 'education'
+            continue
+        elif any(keyword in line_lower for keyword in experience_keywords) and len(line_stripped) < 50:
+            current_section = 'experience'
+            continue
+        elif any(keyword in line_lower for keyword in skills_keywords) and len(line_stripped) < 50:
+            current_section = 'skills'
+            continue
+        if current_section and line_stripped:
+            sections[current_section].append(line_stripped)
+        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', line)
+        if email_match:
+            sections['contact']['email'] = email_match.group()
+        phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', line)
+        if phone_match:
+            sections['contact']['phone'] = phone_match.group()
+    return sections
+
+
+def resume(size, seed=0):
+    rng = random.Random(seed)
+    lines = ["Jordan Lee", "jordan.lee@example.com | (619) 555-0142 | San Diego, CA", ""]
+    while sum(len(line) + 1 for line in lines) < size:
+        lines.append(rng.choice(HEADERS))
+        lines.extend(rng.choice(BULLETS) for _ in range(rng.randint(4, 12)))
+        lines.append("")
+    return '\n'.join(lines)[:size]
+
+
+def best_of(func, runs):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=50000, help='Resume size in characters')
+    parser.add_argument('--batch', type=int, default=25)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    texts = [resume(args.size, seed) for seed in range(args.batch)]
+    for text in texts:
+        new, old = parse_resume_content(text), legacy_parse(text)
+        assert all(new[key] == old[key] for key in old), "parsers disagree"
+
+    legacy_ms = best_of(lambda: legacy_parse(texts[0]), args.runs)
+    single_ms = best_of(lambda: parse_resume_content(texts[0]), args.runs)
+    print(f"one {args.size // 1000}KB resume:   keyword loop {legacy_ms:7.2f}ms  single pass {single_ms:7.2f}ms  -> {legacy_ms / single_ms:.1f}x")
+
+    legacy_ms = best_of(lambda: [legacy_parse(text) for text in texts], max(1, args.runs // 5))
+    batch_ms = best_of(lambda: parse_resume_batch(texts), max(1, args.runs // 5))
+    print(f"batch of {args.batch:3d}:        keyword loop {legacy_ms:7.2f}ms  single pass {batch_ms:7.2f}ms  -> {legacy_ms / batch_ms:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Parsing Claude's JSON replies: the per-call-site parsers this replaced vs
+structured_output.
+
+Builds completions in the shapes Claude actually returns (clean JSON, a
+prose preamble, a ```json fence, trailing commentary, nested objects, a
+prefilled reply missing its opening brace, truncated output) for the body
+language, resume and question schemas. Reports how many each parser
+recovers and the time per parse.
+
+Usage (from backend_api/):
+    python benchmarks/structured_output_benchmark.py --runs 2000
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structured_output import parse_completion  # noqa: E402
+
+BODY_LANGUAGE = {"strengths": ["Good eye contact"], "improvements": ["Sit up straight"], "actionable_tip": "Sit up straight now",
+                 "severity_level": "medium", "eye_contact_score": 7, "posture_score": 5, "engagement_score": 7,
+                 "professionalism_score": 7}
+RESUME = {"name": "Jordan Lee", "skills": ["Python", "AWS", "React"], "soft_skills": ["Leadership"],
+          "experience": [{"company": "Acme", "position": "Software Engineer", "duration": "2021 - Present",
+                          "responsibilities": ["Built {templated} report pipelines", "Cut p99 latency by 80%"]}],
+          "projects": [], "education": [{"degree": "B.S. Computer Science", "institution": "SDSU", "year": "2021"}]}
+QUESTIONS = {"technical_questions": ["How would you design an idempotent Lambda consumer?"],
+             "behavioral_questions": ["Tell me about a time you disagreed with a teammate."], "rationale": "Mix of both"}
+
+
+def shapes(data):
+    text = json.dumps(data, indent=2)
+    return {
+        'clean': text,
+        'preamble': f"Here is my analysis of the frame:\n\n{text}",
+        'fenced': f"```json\n{text}\n```",
+        'trailing': f"{text}\n\nNote: scores are approximate {{see rubric}}.",
+        'prefilled': text[1:],
+        'truncated': text[:len(text) // 2],
+    }
+
+
+def old_body_language(text):
+    """analyze_body_language before: first brace to the first closing brace"""
+    match = re.search(r'\{[^}]+\}', text, re.DOTALL)
+    return json.loads(match.group()) if match else None
+
+
+def old_greedy(text):
+    """resume_parser / interview_generator before: json.loads, then a greedy {.*} fallback"""
+    try:
+        return json.loads(text.strip())
+    except json.JSONDecodeError:
+        match = re.search(r'\{.*\}', text, re.DOTALL)
+        return json.loads(match.group()) if match else None
+
+
+def recovered(parser, text, expected):
+    try:
+        return parser(text) == expected
+    except (json.JSONDecodeError, ValueError):
+        return False
+
+
+def time_parser(parser, texts, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        for text in texts:
+            try:
+                parser(text)
+            except (json.JSONDecodeError, ValueError):
+                pass
+    return (time.perf_counter() - start) / (runs * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=2000)
+    args = parser.parse_args()
+
+    for label, data, old in (('body language', BODY_LANGUAGE, old_body_language),
+                             ('resume', RESUME, old_greedy),
+                             ('questions', QUESTIONS, old_greedy)):
+        cases = shapes(data)
+        old_ok = [name for name, text in cases.items() if recovered(old, text, data)]
+        new_ok = [name for name, text in cases.items() if recovered(parse_completion, text, data)]
+        print(f"{label}: old parser recovers {len(old_ok)}/{len(cases)} {old_ok}")
+        print(f"{' ' * len(label)}  structured_output  {len(new_ok)}/{len(cases)} {new_ok}")
+        texts = [cases[name] for name in cases if name in old_ok and name in new_ok]
+        print(f"{' ' * len(label)}  per parse (shapes both handle): old {time_parser(old, texts, args.runs):6.1f}us  "
+              f"new {time_parser(parse_completion, texts, args.runs):6.1f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Real-time factor of the local faster-whisper engine on CPU.
+
+RTF = decode time / audio duration; below 1.0 is faster than real time.
+Pass a real recorded answer for representative numbers. Without --audio a
+synthetic 2-minute clip is generated (VAD is disabled so it is fully decoded).
+
+Usage (from backend_api/, requires `pip install faster-whisper`):
+    python benchmarks/stt_benchmark.py --audio answer.wav --model base.en
+"""
+import argparse
+import math
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_answer(path, seconds=120, rate=16000):
+    """Voiced-sounding tones with syllable-rate amplitude modulation plus noise"""
+    rng = random.Random(0)
+    with wave.open(path, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        frames = bytearray()
+        for i in range(seconds * rate):
+            t = i / rate
+            envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 4 * t)
+            sample = envelope * (0.4 * math.sin(2 * math.pi * 180 * t) + 0.2 * math.sin(2 * math.pi * 360 * t)) + 0.05 * rng.uniform(-1, 1)
+            frames += struct.pack('<h', int(max(-1.0, min(1.0, sample)) * 32767))
+        out.writeframes(bytes(frames))
+
+
+def audio_duration(path):
+    with wave.open(path, 'rb') as audio:
+        return audio.getnframes() / audio.getframerate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--audio', help='16-bit PCM WAV file; defaults to a synthetic 2-minute clip')
+    parser.add_argument('--model', default='base.en')
+    parser.add_argument('--compute-type', default='int8')
+    parser.add_argument('--threads', type=int, default=0)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    from speech_to_text import FasterWhisperEngine
+
+    path = args.audio
+    if not path:
+        path = os.path.join(tempfile.mkdtemp(), 'synthetic_answer.wav')
+        synthetic_answer(path)
+    duration = audio_duration(path)
+
+    engine = FasterWhisperEngine(model_size=args.model, compute_type=args.compute_type,
+                                 cpu_threads=args.threads, vad_filter=bool(args.audio))
+    start = time.perf_counter()
+    engine.load()
+    print(f"model load: {time.perf_counter() - start:.2f}s ({args.model}, {args.compute_type})")
+
+    for run in range(args.runs):
+        first_partial = []
+        start = time.perf_counter()
+        transcript = engine.transcribe_blocking(path, on_partial=lambda text: first_partial or first_partial.append(time.perf_counter() - start))
+        elapsed = time.perf_counter() - start
+        first = f"{first_partial[0]:.2f}s" if first_partial else 'n/a'
+        print(f"run {run + 1}: {duration:.0f}s audio decoded in {elapsed:.2f}s -> RTF {elapsed / duration:.3f}, "
+              f"first partial after {first}, {len(transcript.split())} words")
+
+
+if __name__ == '__main__':
+    main()
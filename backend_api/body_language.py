@@ -0,0 +1,199 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from structured_output import conform, json_messages, parse_completion
+
+# Buffer frames per session and analyze them in one multimodal Bedrock call
+BATCH_ENABLED = os.getenv('BODY_LANGUAGE_BATCH_ENABLED', 'false').lower() == 'true'
+BATCH_MAX_FRAMES = int(os.getenv('BODY_LANGUAGE_BATCH_MAX_FRAMES', '4'))
+# Seconds between webcam captures per session (the setInterval in MockInterview.tsx)
+FRAME_INTERVAL_SECONDS = float(os.getenv('BODY_LANGUAGE_FRAME_INTERVAL', '5.0'))
+# Longest a frame waits for others to join its batch. Batches only form per session, so the window must
+# span the capture interval; the default lets a full batch arrive (plus 1s of network jitter), which
+# delays the first frame's feedback by up to that long
+BATCH_WINDOW_SECONDS = float(os.getenv('BODY_LANGUAGE_BATCH_WINDOW', str(FRAME_INTERVAL_SECONDS * (BATCH_MAX_FRAMES - 1) + 1.0)))
+
+DEFAULT_BODY_LANGUAGE_FEEDBACK = {
+    "strengths": ["Maintaining presence"],
+    "improvements": ["Continue monitoring posture"],
+    "actionable_tip": "Keep engaging with the camera",
+    "severity_level": "low",
+    "eye_contact_score": 7,
+    "posture_score": 7,
+    "engagement_score": 7,
+    "professionalism_score": 7
+}
+BODY_LANGUAGE_SCHEMA = {
+    "strengths": [str],
+    "improvements": [str],
+    "actionable_tip": str,
+    "severity_level": str,
+    "eye_contact_score": int,
+    "posture_score": int,
+    "engagement_score": int,
+    "professionalism_score": int
+}
+
+BODY_LANGUAGE_RULES = """BE HONEST AND STRICT:
+- Multiple people in frame = HIGH severity ("Only one person should be visible")
+- Looking away from camera = MEDIUM/HIGH severity ("Look directly at the camera")
+- Slouched posture = MEDIUM severity ("Sit up straight")
+- Fidgeting, head shaking = MEDIUM severity ("Stay still and composed")
+- Distracted/bored expression = MEDIUM severity ("Show engagement and interest")
+- Unprofessional background = MEDIUM severity ("Use a clean, professional background")
+- Poor lighting = LOW severity ("Improve lighting on your face")
+
+SCORING (be strict):
+- 0-4: Major issues (multiple people, looking away, slouched)
+- 5-6: Noticeable issues (occasional poor posture, some fidgeting)
+- 7-8: Good but minor improvements needed
+- 9-10: Excellent professional presence"""
+
+FRAME_JSON_FORMAT = """{
+  "strengths": ["brief strength if any"],
+  "improvements": ["specific issue"],
+  "actionable_tip": "IMMEDIATE action to take NOW",
+  "severity_level": "low/medium/high",
+  "eye_contact_score": 0-10,
+  "posture_score": 0-10,
+  "engagement_score": 0-10,
+  "professionalism_score": 0-10
+}"""
+
+def body_language_prompt(timestamp: float, question: str, user_state: str) -> str:
+    return f"""You are a BRUTALLY HONEST body language coach analyzing a mock interview.
+
+Analyze this frame at {timestamp:.0f} seconds:
+Question: '{question}'
+User state: {user_state}
+
+{BODY_LANGUAGE_RULES}
+
+Respond in JSON format:
+{FRAME_JSON_FORMAT}
+
+Be BRUTALLY HONEST. Set severity to HIGH for serious issues. Don't be lenient."""
+
+def image_block(image_base64: str) -> Dict[str, Any]:
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": "image/jpeg",
+            "data": image_base64
+        }
+    }
+
+def body_language_request_body(frame) -> Dict[str, Any]:
+    """Single-frame request; frame is a BodyLanguageRequest"""
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 800,
+        "temperature": 0.5,
+        "messages": json_messages([
+            image_block(frame.image_base64),
+            {
+                "type": "text",
+                "text": body_language_prompt(frame.timestamp, frame.question, frame.user_state)
+            }
+        ])
+    }
+
+def batch_request_body(frames: List[Any]) -> Dict[str, Any]:
+    """One request covering several frames of the same session, labelled in order"""
+    content = []
+    for i, frame in enumerate(frames, 1):
+        content.append({"type": "text", "text": f"Frame {i} at {frame.timestamp:.0f} seconds (user state: {frame.user_state}):"})
+        content.append(image_block(frame.image_base64))
+    content.append({"type": "text", "text": f"""You are a BRUTALLY HONEST body language coach analyzing a mock interview.
+
+Analyze each of the {len(frames)} frames above independently.
+Question: '{frames[-1].question}'
+
+{BODY_LANGUAGE_RULES}
+
+Respond in JSON format with exactly one entry per frame, in frame order:
+{{"frames": [
+{FRAME_JSON_FORMAT}
+]}}
+
+Be BRUTALLY HONEST. Set severity to HIGH for serious issues. Don't be lenient."""})
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 300 * len(frames) + 200,
+        "temperature": 0.5,
+        "messages": json_messages(content)
+    }
+
+def parse_body_language(feedback_text: str) -> Optional[Dict[str, Any]]:
+    """Parse the JSON object from Claude's response, or None if there isn't one"""
+    data = parse_completion(feedback_text)
+    if data is None:
+        return None
+    return conform(data, BODY_LANGUAGE_SCHEMA, DEFAULT_BODY_LANGUAGE_FEEDBACK)
+
+def parse_batch(feedback_text: str, frame_count: int) -> List[Dict[str, Any]]:
+    """Per-frame results from a batch response; frames Claude skipped get the default feedback"""
+    data = parse_completion(feedback_text) or {}
+    results = data.get('frames') if isinstance(data.get('frames'), list) else []
+    results = [conform(r, BODY_LANGUAGE_SCHEMA, DEFAULT_BODY_LANGUAGE_FEEDBACK) for r in results if isinstance(r, dict)][:frame_count]
+    return results + [dict(DEFAULT_BODY_LANGUAGE_FEEDBACK) for _ in range(frame_count - len(results))]
+
+class FrameBatcher:
+    """Collects frames per session and analyzes each batch with a single Bedrock call"""
+
+    def __init__(self, invoke: Callable[[Dict[str, Any]], Awaitable[str]],
+                 window: float = BATCH_WINDOW_SECONDS, max_frames: int = BATCH_MAX_FRAMES):
+        self.invoke = invoke
+        self.window = window
+        self.max_frames = max_frames
+        self._pending: Dict[str, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks = set()
+        self._stats = {'batches': 0, 'frames': 0}
+
+    async def submit(self, frame) -> Dict[str, Any]:
+        """Queue a frame and wait for its result from the batch it ends up in"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(frame.session_id, [])
+        pending.append((frame, future))
+        if len(pending) >= self.max_frames:
+            self._flush(frame.session_id)
+        elif len(pending) == 1:
+            self._timers[frame.session_id] = loop.call_later(self.window, self._flush, frame.session_id)
+        return await future
+
+    def _flush(self, session_id: str):
+        timer = self._timers.pop(session_id, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(session_id, [])
+        if batch:
+            task = asyncio.create_task(self._analyze(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _analyze(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self._stats['batches'] += 1
+        self._stats['frames'] += len(batch)
+        try:
+            if len(batch) == 1:
+                results = [parse_body_language(await self.invoke(body_language_request_body(batch[0][0]))) or dict(DEFAULT_BODY_LANGUAGE_FEEDBACK)]
+            else:
+                results = parse_batch(await self.invoke(batch_request_body([frame for frame, _ in batch])), len(batch))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            'avg_batch_size': round(self._stats['frames'] / self._stats['batches'], 2) if self._stats['batches'] else 0.0
+        }
@@ -1,22 +1,42 @@
-import boto3
+import os
+import secrets
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, Any, List
 import uuid
+from aws_executor import run_blocking
+from aws_clients import lazy_resource
 
-dynamodb = boto3.resource('dynamodb', region_name='us-west-2')
+dynamodb = lazy_resource('dynamodb')
 TABLE_NAME = 'InterviewSessions'
+# One item per analyzed webcam frame: session_id partition key, server-generated frame_id sort key.
+# The client's timestamp is a plain attribute - frames sent with the same timestamp (retries, a second
+# tab, a stale clock) must not overwrite each other
+BODY_LANGUAGE_TABLE_NAME = os.getenv('BODY_LANGUAGE_TABLE', 'InterviewBodyLanguageFrames')
+BODY_LANGUAGE_KEY_SCHEMA = [{'AttributeName': 'session_id', 'KeyType': 'HASH'}, {'AttributeName': 'frame_id', 'KeyType': 'RANGE'}]
+BODY_LANGUAGE_ATTRIBUTES = [{'AttributeName': 'session_id', 'AttributeType': 'S'}, {'AttributeName': 'frame_id', 'AttributeType': 'N'}]
+# Running aggregates live in a summary item at a sort key no real frame can have
+SUMMARY_FRAME_ID = -1
+BODY_LANGUAGE_SCORES = ['eye_contact_score', 'posture_score', 'engagement_score', 'professionalism_score']
+# Distinct strength/improvement phrases counted per session; new phrases beyond this are ignored
+MAX_TRACKED_PHRASES = int(os.getenv('BODY_LANGUAGE_MAX_TRACKED_PHRASES', '100'))
+# Critical moments kept on the summary item; the most recent ones win once a session has more
+MAX_CRITICAL_MOMENTS = int(os.getenv('BODY_LANGUAGE_MAX_CRITICAL_MOMENTS', '50'))
+# Job title/description never change after create_session, so follow-up prompts can reuse them without a read
+JOB_CONTEXT_CACHE_SIZE = int(os.getenv('JOB_CONTEXT_CACHE_SIZE', '1000'))
 
-def create_table_if_not_exists():
-    """Create DynamoDB table if it doesn't exist"""
+_job_contexts: 'OrderedDict[str, str]' = OrderedDict()
+_job_contexts_lock = threading.Lock()
+
+def _create_table(table_name: str, key_schema: List[Dict[str, str]], attribute_definitions: List[Dict[str, str]]) -> bool:
     try:
         table = dynamodb.create_table(
-            TableName=TABLE_NAME,
-            KeySchema=[
-                {'AttributeName': 'session_id', 'KeyType': 'HASH'},
-            ],
-            AttributeDefinitions=[
-                {'AttributeName': 'session_id', 'AttributeType': 'S'},
-            ],
+            TableName=table_name,
+            KeySchema=key_schema,
+            AttributeDefinitions=attribute_definitions,
             BillingMode='PAY_PER_REQUEST'
         )
         table.wait_until_exists()
@@ -24,9 +44,23 @@ def create_table_if_not_exists():
     except dynamodb.meta.client.exceptions.ResourceInUseException:
         return True
     except Exception as e:
-        print(f"Error creating table: {e}")
+        print(f"Error creating table {table_name}: {e}")
         return False
 
+def create_table_if_not_exists():
+    """Create DynamoDB tables if they don't exist"""
+    sessions_ready = _create_table(
+        TABLE_NAME,
+        [{'AttributeName': 'session_id', 'KeyType': 'HASH'}],
+        [{'AttributeName': 'session_id', 'AttributeType': 'S'}]
+    )
+    frames_ready = _create_table(
+        BODY_LANGUAGE_TABLE_NAME,
+        BODY_LANGUAGE_KEY_SCHEMA,
+        BODY_LANGUAGE_ATTRIBUTES
+    )
+    return sessions_ready and frames_ready
+
 def create_session(job_title: str, job_description: str, resume_text: str) -> str:
     """Create a new interview session"""
     table = dynamodb.Table(TABLE_NAME)
@@ -42,47 +76,42 @@ def create_session(job_title: str, job_description: str, resume_text: str) -> st
         'status': 'active'
     })
     
+    _remember_job_context(session_id, job_context(job_title, job_description))
     return session_id
 
 def add_conversation(session_id: str, question: str, answer: str, feedback: str, metrics: Dict[str, Any]):
     """Add a conversation turn to the session"""
     try:
         table = dynamodb.Table(TABLE_NAME)
+        now = datetime.utcnow().isoformat()
         
         conversation = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now,
             'question': question,
             'answer': answer,
             'feedback': feedback,
             'metrics': metrics
         }
         
-        response = table.get_item(Key={'session_id': session_id})
-        item = response.get('Item', {})
-        
-        if not item:
-            print(f"Warning: Session {session_id} not found, creating minimal session")
-            # Create minimal session if it doesn't exist
-            table.put_item(Item={
-                'session_id': session_id,
-                'conversations': [conversation],
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat(),
-                'status': 'active'
-            })
-            return
-        
-        conversations = item.get('conversations', [])
-        conversations.append(conversation)
-        
-        table.update_item(
+        # Single atomic append; creates a minimal session if it doesn't exist yet
+        response = table.update_item(
             Key={'session_id': session_id},
-            UpdateExpression='SET conversations = :c, updated_at = :u',
+            UpdateExpression=(
+                'SET conversations = list_append(if_not_exists(conversations, :empty_list), :c), '
+                'updated_at = :u, created_at = if_not_exists(created_at, :u), #status = if_not_exists(#status, :active)'
+            ),
+            ExpressionAttributeNames={'#status': 'status'},
             ExpressionAttributeValues={
-                ':c': conversations,
-                ':u': datetime.utcnow().isoformat()
-            }
+                ':c': [conversation],
+                ':empty_list': [],
+                ':u': now,
+                ':active': 'active'
+            },
+            ReturnValues='UPDATED_OLD'
         )
+        
+        if 'conversations' not in response.get('Attributes', {}):
+            print(f"Warning: Session {session_id} not found, created minimal session")
     except Exception as e:
         print(f"Error adding conversation: {e}")
         raise
@@ -93,6 +122,30 @@ def get_session(session_id: str) -> Dict[str, Any]:
     response = table.get_item(Key={'session_id': session_id})
     return response.get('Item', {})
 
+def job_context(job_title: str, job_description: str) -> str:
+    return f"{job_title} - {job_description[:200]}"
+
+def _remember_job_context(session_id: str, context: str):
+    with _job_contexts_lock:
+        _job_contexts[session_id] = context
+        _job_contexts.move_to_end(session_id)
+        if len(_job_contexts) > JOB_CONTEXT_CACHE_SIZE:
+            _job_contexts.popitem(last=False)
+
+def get_job_context(session_id: str) -> str:
+    """Job title and description summary for a session, read from DynamoDB only on a cache miss"""
+    with _job_contexts_lock:
+        context = _job_contexts.get(session_id)
+        if context is not None:
+            _job_contexts.move_to_end(session_id)
+            return context
+    
+    session = get_session(session_id)
+    context = job_context(session.get('job_title', ''), session.get('job_description', ''))
+    if session:
+        _remember_job_context(session_id, context)
+    return context
+
 def complete_session(session_id: str):
     """Mark session as complete"""
     table = dynamodb.Table(TABLE_NAME)
@@ -106,7 +159,178 @@ def complete_session(session_id: str):
         }
     )
 
+def update_session_fields(session_id: str, fields: Dict[str, Any]):
+    """Set top-level attributes on an existing session"""
+    table = dynamodb.Table(TABLE_NAME)
+    names = {f'#f{i}': name for i, name in enumerate(fields)}
+    values = {f':v{i}': value for i, value in enumerate(fields.values())}
+    table.update_item(
+        Key={'session_id': session_id},
+        UpdateExpression='SET ' + ', '.join(f'#f{i} = :v{i}' for i in range(len(fields))),
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values
+    )
+
+def new_frame_id() -> int:
+    """Unique, roughly arrival-ordered sort key: epoch nanoseconds with random low digits for same-tick writes"""
+    return time.time_ns() * 1000 + secrets.randbelow(1000)
+
+def put_body_language_frame(session_id: str, frame: Dict[str, Any]):
+    """Store one analyzed frame as its own item; frame must include a Decimal 'timestamp'"""
+    table = dynamodb.Table(BODY_LANGUAGE_TABLE_NAME)
+    table.put_item(Item={'session_id': session_id, 'frame_id': new_frame_id(), **frame})
+
+def get_body_language_frames(session_id: str) -> List[Dict[str, Any]]:
+    """Get all analyzed frames for a session in timestamp order"""
+    from boto3.dynamodb.conditions import Key
+    table = dynamodb.Table(BODY_LANGUAGE_TABLE_NAME)
+    query_args = {'KeyConditionExpression': Key('session_id').eq(session_id) & Key('frame_id').gte(0)}
+    frames = []
+    while True:
+        response = table.query(**query_args)
+        frames.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return sorted(frames, key=lambda frame: (frame['timestamp'], frame['frame_id']))
+        query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def is_critical(feedback: Dict[str, Any]) -> bool:
+    return feedback.get('severity_level') in ['high', 'medium']
+
+def _summary_update(session_id: str, frame: Dict[str, Any], phrase_counts: Dict[str, Counter]) -> Dict[str, Any]:
+    feedback = frame['feedback']
+    names = {}
+    values = {':one': 1}
+    adds = ['frame_count :one']
+    conditions = []
+    for score in BODY_LANGUAGE_SCORES:
+        adds.append(f'{score}_sum :{score}')
+        values[f':{score}'] = Decimal(str(feedback.get(score, 0)))
+    
+    for attribute, counts in phrase_counts.items():
+        if counts:
+            conditions.append(f'attribute_exists({attribute})')
+        for i, (phrase, count) in enumerate(counts.items()):
+            name, value = f'#{attribute}{i}', f':{attribute}{i}'
+            names[name] = phrase
+            values[value] = count
+            adds.append(f'{attribute}.{name} {value}')
+            conditions.append(f'(attribute_exists({attribute}.{name}) OR size({attribute}) < :max_phrases)')
+    if conditions:
+        values[':max_phrases'] = MAX_TRACKED_PHRASES
+    
+    critical = is_critical(feedback)
+    if critical:
+        # Numbers the moment; update_body_language_summary then writes it into its ring slot
+        adds.append('critical_moment_count :one')
+    update_expression = 'ADD ' + ', '.join(adds)
+    if critical:
+        update_expression += ' SET critical_moments = if_not_exists(critical_moments, :empty_map)'
+        values[':empty_map'] = {}
+    
+    args = {
+        'Key': {'session_id': session_id, 'frame_id': SUMMARY_FRAME_ID},
+        'UpdateExpression': update_expression,
+        'ExpressionAttributeValues': values
+    }
+    if critical:
+        args['ReturnValues'] = 'UPDATED_NEW'
+    if names:
+        args['ExpressionAttributeNames'] = names
+    if conditions:
+        args['ConditionExpression'] = ' AND '.join(conditions)
+    return args
+
+def update_body_language_summary(session_id: str, frame: Dict[str, Any]):
+    """Fold one analyzed frame into the session's running aggregates with atomic ADDs"""
+    table = dynamodb.Table(BODY_LANGUAGE_TABLE_NAME)
+    feedback = frame['feedback']
+    phrase_counts = {
+        'strength_counts': Counter(str(p).strip()[:200] for p in feedback.get('strengths', []) if str(p).strip()),
+        'improvement_counts': Counter(str(p).strip()[:200] for p in feedback.get('improvements', []) if str(p).strip())
+    }
+    
+    for _ in range(3):
+        try:
+            response = table.update_item(**_summary_update(session_id, frame, phrase_counts))
+            if is_critical(feedback):
+                _put_critical_moment(table, session_id, int(response['Attributes']['critical_moment_count']), frame)
+            return
+        except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            # Either the counter maps don't exist yet or a map is full and this frame has new phrases
+            summary = get_body_language_summary(session_id)
+            if any(attribute not in summary for attribute in phrase_counts):
+                table.update_item(
+                    Key={'session_id': session_id, 'frame_id': SUMMARY_FRAME_ID},
+                    UpdateExpression='SET strength_counts = if_not_exists(strength_counts, :empty), improvement_counts = if_not_exists(improvement_counts, :empty)',
+                    ExpressionAttributeValues={':empty': {}}
+                )
+                continue
+            for attribute, counts in phrase_counts.items():
+                tracked = summary[attribute]
+                if len(tracked) >= MAX_TRACKED_PHRASES:
+                    phrase_counts[attribute] = Counter({p: c for p, c in counts.items() if p in tracked})
+    raise RuntimeError(f"Could not update body language summary for session {session_id}")
+
+def _put_critical_moment(table, session_id: str, number: int, frame: Dict[str, Any]):
+    """Store the session's number-th critical moment in a ring of MAX_CRITICAL_MOMENTS slots,
+    so the summary item keeps the most recent ones and can't grow past DynamoDB's item size limit"""
+    table.update_item(
+        Key={'session_id': session_id, 'frame_id': SUMMARY_FRAME_ID},
+        UpdateExpression='SET critical_moments.#slot = :moment',
+        ExpressionAttributeNames={'#slot': str((number - 1) % MAX_CRITICAL_MOMENTS)},
+        ExpressionAttributeValues={':moment': {
+            'timestamp': frame['timestamp'],
+            'issue': frame['feedback'].get('actionable_tip') or 'Review this moment'
+        }}
+    )
+
+def get_body_language_summary(session_id: str) -> Dict[str, Any]:
+    """Get the running aggregates for a session (empty if no frames were analyzed)"""
+    table = dynamodb.Table(BODY_LANGUAGE_TABLE_NAME)
+    response = table.get_item(Key={'session_id': session_id, 'frame_id': SUMMARY_FRAME_ID})
+    return response.get('Item', {})
+
 def get_conversation_history(session_id: str) -> List[Dict[str, Any]]:
     """Get all conversations for a session"""
     session = get_session(session_id)
     return session.get('conversations', [])
+
+async def create_session_async(job_title: str, job_description: str, resume_text: str) -> str:
+    """Async variant of create_session"""
+    return await run_blocking(create_session, job_title, job_description, resume_text, service='dynamodb')
+
+async def add_conversation_async(session_id: str, question: str, answer: str, feedback: str, metrics: Dict[str, Any]):
+    """Async variant of add_conversation"""
+    return await run_blocking(add_conversation, session_id, question, answer, feedback, metrics, service='dynamodb')
+
+async def get_session_async(session_id: str) -> Dict[str, Any]:
+    """Async variant of get_session"""
+    return await run_blocking(get_session, session_id, service='dynamodb')
+
+async def get_job_context_async(session_id: str) -> str:
+    """Async variant of get_job_context"""
+    return await run_blocking(get_job_context, session_id, service='dynamodb')
+
+async def update_session_fields_async(session_id: str, fields: Dict[str, Any]):
+    """Async variant of update_session_fields"""
+    return await run_blocking(update_session_fields, session_id, fields, service='dynamodb')
+
+async def put_body_language_frame_async(session_id: str, frame: Dict[str, Any]):
+    """Async variant of put_body_language_frame"""
+    return await run_blocking(put_body_language_frame, session_id, frame, service='dynamodb')
+
+async def get_body_language_frames_async(session_id: str) -> List[Dict[str, Any]]:
+    """Async variant of get_body_language_frames"""
+    return await run_blocking(get_body_language_frames, session_id, service='dynamodb')
+
+async def update_body_language_summary_async(session_id: str, frame: Dict[str, Any]):
+    """Async variant of update_body_language_summary"""
+    return await run_blocking(update_body_language_summary, session_id, frame, service='dynamodb')
+
+async def get_body_language_summary_async(session_id: str) -> Dict[str, Any]:
+    """Async variant of get_body_language_summary"""
+    return await run_blocking(get_body_language_summary, session_id, service='dynamodb')
+
+async def complete_session_async(session_id: str):
+    """Async variant of complete_session"""
+    return await run_blocking(complete_session, session_id, service='dynamodb')
@@ -0,0 +1,88 @@
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow only byte-identical frames are detected
+    Image = None
+
+FRAME_FILTER_ENABLED = os.getenv('FRAME_FILTER_ENABLED', 'true').lower() == 'true'
+# Max differing bits (of 64) in the difference hash for frames to count as near-identical
+FRAME_HASH_MAX_DISTANCE = int(os.getenv('FRAME_HASH_MAX_DISTANCE', '6'))
+# Max mean absolute pixel difference (0-255) between 16x16 grayscale thumbnails
+FRAME_DIFF_THRESHOLD = float(os.getenv('FRAME_DIFF_THRESHOLD', '8.0'))
+# Always re-analyze after this long so a reused result never goes stale
+FRAME_MAX_REUSE_SECONDS = float(os.getenv('FRAME_MAX_REUSE_SECONDS', '30'))
+MAX_TRACKED_SESSIONS = int(os.getenv('FRAME_FILTER_MAX_SESSIONS', '1000'))
+
+THUMBNAIL_SIZE = 16
+
+def frame_signature(image_base64: str) -> Dict[str, Any]:
+    """Cheap fingerprint of a webcam JPEG: a 64-bit difference hash plus a 16x16 thumbnail"""
+    data = base64.b64decode(image_base64)
+    if Image is None:
+        return {'digest': hashlib.sha1(data).hexdigest()}
+
+    image = Image.open(io.BytesIO(data))
+    # Let the JPEG decoder downscale via DCT instead of decoding at full size
+    image.draft('L', (THUMBNAIL_SIZE * 4, THUMBNAIL_SIZE * 4))
+    gray = image.convert('L')
+
+    pixels = list(gray.resize((9, 8)).getdata())
+    dhash = 0
+    for row in range(8):
+        for col in range(8):
+            dhash = (dhash << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    thumbnail = bytes(gray.resize((THUMBNAIL_SIZE, THUMBNAIL_SIZE)).getdata())
+    return {'dhash': dhash, 'thumbnail': thumbnail}
+
+def is_near_identical(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    if 'digest' in a or 'digest' in b:
+        return a.get('digest') == b.get('digest')
+    if bin(a['dhash'] ^ b['dhash']).count('1') > FRAME_HASH_MAX_DISTANCE:
+        return False
+    diff = sum(abs(x - y) for x, y in zip(a['thumbnail'], b['thumbnail'])) / len(a['thumbnail'])
+    return diff <= FRAME_DIFF_THRESHOLD
+
+class FrameFilter:
+    """Remembers the last analyzed frame per session so near-identical frames can reuse its result"""
+
+    def __init__(self):
+        self._sessions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'frames_seen': 0, 'frames_skipped': 0}
+
+    def reusable_result(self, session_id: str, signature: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the previous analysis if this frame is near-identical to the last analyzed one"""
+        with self._lock:
+            self._stats['frames_seen'] += 1
+            last = self._sessions.get(session_id)
+            if not last or time.time() - last['analyzed_at'] > FRAME_MAX_REUSE_SECONDS:
+                return None
+            if not is_near_identical(signature, last['signature']):
+                return None
+            self._sessions.move_to_end(session_id)
+            self._stats['frames_skipped'] += 1
+            return dict(last['result'])
+
+    def remember(self, session_id: str, signature: Dict[str, Any], result: Dict[str, Any]):
+        with self._lock:
+            self._sessions[session_id] = {'signature': signature, 'result': dict(result), 'analyzed_at': time.time()}
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > MAX_TRACKED_SESSIONS:
+                self._sessions.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            seen = self._stats['frames_seen']
+            return {
+                **self._stats,
+                'skip_rate': round(self._stats['frames_skipped'] / seen, 3) if seen else 0.0,
+                'perceptual_hash': Image is not None
+            }
@@ -1,9 +1,13 @@
 import json
-import boto3
-import re
 from typing import Dict, Any
+from aws_executor import run_blocking
+from aws_clients import lazy_client
+from structured_output import conform, json_messages, parse_completion
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name='us-west-2')
+bedrock_runtime = lazy_client('bedrock-runtime')
+
+QUESTIONS_SCHEMA = {'technical_questions': [str], 'behavioral_questions': [str], 'rationale': str}
+EMPTY_QUESTIONS = {'technical_questions': [], 'behavioral_questions': [], 'rationale': ''}
 
 def generate_interview_questions(resume_data: Dict[str, Any], job_desc_data: Dict[str, Any], model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
     """Generate customized interview questions based on resume and job description"""
@@ -53,22 +57,17 @@ Return ONLY valid JSON in this exact format:
                 'anthropic_version': 'bedrock-2023-05-31',
                 'max_tokens': 1500,
                 'temperature': 0.7,
-                'messages': [{'role': 'user', 'content': f"You are an expert technical interviewer. Always respond with valid JSON format.\n\n{prompt}"}]
+                'messages': json_messages(f"You are an expert technical interviewer. Always respond with valid JSON format.\n\n{prompt}")
             })
         )
         
         response_body = json.loads(response['body'].read())
         content = response_body['content'][0]['text'].strip()
         
-        try:
-            result = json.loads(content)
-            return result
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {"error": "Failed to parse JSON response", "raw_response": content}
+        result = parse_completion(content)
+        if result is None:
+            return {"error": "Failed to parse JSON response", "raw_response": content}
+        return conform(result, QUESTIONS_SCHEMA, EMPTY_QUESTIONS)
     except Exception as e:
         return {"error": f"Bedrock API call failed: {str(e)}"}
 
@@ -105,3 +104,11 @@ Return ONLY the follow-up question text, nothing else."""
         return response_body['content'][0]['text'].strip()
     except Exception as e:
         return f"Can you elaborate more on that aspect?"
+
+async def generate_interview_questions_async(resume_data: Dict[str, Any], job_desc_data: Dict[str, Any], model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
+    """Async variant of generate_interview_questions for use in FastAPI handlers"""
+    return await run_blocking(generate_interview_questions, resume_data, job_desc_data, model_id, service='bedrock')
+
+async def generate_followup_question_async(question: str, answer: str, job_context: str, model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> str:
+    """Async variant of generate_followup_question for use in FastAPI handlers"""
+    return await run_blocking(generate_followup_question, question, answer, job_context, model_id, service='bedrock')
@@ -0,0 +1,177 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+import shared_modules  # noqa: F401
+# Same matcher and taxonomy as the resume_analyzer Lambda
+from skill_matching import (DEFAULT_TAXONOMY_PATH, MAX_HEADER_LENGTH, build_skill_index,
+                            find_skills as find_skill_mentions, load_skill_taxonomy, section_header)
+
+# Bump when the rules below change so cached hybrid results are not served
+LOCAL_PARSER_VERSION = 'local-v2'
+
+RESUME_SKILLS_TAXONOMY_PATH = os.getenv('RESUME_SKILLS_TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+# Fewer technical skills than this and the skills field is left to Claude
+RESUME_LOCAL_MIN_SKILLS = int(os.getenv('RESUME_LOCAL_MIN_SKILLS', '3'))
+SOFT_SKILLS_CATEGORY = 'Soft Skills'
+
+RESUME_FIELDS = ['name', 'skills', 'soft_skills', 'experience', 'projects', 'education']
+
+YEAR = r'(?:19|20)\d{2}'
+DATE = rf'(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+{YEAR}|\d{{1,2}}/{YEAR}|{YEAR})'
+DATE_RANGE_PATTERN = re.compile(rf'\(?{DATE}\s*(?:-|–|—|to)\s*(?:{DATE}|present|current|now)\)?', re.IGNORECASE)
+YEAR_PATTERN = re.compile(rf'\b{YEAR}\b')
+BULLET_PATTERN = re.compile(r'^(?:[-•*▪◦●‣–]\s*|\d+[.)]\s+)')
+FIELD_SEPARATOR_PATTERN = re.compile(r'\s*(?:\||•|\s[-–—]\s|\bat\b|@)\s*')
+# Education lines put degree, school and year in comma-separated fields
+EDUCATION_SEPARATOR_PATTERN = re.compile(r'\s*(?:,|\||•|\s[-–—]\s|\bat\b)\s*')
+PROJECT_SEPARATOR_PATTERN = re.compile(r'\s*(?:\||:|\s[-–—]\s)\s*')
+LOCATION_PATTERN = re.compile(r'^(?:remote|hybrid|[A-Z][a-zA-Z. ]+,\s*[A-Z]{2,})$')
+NAME_PATTERN = re.compile(r"^[A-Z][a-zA-Z'.-]+(?:\s+[A-Z][a-zA-Z'.-]+){1,3}$")
+DEGREE_PATTERN = re.compile(
+    r"\b(?:b\.?s\.?|b\.?a\.?|b\.?sc\.?|m\.?s\.?|m\.?a\.?|m\.?sc\.?|mba|ph\.?\s?d\.?|b\.?tech|m\.?tech|m\.?eng"
+    r"|bachelor(?:'?s)?|master(?:'?s)?|associate(?:'?s)?|doctorate|diploma)(?!\w)", re.IGNORECASE)
+INSTITUTION_PATTERN = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic)\b', re.IGNORECASE)
+JOB_TITLE_PATTERN = re.compile(
+    r'\b(?:engineer|developer|programmer|manager|intern|analyst|scientist|designer|lead|director|consultant'
+    r'|architect|specialist|administrator|assistant|associate|coordinator|officer|founder|researcher|technician)s?\b',
+    re.IGNORECASE)
+
+def _load_taxonomy() -> Dict[str, Dict[str, List[str]]]:
+    try:
+        return load_skill_taxonomy(RESUME_SKILLS_TAXONOMY_PATH)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ Skill taxonomy unavailable, skills will come from Claude: {e}")
+        return {}
+
+SKILL_TAXONOMY = _load_taxonomy()
+SKILL_INDEX = build_skill_index(SKILL_TAXONOMY)
+
+def find_skills(text: str) -> List[Tuple[str, str]]:
+    """(category, skill) pairs mentioned in the text, in order of first mention"""
+    return list(find_skill_mentions(text, SKILL_INDEX))
+
+def split_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Lines before the first header, and the stripped lines under each section header"""
+    preamble: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current = None
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) < MAX_HEADER_LENGTH:
+            header = section_header(line.lower())
+            # "San Diego State University" under Education is content, not another header
+            if header and header != current:
+                current = header
+                sections.setdefault(current, [])
+                continue
+        (sections[current] if current else preamble).append(line)
+    return preamble, sections
+
+def _fields(line: str, separator: re.Pattern = FIELD_SEPARATOR_PATTERN) -> List[str]:
+    return [part.strip(' ,;:()') for part in separator.split(line) if part.strip(' ,;:()')]
+
+def parse_experience(lines: List[str]) -> List[Dict[str, Any]]:
+    """Non-bullet lines describe a role (title, company, dates in any order); bullets are its responsibilities"""
+    entries: List[Dict[str, Any]] = []
+    current = None
+    for line in lines:
+        bullet = BULLET_PATTERN.match(line)
+        if bullet and current:
+            current['responsibilities'].append(line[bullet.end():])
+            continue
+        date = DATE_RANGE_PATTERN.search(line)
+        if current is None or current['responsibilities'] or (date and current['duration']):
+            current = {'company': '', 'position': '', 'duration': '', 'responsibilities': []}
+            entries.append(current)
+        if date:
+            current['duration'] = date.group().strip('()')
+            line = (line[:date.start()] + ' ' + line[date.end():]).strip()
+        # Title and company come in either order, sometimes on separate lines
+        for part in _fields(line):
+            if LOCATION_PATTERN.match(part):
+                continue
+            if not current['position'] and JOB_TITLE_PATTERN.search(part):
+                current['position'] = part
+            elif not current['company']:
+                current['company'] = part
+    return entries
+
+def parse_education(lines: List[str]) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    current = None
+    for line in lines:
+        if BULLET_PATTERN.match(line):
+            continue
+        for part in _fields(line, EDUCATION_SEPARATOR_PATTERN):
+            has_degree = DEGREE_PATTERN.search(part) is not None
+            has_institution = INSTITUTION_PATTERN.search(part) is not None and not has_degree
+            if (has_degree or has_institution) and (
+                    current is None or (has_degree and current['degree']) or (has_institution and current['institution'])):
+                current = {'degree': '', 'institution': '', 'year': ''}
+                entries.append(current)
+            if current is None:
+                continue
+            if has_degree and not current['degree']:
+                current['degree'] = YEAR_PATTERN.sub('', part).strip(' ,-–')
+            elif has_institution:
+                current['institution'] = YEAR_PATTERN.sub('', part).strip(' ,-–')
+        years = YEAR_PATTERN.findall(line)
+        if current is not None and years:
+            current['year'] = years[-1]
+    return entries
+
+def parse_projects(lines: List[str]) -> List[Dict[str, Any]]:
+    """A non-bullet line names a project; its first bullet, or the text after the name, describes it"""
+    entries: List[Dict[str, Any]] = []
+    for line in lines:
+        bullet = BULLET_PATTERN.match(line)
+        if bullet and entries:
+            entries[-1]['bullets'].append(line[bullet.end():])
+            continue
+        parts = [part.strip() for part in PROJECT_SEPARATOR_PATTERN.split(line, maxsplit=1) if part.strip()]
+        if parts:
+            entries.append({'name': parts[0], 'trailing': parts[1] if len(parts) > 1 else '', 'bullets': []})
+
+    projects = []
+    for entry in entries:
+        text = ' '.join([entry['name'], entry['trailing']] + entry['bullets'])
+        projects.append({
+            'name': entry['name'],
+            'technologies': [skill for category, skill in find_skills(text) if category != SOFT_SKILLS_CATEGORY],
+            'description': entry['bullets'][0] if entry['bullets'] else entry['trailing']
+        })
+    return projects
+
+def parse_resume_locally(resume_text: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Rule-based parse into the Claude resume schema, plus the fields it isn't confident about"""
+    preamble, sections = split_sections(resume_text)
+
+    name = next((line for line in preamble[:3] if NAME_PATTERN.match(line)), '')
+    skills = find_skills(resume_text)
+    result = {
+        'name': name,
+        'skills': [skill for category, skill in skills if category != SOFT_SKILLS_CATEGORY],
+        'soft_skills': [skill for category, skill in skills if category == SOFT_SKILLS_CATEGORY],
+        'experience': parse_experience(sections.get('experience', [])),
+        'projects': parse_projects(sections.get('projects', [])),
+        'education': parse_education(sections.get('education', []))
+    }
+
+    missing = []
+    if not name:
+        missing.append('name')
+    if len(result['skills']) < RESUME_LOCAL_MIN_SKILLS:
+        missing.append('skills')
+    # An absent experience or education section is as likely an unrecognized header as a real gap
+    if not result['experience'] or not all(e['position'] and e['company'] for e in result['experience']):
+        missing.append('experience')
+    projects_complete = result['projects'] and all(p['name'] and p['description'] for p in result['projects'])
+    if 'projects' in sections and not projects_complete:
+        missing.append('projects')
+    if not result['education'] or not all(e['degree'] and e['institution'] for e in result['education']):
+        missing.append('education')
+    return result, missing
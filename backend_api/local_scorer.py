@@ -0,0 +1,181 @@
+import base64
+import importlib.util
+import math
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# OpenCV takes ~100ms to import, so it is loaded with the first frame rather than
+# at startup. Without it every frame goes to Claude vision.
+OPENCV_INSTALLED = importlib.util.find_spec('cv2') is not None
+cv2 = None
+np = None
+
+LOCAL_SCORER_ENABLED = os.getenv('LOCAL_SCORER_ENABLED', 'true').lower() == 'true'
+# Send a frame to Claude at least this often per session; engagement and
+# professionalism scores come from that analysis
+LOCAL_SCORER_MAX_LOCAL_SECONDS = float(os.getenv('LOCAL_SCORER_MAX_LOCAL_SECONDS', '20'))
+# Frames are downscaled to this width before detection
+LOCAL_SCORER_WIDTH = int(os.getenv('LOCAL_SCORER_WIDTH', '320'))
+MAX_TRACKED_SESSIONS = int(os.getenv('LOCAL_SCORER_MAX_SESSIONS', '1000'))
+
+def _load_opencv():
+    global cv2, np
+    if cv2 is None:
+        import numpy
+        import cv2 as opencv
+        np, cv2 = numpy, opencv
+
+def _clamp(score: float) -> int:
+    return int(max(0, min(10, round(score))))
+
+def severity_for(*scores: int) -> str:
+    """Same bands as the Claude prompt: 0-4 major, 5-6 noticeable, 7+ good"""
+    lowest = min(scores)
+    if lowest <= 4:
+        return 'high'
+    if lowest <= 6:
+        return 'medium'
+    return 'low'
+
+class LocalScorer:
+    """Scores eye contact and posture with OpenCV Haar cascades, escalating unclear frames to Claude"""
+
+    def __init__(self):
+        self._face_cascade = None
+        self._eye_cascade = None
+        self._load_lock = threading.Lock()
+        self._sessions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'frames_scored': 0, 'frames_local': 0}
+        self._escalations = Counter()
+
+    @property
+    def available(self) -> bool:
+        return LOCAL_SCORER_ENABLED and OPENCV_INSTALLED
+
+    def _cascades(self):
+        if self._face_cascade is None:
+            with self._load_lock:
+                if self._face_cascade is None:
+                    self._eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
+                    self._face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        return self._face_cascade, self._eye_cascade
+
+    def detect(self, image_base64: str) -> Dict[str, Any]:
+        """Face/eye geometry for a webcam JPEG, normalized to the frame size"""
+        _load_opencv()
+        data = np.frombuffer(base64.b64decode(image_base64), dtype=np.uint8)
+        # Decode at half resolution straight to grayscale; webcam frames are at least 640 wide
+        gray = cv2.imdecode(data, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+        if gray is None:
+            raise ValueError("Could not decode frame")
+        if gray.shape[1] > LOCAL_SCORER_WIDTH:
+            scale = LOCAL_SCORER_WIDTH / gray.shape[1]
+            gray = cv2.resize(gray, (LOCAL_SCORER_WIDTH, int(gray.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+        gray = cv2.equalizeHist(gray)
+        height, width = gray.shape
+
+        face_cascade, eye_cascade = self._cascades()
+        faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(width // 10, width // 10))
+        detection = {'face_count': len(faces)}
+        if len(faces) != 1:
+            return detection
+
+        x, y, w, h = faces[0]
+        # Eyes sit in the upper ~60% of the face box; searching only there avoids mouth/nostril false positives
+        eyes = eye_cascade.detectMultiScale(gray[y:y + int(h * 0.6), x:x + w], scaleFactor=1.1, minNeighbors=5, minSize=(w // 8, w // 8))
+        eyes = sorted(eyes, key=lambda e: e[2] * e[3], reverse=True)[:2]
+        tilt = 0.0
+        if len(eyes) == 2:
+            (ax, ay, aw, ah), (bx, by, bw, bh) = sorted(eyes, key=lambda e: e[0])
+            tilt = math.degrees(math.atan2((by + bh / 2) - (ay + ah / 2), (bx + bw / 2) - (ax + aw / 2)))
+        detection.update({
+            'eye_count': len(eyes),
+            'head_tilt': abs(tilt),
+            'center_offset': abs((x + w / 2) / width - 0.5) * 2,
+            'face_center_y': (y + h / 2) / height,
+            'face_width': w / width
+        })
+        return detection
+
+    def score(self, detection: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Turn a detection into (scores, escalation reason); ambiguous frames return no scores"""
+        if detection['face_count'] == 0:
+            return None, 'no_face'
+        if detection['face_count'] > 1:
+            return None, 'multiple_people'
+        if detection['eye_count'] != 2:
+            # One or no eyes usually means looking away, but glasses and lighting fool the cascade too
+            return None, 'eyes_unclear'
+
+        eye_contact = 9 - detection['center_offset'] * 5 - max(0.0, detection['head_tilt'] - 8) / 4
+        posture = 9
+        # Slouching drops the face toward the bottom of the frame
+        posture -= max(0.0, detection['face_center_y'] - 0.5) * 25
+        # Leaning into or far away from the camera
+        if detection['face_width'] > 0.45:
+            posture -= (detection['face_width'] - 0.45) * 20
+        elif detection['face_width'] < 0.15:
+            posture -= (0.15 - detection['face_width']) * 40
+        posture -= max(0.0, detection['head_tilt'] - 12) / 4
+
+        scores = {'eye_contact_score': _clamp(eye_contact), 'posture_score': _clamp(posture)}
+        if severity_for(*scores.values()) == 'high':
+            return None, 'high_severity'
+        return scores, None
+
+    def assess(self, session_id: str, image_base64: str) -> Optional[Dict[str, Any]]:
+        """Local feedback for a frame, or None when it should go to Claude vision"""
+        scores, reason = self.score(self.detect(image_base64))
+        with self._lock:
+            self._stats['frames_scored'] += 1
+            last = self._sessions.get(session_id)
+            if scores and (not last or time.time() - last['analyzed_at'] > LOCAL_SCORER_MAX_LOCAL_SECONDS):
+                scores, reason = None, 'refresh'
+            if scores is None:
+                self._escalations[reason] += 1
+                return None
+            self._stats['frames_local'] += 1
+            self._sessions.move_to_end(session_id)
+            previous = last['result']
+
+        strengths, improvements = [], []
+        if scores['eye_contact_score'] >= 7:
+            strengths.append("Good eye contact")
+        else:
+            improvements.append("Look directly at the camera")
+        if scores['posture_score'] >= 7:
+            strengths.append("Upright posture")
+        else:
+            improvements.append("Sit up straight")
+        return {
+            'strengths': strengths,
+            'improvements': improvements,
+            'actionable_tip': improvements[0] if improvements else previous.get('actionable_tip', "Keep engaging with the camera"),
+            'severity_level': severity_for(*scores.values()),
+            **scores,
+            # Not visible to a face detector; carry over the last Claude assessment
+            'engagement_score': previous.get('engagement_score', 7),
+            'professionalism_score': previous.get('professionalism_score', 7)
+        }
+
+    def remember(self, session_id: str, result: Dict[str, Any]):
+        """Record a Claude vision result so following frames can be scored locally"""
+        with self._lock:
+            self._sessions[session_id] = {'result': dict(result), 'analyzed_at': time.time()}
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > MAX_TRACKED_SESSIONS:
+                self._sessions.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            scored = self._stats['frames_scored']
+            return {
+                **self._stats,
+                'local_rate': round(self._stats['frames_local'] / scored, 3) if scored else 0.0,
+                'escalations': dict(self._escalations),
+                'available': self.available
+            }
@@ -1,18 +1,27 @@
 from fastapi import FastAPI, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import boto3
+import asyncio
 import json
-import uuid
 import time
 import os
-import PyPDF2
-import io
+import re
 from dotenv import load_dotenv
-from interview_generator import generate_interview_questions, generate_followup_question
-from dynamodb_service import create_table_if_not_exists, create_session, add_conversation, get_session, complete_session, get_conversation_history
-from resume_parser import parse_resume, parse_job_description
+from aws_executor import run_blocking, shutdown_executor
+from aws_clients import lazy_client
+from interview_generator import generate_interview_questions_async, generate_followup_question_async
+from dynamodb_service import create_table_if_not_exists, create_session_async, add_conversation_async, get_job_context_async, get_session_async, complete_session_async, update_session_fields_async, put_body_language_frame_async, get_body_language_frames_async, update_body_language_summary_async, get_body_language_summary_async, BODY_LANGUAGE_SCORES, MAX_CRITICAL_MOMENTS, is_critical
+from question_pool import QUESTION_POOL_ENABLED, get_question_set, pool_stats as question_pool_stats
+from resume_parser import parse_resume_async, parse_job_description_async, cache_stats as parse_cache_stats
+from speech_to_text import create_engine
+from transcription_jobs import TranscriptionJobManager
+from frame_filter import FRAME_FILTER_ENABLED, FrameFilter, frame_signature
+from local_scorer import LocalScorer
+from pdf_extraction import extract_pdf_text, shutdown_pdf_pool
+from structured_output import conform, json_messages, parse_completion
+from body_language import BATCH_ENABLED, DEFAULT_BODY_LANGUAGE_FEEDBACK, FrameBatcher, body_language_request_body, parse_body_language
 
 load_dotenv()
 
@@ -28,15 +37,46 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    create_table_if_not_exists()
+    await run_blocking(create_table_if_not_exists, service='dynamodb')
 
-# Initialize AWS clients
-bedrock = boto3.client('bedrock-runtime', region_name='us-west-2')
-transcribe = boto3.client('transcribe', region_name='us-west-2')
-s3 = boto3.client('s3', region_name='us-west-2')
-polly = boto3.client('polly', region_name='us-west-2')
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_executor()
+    shutdown_pdf_pool()
+
+# Initialize AWS clients (created on first use)
+bedrock = lazy_client('bedrock-runtime')
+transcribe = lazy_client('transcribe')
+s3 = lazy_client('s3')
+polly = lazy_client('polly')
 
 BUCKET_NAME = os.getenv('S3_BUCKET', 'ai-interview-audio-temp')
+MAX_TRANSCRIPTION_WAIT = 30
+
+transcription_jobs = TranscriptionJobManager(create_engine(s3, transcribe, BUCKET_NAME))
+
+def invoke_claude(request_body: Dict[str, Any]) -> str:
+    """Blocking Bedrock call returning the completion text; run via run_blocking"""
+    response = bedrock.invoke_model(
+        modelId='anthropic.claude-3-5-sonnet-20241022-v2:0',
+        body=json.dumps(request_body)
+    )
+    response_body = json.loads(response['body'].read())
+    return response_body['content'][0]['text']
+
+def stream_claude(request_body: Dict[str, Any], on_text) -> None:
+    """Blocking streaming Bedrock call that hands each text delta to on_text; run via run_blocking"""
+    response = bedrock.invoke_model_with_response_stream(
+        modelId='anthropic.claude-3-5-sonnet-20241022-v2:0',
+        body=json.dumps(request_body)
+    )
+    for event in response['body']:
+        chunk = event.get('chunk')
+        if not chunk:
+            continue
+        data = json.loads(chunk['bytes'])
+        if data.get('type') == 'content_block_delta':
+            on_text(data['delta'].get('text', ''))
 
 class InterviewRequest(BaseModel):
     job_title: str
@@ -59,6 +99,7 @@ class FeedbackRequest(BaseModel):
 class BodyLanguageRequest(BaseModel):
     session_id: str
     image_base64: str
+    # Seconds into the interview; only stored and used for ordering, never part of the frame's key
     timestamp: float
     question: str
     question_type: str = "behavioral"
@@ -68,13 +109,50 @@ class BodyLanguageRequest(BaseModel):
 def read_root():
     return {"message": "AI Interview Coach API"}
 
+async def timed_stage(name: str, coro, request_start: float, timings: Dict[str, Any]):
+    """Await a stage and record its start offset and duration (ms) relative to the request"""
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = {
+            "start_ms": round((start - request_start) * 1000, 1),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1)
+        }
+
+async def constant(value):
+    return value
+
+@app.get("/metrics")
+def get_metrics():
+    """Cache and pre-filter counters for tuning"""
+    return {
+        "parse_cache": parse_cache_stats(),
+        "question_pool": question_pool_stats(),
+        "transcription_jobs": transcription_jobs.stats(),
+        "frame_filter": frame_filter.stats(),
+        "frame_batcher": frame_batcher.stats(),
+        "local_scorer": local_scorer.stats()
+    }
+
 @app.post("/start-interview")
-def start_interview(req: InterviewRequest):
+async def start_interview(req: InterviewRequest):
     try:
-        resume_data = parse_resume(req.resume_text) if req.resume_text else {"error": "No resume"}
-        job_data = parse_job_description(req.job_description, req.job_title) if req.job_description else {"title": req.job_title}
+        request_start = time.perf_counter()
+        timings = {}
+        
+        # Resume/job parsing and the session write are independent - run them together
+        resume_data, job_data, session_id = await asyncio.gather(
+            timed_stage("parse_resume", parse_resume_async(req.resume_text) if req.resume_text else constant({"error": "No resume"}), request_start, timings),
+            timed_stage("parse_job_description", parse_job_description_async(req.job_description, req.job_title) if req.job_description else constant({"title": req.job_title}), request_start, timings),
+            timed_stage("create_session", create_session_async(req.job_title, req.job_description, req.resume_text), request_start, timings)
+        )
         
-        questions_result = generate_interview_questions(resume_data, job_data)
+        if QUESTION_POOL_ENABLED:
+            generate = get_question_set(resume_data, job_data, req.job_title, req.job_description)
+        else:
+            generate = generate_interview_questions_async(resume_data, job_data)
+        questions_result = await timed_stage("generate_questions", generate, request_start, timings)
         
         if "error" in questions_result:
             all_questions = [
@@ -102,15 +180,7 @@ def start_interview(req: InterviewRequest):
                     "Give me an example of a project you're proud of and why."
                 ]
         
-        session_id = create_session(req.job_title, req.job_description, req.resume_text)
-        
-        from dynamodb_service import dynamodb, TABLE_NAME
-        table = dynamodb.Table(TABLE_NAME)
-        table.update_item(
-            Key={'session_id': session_id},
-            UpdateExpression='SET questions = :q, resume_data = :r, job_data = :j',
-            ExpressionAttributeValues={':q': all_questions, ':r': resume_data, ':j': job_data}
-        )
+        await timed_stage("save_questions", update_session_fields_async(session_id, {'questions': all_questions, 'resume_data': resume_data, 'job_data': job_data}), request_start, timings)
         
         # Determine question type based on content
         first_question = all_questions[0]
@@ -124,7 +194,9 @@ def start_interview(req: InterviewRequest):
             "debug_info": {
                 "tech_count": len(questions_result.get('technical_questions', [])),
                 "behavioral_count": len(questions_result.get('behavioral_questions', [])),
-                "rationale": questions_result.get('rationale', 'N/A')
+                "rationale": questions_result.get('rationale', 'N/A'),
+                "timings_ms": timings,
+                "total_ms": round((time.perf_counter() - request_start) * 1000, 1)
             }
         }
     except Exception as e:
@@ -133,29 +205,29 @@ def start_interview(req: InterviewRequest):
 @app.post("/upload-resume")
 async def upload_resume(file: UploadFile = File(...)):
     try:
-        content = await file.read()
         if file.filename.endswith('.pdf'):
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return {"resume_text": text.strip(), "chars": len(text)}
+            return await extract_pdf_text(file)
         else:
+            content = await file.read()
             text = content.decode('utf-8')
             return {"resume_text": text, "chars": len(text)}
     except Exception as e:
         return {"error": str(e)}
 
+def synthesize_speech(text: str) -> bytes:
+    """Blocking Polly call returning MP3 bytes; run via run_blocking"""
+    response = polly.synthesize_speech(
+        Text=text,
+        OutputFormat='mp3',
+        VoiceId='Joanna',
+        Engine='neural'
+    )
+    return response['AudioStream'].read()
+
 @app.post("/text-to-speech")
-def text_to_speech(text: str = Form(...)):
+async def text_to_speech(text: str = Form(...)):
     try:
-        response = polly.synthesize_speech(
-            Text=text,
-            OutputFormat='mp3',
-            VoiceId='Joanna',
-            Engine='neural'
-        )
-        audio_data = response['AudioStream'].read()
+        audio_data = await run_blocking(synthesize_speech, text, service='polly')
         import base64
         return {"audio": base64.b64encode(audio_data).decode()}
     except Exception as e:
@@ -163,50 +235,39 @@ def text_to_speech(text: str = Form(...)):
 
 @app.post("/transcribe-audio")
 async def transcribe_audio(audio: UploadFile = File(...)):
-    job_name = f"interview-{uuid.uuid4()}"
-    s3_key = f"audio/{job_name}.wav"
-    
-    # Upload to S3
+    """Submit audio for transcription; poll /transcribe-audio/{job_id} for the transcript"""
     audio_bytes = await audio.read()
-    s3.put_object(Bucket=BUCKET_NAME, Key=s3_key, Body=audio_bytes)
-    
-    # Start transcription
-    transcribe.start_transcription_job(
-        TranscriptionJobName=job_name,
-        Media={'MediaFileUri': f's3://{BUCKET_NAME}/{s3_key}'},
-        MediaFormat='wav',
-        LanguageCode='en-US'
-    )
-    
-    # Wait for completion
-    while True:
-        status = transcribe.get_transcription_job(TranscriptionJobName=job_name)
-        if status['TranscriptionJob']['TranscriptionJobStatus'] in ['COMPLETED', 'FAILED']:
-            break
-        time.sleep(2)
-    
-    if status['TranscriptionJob']['TranscriptionJobStatus'] == 'COMPLETED':
-        transcript_uri = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-        import urllib.request
-        with urllib.request.urlopen(transcript_uri) as response:
-            transcript_data = json.loads(response.read())
-            transcript = transcript_data['results']['transcripts'][0]['transcript']
-        
-        # Cleanup
-        transcribe.delete_transcription_job(TranscriptionJobName=job_name)
-        s3.delete_object(Bucket=BUCKET_NAME, Key=s3_key)
-        
-        return {"transcript": transcript}
-    
-    return {"error": "Transcription failed"}
-
-@app.post("/get-feedback")
-def get_feedback(req: FeedbackRequest):
-    try:
-        pace_wpm = int((req.word_count / req.duration) * 60) if req.duration > 0 else 0
-        pace_assessment = 'good' if 120 <= pace_wpm <= 160 else 'slow' if pace_wpm < 120 else 'fast'
-        
-        prompt = f"""You are a BRUTALLY HONEST interview coach. Your job is to give REAL feedback that will actually help candidates improve.
+    return transcription_jobs.submit(audio_bytes)
+
+@app.get("/transcribe-audio/{job_id}")
+async def get_transcription(job_id: str, wait: float = 0):
+    """Get a transcription job, optionally long-polling up to `wait` seconds for it to finish"""
+    if wait > 0:
+        job = await transcription_jobs.wait(job_id, min(wait, MAX_TRANSCRIPTION_WAIT))
+    else:
+        job = transcription_jobs.get(job_id)
+    if job is None:
+        return {"error": "Transcription job not found"}
+    return job
+
+DEFAULT_EXPECTED_ANSWER = "A strong answer would include specific examples using the STAR method, quantifiable results, and clear demonstration of relevant skills."
+SCORE_PATTERN = re.compile(r'\*\*Score:\s*(\d+)/10\*\*')
+EXPECTED_ANSWER_PATTERN = re.compile(r'\*\*Expected Answer:\*\*\s*([^*]+)', re.DOTALL)
+SECTION_HEADER_PATTERN = re.compile(r'\*\*([^*\n]+?):\*\*')
+# With request_followup, ask for feedback and the follow-up question in one Claude call instead of two
+FUSED_FEEDBACK_ENABLED = os.getenv('FUSED_FEEDBACK_ENABLED', 'true').lower() == 'true'
+STRUCTURED_FEEDBACK_MAX_TOKENS = 1300
+FEEDBACK_SCHEMA = {"feedback": str, "score": int, "expected_answer": str}
+# The "feedback" string of a JSON completion, closed or not
+PARTIAL_FEEDBACK_PATTERN = re.compile(r'"feedback"\s*:\s*"((?:[^"\\]|\\.)*)', re.DOTALL)
+
+def assess_pace(req: FeedbackRequest):
+    pace_wpm = int((req.word_count / req.duration) * 60) if req.duration > 0 else 0
+    pace_assessment = 'good' if 120 <= pace_wpm <= 160 else 'slow' if pace_wpm < 120 else 'fast'
+    return pace_wpm, pace_assessment
+
+def build_feedback_prompt(req: FeedbackRequest, pace_wpm: int, pace_assessment: str) -> str:
+    return f"""You are a BRUTALLY HONEST interview coach. Your job is to give REAL feedback that will actually help candidates improve.
 
 Question: {req.question}
 Question Type: {req.question_type}
@@ -251,41 +312,79 @@ SCORING GUIDE:
 9-10: Excellent answer with specific examples, metrics, and clear impact
 
 Be BRUTALLY HONEST. This is practice - they need real feedback to improve."""
-        
-        score = 5
-        expected_answer = "A strong answer would include specific examples using the STAR method, quantifiable results, and clear demonstration of relevant skills."
-        
-        try:
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 1000,
-                "temperature": 0.7,
-                "messages": [{"role": "user", "content": prompt}]
-            }
-            
-            response = bedrock.invoke_model(
-                modelId='anthropic.claude-3-5-sonnet-20241022-v2:0',
-                body=json.dumps(request_body)
-            )
-            
-            response_body = json.loads(response['body'].read())
-            feedback = response_body['content'][0]['text']
-            
-            # Extract score from feedback
-            import re
-            score_match = re.search(r'\*\*Score:\s*(\d+)/10\*\*', feedback)
-            if score_match:
-                score = int(score_match.group(1))
-            
-            # Extract expected answer
-            expected_match = re.search(r'\*\*Expected Answer:\*\*\s*([^*]+)', feedback, re.DOTALL)
-            if expected_match:
-                expected_answer = expected_match.group(1).strip()
-                
-        except Exception as bedrock_error:
-            print(f"Bedrock error: {bedrock_error}")
-            score = 3 if req.word_count > 50 else 1
-            feedback = f"""**Content Analysis:**
+
+def build_structured_feedback_prompt(req: FeedbackRequest, pace_wpm: int, pace_assessment: str, job_context: Optional[str] = None) -> str:
+    """The feedback prompt answered as one JSON object, plus the follow-up question when job_context is given"""
+    followup_task = f"""
+
+Job Context: {job_context}
+
+Also write ONE specific follow-up question that digs deeper into their response, probes for specific examples or details, and clarifies any vague points.""" if job_context is not None else ""
+    followup_field = ',\n  "followup_question": "the follow-up question"' if job_context is not None else ""
+    return build_feedback_prompt(req, pace_wpm, pace_assessment) + f"""{followup_task}
+
+Return ONLY a JSON object, nothing else:
+{{
+  "feedback": "the complete feedback in the Markdown format above, including the Expected Answer and Score",
+  "score": 0,
+  "expected_answer": "what a good answer would include"{followup_field}
+}}"""
+
+def feedback_request_body(prompt: str, max_tokens: int = 1000, json_output: bool = False) -> Dict[str, Any]:
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "temperature": 0.7,
+        "messages": json_messages(prompt) if json_output else [{"role": "user", "content": prompt}]
+    }
+
+def parse_feedback(feedback: str):
+    """Extract the score and expected answer from Markdown feedback"""
+    score = 5
+    expected_answer = DEFAULT_EXPECTED_ANSWER
+    score_match = SCORE_PATTERN.search(feedback)
+    if score_match:
+        score = int(score_match.group(1))
+    expected_match = EXPECTED_ANSWER_PATTERN.search(feedback)
+    if expected_match:
+        expected_answer = expected_match.group(1).strip()
+    return score, expected_answer
+
+def parse_structured_feedback(content: str) -> Optional[Dict[str, Any]]:
+    """Feedback, score, expected answer and follow-up from a JSON completion; None if it isn't that JSON"""
+    data = parse_completion(content)
+    if data is None or not isinstance(data.get('feedback'), str) or not data['feedback'].strip():
+        return None
+    
+    feedback = data['feedback'].strip()
+    # Score and expected answer fall back to what the Markdown feedback says
+    score, expected_answer = parse_feedback(feedback)
+    data = conform({**data, 'feedback': feedback}, FEEDBACK_SCHEMA, {'score': score, 'expected_answer': expected_answer})
+    followup_question = data.get('followup_question')
+    return {
+        "feedback": feedback,
+        "score": max(0, min(10, int(data['score']))),
+        "expected_answer": data['expected_answer'].strip() or expected_answer,
+        "followup_question": followup_question.strip() if isinstance(followup_question, str) and followup_question.strip() else None
+    }
+
+def partial_feedback(content: str) -> str:
+    """The Markdown feedback from a JSON completion that didn't parse (e.g. cut off at max_tokens), unescaped;
+    the content itself if Claude answered in Markdown despite the prefill"""
+    match = PARTIAL_FEEDBACK_PATTERN.search(content)
+    if not match:
+        return content.strip()
+    # Drop an escape sequence the truncation cut in half before decoding the string
+    escaped = re.sub(r'\\u[0-9a-fA-F]{0,3}$', '', match.group(1))
+    try:
+        return json.loads(f'"{escaped}"').strip()
+    except json.JSONDecodeError:
+        return escaped.replace('\\n', '\n').strip()
+
+def fallback_feedback(req: FeedbackRequest, pace_wpm: int, pace_assessment: str):
+    """Canned feedback used when Bedrock is unavailable"""
+    score = 3 if req.word_count > 50 else 1
+    feedback = f"""**Content Analysis:**
 Response length: {req.word_count} words. {'Lacks specific examples and structure.' if req.word_count > 50 else 'Far too brief - this would fail in a real interview.'}
 
 **Delivery Assessment:**
@@ -300,29 +399,72 @@ None identified - answer needs significant improvement.
 • Answer the question directly and completely
 
 **Expected Answer:**
-{expected_answer}
+{DEFAULT_EXPECTED_ANSWER}
 
 **Score: {score}/10**
 
 This answer would not pass in a real interview. Practice with concrete examples."""
-        
-        metrics = {"word_count": req.word_count, "duration": req.duration, "pace_wpm": pace_wpm, "pace_assessment": pace_assessment}
-        
-        # Store conversation in DynamoDB
+    return feedback, score, DEFAULT_EXPECTED_ANSWER
+
+async def finish_feedback(req: FeedbackRequest, feedback: str, pace_wpm: int, pace_assessment: str,
+                          followup_question: Optional[str] = None) -> Optional[str]:
+    """Store the conversation turn and, if requested and not already generated, a follow-up question"""
+    metrics = {"word_count": req.word_count, "duration": req.duration, "pace_wpm": pace_wpm, "pace_assessment": pace_assessment}
+    
+    async def store():
         try:
-            add_conversation(req.session_id, req.question, req.response, feedback, metrics)
+            await add_conversation_async(req.session_id, req.question, req.response, feedback, metrics)
         except Exception as db_error:
             print(f"DynamoDB error: {db_error}")
             # Continue even if storage fails
-        
+    
+    async def followup():
+        if not req.request_followup or followup_question is not None:
+            return followup_question
+        try:
+            job_context = await get_job_context_async(req.session_id)
+            return await generate_followup_question_async(req.question, req.response, job_context)
+        except Exception as followup_error:
+            print(f"Follow-up generation error: {followup_error}")
+            return None
+    
+    # The write and the follow-up call are independent
+    _, followup_question = await asyncio.gather(store(), followup())
+    return followup_question
+
+@app.post("/get-feedback")
+async def get_feedback(req: FeedbackRequest):
+    try:
+        pace_wpm, pace_assessment = assess_pace(req)
         followup_question = None
-        if req.request_followup:
-            try:
-                session = get_session(req.session_id)
-                job_context = f"{session.get('job_title', '')} - {session.get('job_description', '')[:200]}"
-                followup_question = generate_followup_question(req.question, req.response, job_context)
-            except Exception as followup_error:
-                print(f"Follow-up generation error: {followup_error}")
+        
+        try:
+            if req.request_followup and FUSED_FEEDBACK_ENABLED:
+                # Feedback and follow-up in one JSON completion
+                try:
+                    job_context = await get_job_context_async(req.session_id)
+                except Exception as db_error:
+                    print(f"DynamoDB error: {db_error}")
+                    job_context = ""
+                prompt = build_structured_feedback_prompt(req, pace_wpm, pace_assessment, job_context)
+                content = await run_blocking(invoke_claude, feedback_request_body(prompt, STRUCTURED_FEEDBACK_MAX_TOKENS, json_output=True), service='bedrock')
+                structured = parse_structured_feedback(content)
+                if structured:
+                    feedback, score, expected_answer, followup_question = (
+                        structured["feedback"], structured["score"], structured["expected_answer"], structured["followup_question"])
+                else:
+                    # Truncated or malformed JSON; a requested follow-up gets its own call below
+                    feedback = partial_feedback(content)
+                    score, expected_answer = parse_feedback(feedback)
+            else:
+                prompt = build_feedback_prompt(req, pace_wpm, pace_assessment)
+                feedback = await run_blocking(invoke_claude, feedback_request_body(prompt), service='bedrock')
+                score, expected_answer = parse_feedback(feedback)
+        except Exception as bedrock_error:
+            print(f"Bedrock error: {bedrock_error}")
+            feedback, score, expected_answer = fallback_feedback(req, pace_wpm, pace_assessment)
+        
+        followup_question = await finish_feedback(req, feedback, pace_wpm, pace_assessment, followup_question)
         
         return {
             "feedback": feedback,
@@ -337,12 +479,82 @@ This answer would not pass in a real interview. Practice with concrete examples.
         print(f"Error in get_feedback: {e}")
         return {"error": str(e)}
 
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def feedback_event_stream(req: FeedbackRequest):
+    """Yield SSE events: raw text deltas, each feedback section once complete, then the parsed result"""
+    pace_wpm, pace_assessment = assess_pace(req)
+    prompt = build_feedback_prompt(req, pace_wpm, pace_assessment)
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue = asyncio.Queue()
+    
+    def on_text(text: str):
+        loop.call_soon_threadsafe(chunks.put_nowait, text)
+    
+    async def produce():
+        try:
+            await run_blocking(stream_claude, feedback_request_body(prompt), on_text, service='bedrock')
+        finally:
+            chunks.put_nowait(None)
+    
+    producer = asyncio.create_task(produce())
+    feedback = ""
+    sections_sent = 0
+    
+    def completed_sections(final: bool):
+        # A section is complete once the next header has started (or the stream has ended)
+        headers = list(SECTION_HEADER_PATTERN.finditer(feedback))
+        last = len(headers) if final else len(headers) - 1
+        for i in range(sections_sent, max(last, 0)):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(feedback)
+            yield {"title": headers[i].group(1).strip(), "content": feedback[headers[i].end():end].strip()}
+    
+    while True:
+        text = await chunks.get()
+        if text is None:
+            break
+        feedback += text
+        yield sse_event("delta", {"text": text})
+        for section in completed_sections(final=False):
+            sections_sent += 1
+            yield sse_event("section", section)
+    
+    try:
+        producer.result()
+        score, expected_answer = parse_feedback(feedback)
+        for section in completed_sections(final=True):
+            sections_sent += 1
+            yield sse_event("section", section)
+    except Exception as bedrock_error:
+        print(f"Bedrock streaming error: {bedrock_error}")
+        feedback, score, expected_answer = fallback_feedback(req, pace_wpm, pace_assessment)
+    
+    followup_question = await finish_feedback(req, feedback, pace_wpm, pace_assessment)
+    yield sse_event("complete", {
+        "feedback": feedback,
+        "pace_wpm": pace_wpm,
+        "pace_assessment": pace_assessment,
+        "followup_question": followup_question,
+        "score": score,
+        "expected_answer": expected_answer
+    })
+
+@app.post("/get-feedback-stream")
+async def get_feedback_stream(req: FeedbackRequest):
+    """Streaming variant of /get-feedback using Server-Sent Events"""
+    return StreamingResponse(
+        feedback_event_stream(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 @app.post("/get-next-question")
-def get_next_question(req: QuestionRequest):
+async def get_next_question(req: QuestionRequest):
     """Get next question from session"""
     try:
-        session = get_session(req.session_id)
+        session = await get_session_async(req.session_id)
         questions = session.get('questions', [])
         
         if req.question_index >= len(questions):
@@ -358,117 +570,68 @@ def get_next_question(req: QuestionRequest):
         return {"error": str(e)}
 
 @app.get("/session/{session_id}")
-def get_session_data(session_id: str):
+async def get_session_data(session_id: str):
     """Get full session data including all conversations"""
     try:
-        session = get_session(session_id)
+        session = await get_session_async(session_id)
         return session
     except Exception as e:
         return {"error": str(e)}
 
 @app.post("/complete-session/{session_id}")
-def finish_session(session_id: str):
+async def finish_session(session_id: str):
     """Mark session as complete"""
     try:
-        complete_session(session_id)
+        await complete_session_async(session_id)
         return {"message": "Session completed", "session_id": session_id}
     except Exception as e:
         return {"error": str(e)}
 
+frame_filter = FrameFilter()
+frame_batcher = FrameBatcher(lambda request_body: run_blocking(invoke_claude, request_body, service='bedrock'))
+local_scorer = LocalScorer()
+
+async def analyze_frame(req: BodyLanguageRequest) -> Dict[str, Any]:
+    """Score a frame locally when the face detector is confident, otherwise with Claude vision (batched if enabled)"""
+    signature = None
+    if FRAME_FILTER_ENABLED:
+        try:
+            signature = frame_signature(req.image_base64)
+        except Exception as e:
+            print(f"Frame signature error: {e}")
+    
+    if signature:
+        reused = frame_filter.reusable_result(req.session_id, signature)
+        if reused is not None:
+            return {**reused, "reused": True}
+    
+    if local_scorer.available:
+        try:
+            local = await run_blocking(local_scorer.assess, req.session_id, req.image_base64, service='vision')
+            if local is not None:
+                return {**local, "local": True}
+        except Exception as e:
+            print(f"Local scorer error: {e}")
+    
+    if BATCH_ENABLED:
+        feedback_data = await frame_batcher.submit(req)
+    else:
+        feedback_text = await run_blocking(invoke_claude, body_language_request_body(req), service='bedrock')
+        feedback_data = parse_body_language(feedback_text)
+    if feedback_data is None or feedback_data == DEFAULT_BODY_LANGUAGE_FEEDBACK:
+        return dict(DEFAULT_BODY_LANGUAGE_FEEDBACK)
+    if signature:
+        frame_filter.remember(req.session_id, signature, feedback_data)
+    local_scorer.remember(req.session_id, feedback_data)
+    return feedback_data
+
 @app.post("/analyze-body-language")
-def analyze_body_language(req: BodyLanguageRequest):
+async def analyze_body_language(req: BodyLanguageRequest):
     """Analyze body language from webcam frame"""
     try:
         from decimal import Decimal
         
-        prompt = f"""You are a BRUTALLY HONEST body language coach analyzing a mock interview.
-
-Analyze this frame at {req.timestamp:.0f} seconds:
-Question: '{req.question}'
-User state: {req.user_state}
-
-BE HONEST AND STRICT:
-- Multiple people in frame = HIGH severity ("Only one person should be visible")
-- Looking away from camera = MEDIUM/HIGH severity ("Look directly at the camera")
-- Slouched posture = MEDIUM severity ("Sit up straight")
-- Fidgeting, head shaking = MEDIUM severity ("Stay still and composed")
-- Distracted/bored expression = MEDIUM severity ("Show engagement and interest")
-- Unprofessional background = MEDIUM severity ("Use a clean, professional background")
-- Poor lighting = LOW severity ("Improve lighting on your face")
-
-SCORING (be strict):
-- 0-4: Major issues (multiple people, looking away, slouched)
-- 5-6: Noticeable issues (occasional poor posture, some fidgeting)
-- 7-8: Good but minor improvements needed
-- 9-10: Excellent professional presence
-
-Respond in JSON format:
-{{
-  "strengths": ["brief strength if any"],
-  "improvements": ["specific issue"],
-  "actionable_tip": "IMMEDIATE action to take NOW",
-  "severity_level": "low/medium/high",
-  "eye_contact_score": 0-10,
-  "posture_score": 0-10,
-  "engagement_score": 0-10,
-  "professionalism_score": 0-10
-}}
-
-Be BRUTALLY HONEST. Set severity to HIGH for serious issues. Don't be lenient."""
-        
-        request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 800,
-            "temperature": 0.5,
-            "messages": [{
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "image/jpeg",
-                            "data": req.image_base64
-                        }
-                    },
-                    {
-                        "type": "text",
-                        "text": prompt
-                    }
-                ]
-            }]
-        }
-        
-        response = bedrock.invoke_model(
-            modelId='anthropic.claude-3-5-sonnet-20241022-v2:0',
-            body=json.dumps(request_body)
-        )
-        
-        response_body = json.loads(response['body'].read())
-        feedback_text = response_body['content'][0]['text']
-        
-        # Parse JSON from response
-        import re
-        json_match = re.search(r'\{[^}]+\}', feedback_text, re.DOTALL)
-        if json_match:
-            feedback_data = json.loads(json_match.group())
-        else:
-            feedback_data = {
-                "strengths": ["Maintaining presence"],
-                "improvements": ["Continue monitoring posture"],
-                "actionable_tip": "Keep engaging with the camera",
-                "severity_level": "low",
-                "eye_contact_score": 7,
-                "posture_score": 7,
-                "engagement_score": 7,
-                "professionalism_score": 7
-            }
-        
-        # Store in DynamoDB with Decimal conversion
-        from dynamodb_service import dynamodb, TABLE_NAME
-        table = dynamodb.Table(TABLE_NAME)
-        session = table.get_item(Key={'session_id': req.session_id}).get('Item', {})
-        body_language_data = session.get('body_language_analysis', [])
+        feedback_data = await analyze_frame(req)
         
         # Convert to DynamoDB-compatible format
         db_feedback = {
@@ -486,11 +649,9 @@ Be BRUTALLY HONEST. Set severity to HIGH for serious issues. Don't be lenient.""
             'question': req.question
         }
         
-        body_language_data.append(db_feedback)
-        table.update_item(
-            Key={'session_id': req.session_id},
-            UpdateExpression='SET body_language_analysis = :b',
-            ExpressionAttributeValues={':b': body_language_data}
+        await asyncio.gather(
+            put_body_language_frame_async(req.session_id, db_feedback),
+            update_body_language_summary_async(req.session_id, db_feedback)
         )
         
         severity = feedback_data.get('severity_level', 'low')
@@ -514,61 +675,103 @@ Be BRUTALLY HONEST. Set severity to HIGH for serious issues. Don't be lenient.""
             "error": str(e)
         }
 
+def top_phrases(counts: Dict[str, Any], k: int = 3) -> List[str]:
+    return [phrase for phrase, _ in sorted(counts.items(), key=lambda item: -item[1])[:k]]
+
+def report_from_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the report from the running aggregates maintained by analyze_body_language"""
+    total_frames = int(summary.get('frame_count', 0))
+    averages = {
+        score: float(summary.get(f'{score}_sum', 0)) / total_frames
+        for score in BODY_LANGUAGE_SCORES
+    }
+    critical_moments = sorted(
+        ({'timestamp': float(m['timestamp']), 'issue': m['issue']} for m in summary.get('critical_moments', {}).values()),
+        key=lambda m: m['timestamp']
+    )
+    return {
+        "overall_scores": {
+            "eye_contact": round(averages['eye_contact_score'], 1),
+            "posture": round(averages['posture_score'], 1),
+            "engagement": round(averages['engagement_score'], 1),
+            "professionalism": round(averages['professionalism_score'], 1)
+        },
+        "top_strengths": top_phrases(summary.get('strength_counts', {})),
+        "top_improvements": top_phrases(summary.get('improvement_counts', {})),
+        "critical_moments": critical_moments,
+        "total_frames_analyzed": total_frames
+    }
+
+def report_from_frames(body_language_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Recompute the report from every stored frame; used to verify the running aggregates"""
+    from collections import Counter
+    
+    total_frames = len(body_language_data)
+    avg_eye_contact = sum(float(f['feedback'].get('eye_contact_score', 0)) for f in body_language_data) / total_frames
+    avg_posture = sum(float(f['feedback'].get('posture_score', 0)) for f in body_language_data) / total_frames
+    avg_engagement = sum(float(f['feedback'].get('engagement_score', 0)) for f in body_language_data) / total_frames
+    avg_professionalism = sum(float(f['feedback'].get('professionalism_score', 0)) for f in body_language_data) / total_frames
+    
+    all_strengths = []
+    all_improvements = []
+    critical_moments = []
+    
+    for frame in body_language_data:
+        feedback = frame['feedback']
+        all_strengths.extend(str(p).strip()[:200] for p in feedback.get('strengths', []) if str(p).strip())
+        all_improvements.extend(str(p).strip()[:200] for p in feedback.get('improvements', []) if str(p).strip())
+        if is_critical(feedback):
+            critical_moments.append({
+                'timestamp': float(frame['timestamp']),
+                'issue': feedback.get('actionable_tip') or 'Review this moment'
+            })
+    
+    return {
+        "overall_scores": {
+            "eye_contact": round(avg_eye_contact, 1),
+            "posture": round(avg_posture, 1),
+            "engagement": round(avg_engagement, 1),
+            "professionalism": round(avg_professionalism, 1)
+        },
+        "top_strengths": top_phrases(Counter(all_strengths)),
+        "top_improvements": top_phrases(Counter(all_improvements)),
+        # The summary only keeps the most recent critical moments
+        "critical_moments": critical_moments[-MAX_CRITICAL_MOMENTS:],
+        "total_frames_analyzed": total_frames,
+        "_strength_counts": Counter(all_strengths),
+        "_improvement_counts": Counter(all_improvements)
+    }
+
+def compare_reports(incremental: Dict[str, Any], full: Dict[str, Any]) -> Dict[str, Any]:
+    """List fields where the incremental report disagrees with full recomputation"""
+    differences = {}
+    for field in ['total_frames_analyzed', 'overall_scores', 'critical_moments']:
+        if incremental[field] != full[field]:
+            differences[field] = {"incremental": incremental[field], "recomputed": full[field]}
+    # Ties can be ordered differently, so compare how often each top phrase occurred
+    for field, counts in [('top_strengths', full['_strength_counts']), ('top_improvements', full['_improvement_counts'])]:
+        if sorted(counts[p] for p in incremental[field]) != sorted(counts[p] for p in full[field]):
+            differences[field] = {"incremental": incremental[field], "recomputed": full[field]}
+    return {"consistent": not differences, "differences": differences}
+
 @app.get("/body-language-report/{session_id}")
-def get_body_language_report(session_id: str):
-    """Get comprehensive body language report for session"""
+async def get_body_language_report(session_id: str, verify: bool = False):
+    """Get comprehensive body language report for session; verify=true also recomputes it from all frames"""
     try:
-        from dynamodb_service import dynamodb, TABLE_NAME
-        from decimal import Decimal
-        
-        table = dynamodb.Table(TABLE_NAME)
-        session = table.get_item(Key={'session_id': session_id}).get('Item', {})
-        body_language_data = session.get('body_language_analysis', [])
+        summary = await get_body_language_summary_async(session_id)
         
-        if not body_language_data:
+        if not summary.get('frame_count'):
             return {"message": "No body language data available"}
         
-        # Calculate aggregated metrics (convert Decimal to float)
-        total_frames = len(body_language_data)
-        avg_eye_contact = sum(float(f['feedback'].get('eye_contact_score', 0)) for f in body_language_data) / total_frames
-        avg_posture = sum(float(f['feedback'].get('posture_score', 0)) for f in body_language_data) / total_frames
-        avg_engagement = sum(float(f['feedback'].get('engagement_score', 0)) for f in body_language_data) / total_frames
-        avg_professionalism = sum(float(f['feedback'].get('professionalism_score', 0)) for f in body_language_data) / total_frames
+        report = report_from_summary(summary)
+        scores = report['overall_scores']
+        print(f"📊 Body language report: {report['total_frames_analyzed']} frames, avg scores: eye={scores['eye_contact']:.1f}, posture={scores['posture']:.1f}")
         
-        # Collect all strengths and improvements
-        all_strengths = []
-        all_improvements = []
-        critical_moments = []
+        if verify:
+            full_report = report_from_frames(await get_body_language_frames_async(session_id))
+            report['consistency_check'] = compare_reports(report, full_report)
         
-        for frame in body_language_data:
-            feedback = frame['feedback']
-            all_strengths.extend(feedback.get('strengths', []))
-            all_improvements.extend(feedback.get('improvements', []))
-            if feedback.get('severity_level') in ['high', 'medium']:
-                critical_moments.append({
-                    'timestamp': float(frame['timestamp']),
-                    'issue': feedback.get('actionable_tip', 'Review this moment')
-                })
-        
-        # Get top 3 unique strengths and improvements
-        from collections import Counter
-        top_strengths = [s for s, _ in Counter(all_strengths).most_common(3)]
-        top_improvements = [i for i, _ in Counter(all_improvements).most_common(3)]
-        
-        print(f"📊 Body language report: {total_frames} frames, avg scores: eye={avg_eye_contact:.1f}, posture={avg_posture:.1f}")
-        
-        return {
-            "overall_scores": {
-                "eye_contact": round(avg_eye_contact, 1),
-                "posture": round(avg_posture, 1),
-                "engagement": round(avg_engagement, 1),
-                "professionalism": round(avg_professionalism, 1)
-            },
-            "top_strengths": top_strengths,
-            "top_improvements": top_improvements,
-            "critical_moments": critical_moments,
-            "total_frames_analyzed": total_frames
-        }
+        return report
         
     except Exception as e:
         print(f"❌ Error generating body language report: {e}")
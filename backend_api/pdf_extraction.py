@@ -0,0 +1,79 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from aws_executor import run_blocking
+
+PDF_MAX_BYTES = int(os.getenv('PDF_MAX_BYTES', str(10 * 1024 * 1024)))
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '30'))
+# Worker processes for page extraction; PyPDF2 is pure Python, so threads would serialize on the GIL
+PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', str(min(4, os.cpu_count() or 1))))
+# Short resumes are extracted in one worker; splitting them costs more than it saves
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '6'))
+UPLOAD_CHUNK_BYTES = 256 * 1024
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn, not fork: forking a process that already runs boto3 and executor threads can deadlock
+        _pool = ProcessPoolExecutor(max_workers=PDF_EXTRACT_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+    return _pool
+
+def shutdown_pdf_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
+
+def count_pages(path: str) -> int:
+    import PyPDF2
+    return len(PyPDF2.PdfReader(path).pages)
+
+def extract_page_range(path: str, start: int, end: int) -> List[str]:
+    """Text of pages [start, end); runs in a worker process that opens the file itself"""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[i].extract_text() or '' for i in range(start, end)]
+
+async def spool_upload(upload, suffix: str = '.pdf') -> str:
+    """Copy an UploadFile to a temp file in chunks, enforcing PDF_MAX_BYTES; returns its path"""
+    size = 0
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > PDF_MAX_BYTES:
+                    raise ValueError(f"File too large (max {PDF_MAX_BYTES // (1024 * 1024)}MB)")
+                out.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+async def extract_pdf_text(upload) -> Dict[str, Any]:
+    """Extract text from an uploaded PDF without blocking the event loop"""
+    path = await spool_upload(upload)
+    try:
+        page_count = await run_blocking(count_pages, path, service='pdf')
+        if page_count > PDF_MAX_PAGES:
+            raise ValueError(f"PDF has {page_count} pages (max {PDF_MAX_PAGES})")
+
+        chunks = 1 if page_count < PDF_PARALLEL_MIN_PAGES else min(PDF_EXTRACT_WORKERS, page_count)
+        bounds = [(page_count * i // chunks, page_count * (i + 1) // chunks) for i in range(chunks)]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(_get_pool(), extract_page_range, path, start, end) for start, end in bounds
+        ))
+        text = '\n'.join(page for pages in results for page in pages).strip()
+        return {"resume_text": text, "chars": len(text), "pages": page_count}
+    finally:
+        os.remove(path)
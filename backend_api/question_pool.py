@@ -0,0 +1,102 @@
+import asyncio
+import os
+from collections import OrderedDict, deque
+from typing import Any, Dict, Set
+
+from interview_generator import generate_interview_questions_async
+from result_cache import make_cache_key, normalize_text
+
+QUESTION_POOL_ENABLED = os.getenv('QUESTION_POOL_ENABLED', 'false').lower() == 'true'
+# Variants kept per (job, skill profile); each start-interview consumes one
+QUESTION_POOL_SIZE = int(os.getenv('QUESTION_POOL_SIZE', '5'))
+# Start a background refill once a pool drops to this many variants
+QUESTION_POOL_REFILL_AT = int(os.getenv('QUESTION_POOL_REFILL_AT', '2'))
+QUESTION_POOL_MAX_JOBS = int(os.getenv('QUESTION_POOL_MAX_JOBS', '256'))
+# How many resume skills matching the job define a bucket
+SKILL_BUCKET_SIZE = 5
+
+_pools: 'OrderedDict[str, deque]' = OrderedDict()
+_refilling: Set[str] = set()
+_refill_tasks: Set[asyncio.Task] = set()
+_stats = {'hits': 0, 'misses': 0, 'variants_generated': 0, 'refill_failures': 0}
+
+def skill_profile(resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The job-relevant skills a candidate has and their seniority - all a pooled variant is generated from"""
+    job_skills = {normalize_text(str(s)).lower() for s in job_data.get('required_skills', []) + job_data.get('preferred_skills', [])}
+    resume_skills = {normalize_text(str(s)).lower() for s in resume_data.get('skills', [])}
+    roles = len(resume_data.get('experience', []))
+    return {
+        'skills': sorted(resume_skills & job_skills)[:SKILL_BUCKET_SIZE],
+        'seniority': 'none' if roles == 0 else 'some' if roles <= 2 else 'many'
+    }
+
+def skill_profile_bucket(profile: Dict[str, Any]) -> str:
+    return f"{profile['seniority']}:{','.join(profile['skills'])}"
+
+def pool_key(job_title: str, job_description: str, profile: Dict[str, Any]) -> str:
+    """Keyed on the posting as submitted, so LLM parsing variance can't split one job across pools"""
+    return make_cache_key(normalize_text(job_title).lower(), normalize_text(job_description).lower(), skill_profile_bucket(profile))
+
+def _get_pool(key: str) -> deque:
+    pool = _pools.get(key)
+    if pool is None:
+        pool = deque()
+        _pools[key] = pool
+        while len(_pools) > QUESTION_POOL_MAX_JOBS:
+            _pools.popitem(last=False)
+    _pools.move_to_end(key)
+    return pool
+
+async def _refill(key: str, profile: Dict[str, Any], job_data: Dict[str, Any]):
+    """Generate variants concurrently until the pool is back to QUESTION_POOL_SIZE"""
+    try:
+        missing = QUESTION_POOL_SIZE - len(_get_pool(key))
+        if missing <= 0:
+            return
+        results = await asyncio.gather(*(generate_interview_questions_async(profile, job_data) for _ in range(missing)))
+        pool = _get_pool(key)
+        for result in results:
+            if 'error' in result:
+                _stats['refill_failures'] += 1
+                continue
+            pool.append(result)
+            _stats['variants_generated'] += 1
+    finally:
+        _refilling.discard(key)
+
+def _schedule_refill(key: str, profile: Dict[str, Any], job_data: Dict[str, Any]):
+    if key in _refilling:
+        return
+    _refilling.add(key)
+    task = asyncio.create_task(_refill(key, profile, job_data))
+    _refill_tasks.add(task)
+    task.add_done_callback(_refill_tasks.discard)
+
+async def get_question_set(resume_data: Dict[str, Any], job_data: Dict[str, Any], job_title: str, job_description: str) -> Dict[str, Any]:
+    """Serve a pre-generated question set for this job and skill profile, generating one on a cold pool
+
+    Variants are shared by everyone in the bucket, so they are generated from the job and the bucket's
+    skill profile only - never from one candidate's full resume
+    """
+    profile = skill_profile(resume_data, job_data)
+    key = pool_key(job_title, job_description, profile)
+    pool = _get_pool(key)
+
+    if pool:
+        _stats['hits'] += 1
+        result = pool.popleft()
+    else:
+        _stats['misses'] += 1
+        result = await generate_interview_questions_async(profile, job_data)
+
+    if len(pool) <= QUESTION_POOL_REFILL_AT:
+        _schedule_refill(key, profile, job_data)
+    return result
+
+def pool_stats() -> Dict[str, Any]:
+    return {
+        **_stats,
+        'pools': len(_pools),
+        'pooled_variants': sum(len(pool) for pool in _pools.values()),
+        'refills_in_flight': len(_refilling)
+    }
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+CACHE_ENABLED = os.getenv('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+CACHE_MAX_ENTRIES = int(os.getenv('PARSE_CACHE_MAX_ENTRIES', '1024'))
+CACHE_TTL_SECONDS = int(os.getenv('PARSE_CACHE_TTL_SECONDS', str(7 * 86400)))
+# Set to an empty string to keep the cache in memory only
+CACHE_DB_PATH = os.getenv('PARSE_CACHE_DB_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'parse_cache.sqlite3'))
+CACHE_DB_MAX_ENTRIES = int(os.getenv('PARSE_CACHE_DB_MAX_ENTRIES', '50000'))
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so re-uploads that differ only in formatting share a key"""
+    return ' '.join(text.split())
+
+def make_cache_key(*parts: str) -> str:
+    """Content-address a cache entry by hashing all of its inputs"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+class ResultCache:
+    """Two-tier cache: in-process LRU in front of a SQLite table, both TTL and size bounded"""
+
+    def __init__(self, name: str, max_entries: int = CACHE_MAX_ENTRIES, ttl_seconds: int = CACHE_TTL_SECONDS,
+                 db_path: Optional[str] = CACHE_DB_PATH, db_max_entries: int = CACHE_DB_MAX_ENTRIES):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_max_entries = db_max_entries
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._db = None
+        if db_path:
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS results (namespace TEXT, key TEXT, value TEXT, expires_at REAL, accessed_at REAL, '
+                'PRIMARY KEY (namespace, key))'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (namespace, accessed_at)')
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[1] > now:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return json.loads(entry[0])
+            if entry:
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT value, expires_at FROM results WHERE namespace = ? AND key = ?', (self.name, key)
+                ).fetchone()
+                if row and row[1] > now:
+                    self._db.execute('UPDATE results SET accessed_at = ? WHERE namespace = ? AND key = ?', (now, self.name, key))
+                    self._db.commit()
+                    self._remember(key, row[0], row[1])
+                    self._stats['disk_hits'] += 1
+                    return json.loads(row[0])
+                if row:
+                    self._db.execute('DELETE FROM results WHERE namespace = ? AND key = ?', (self.name, key))
+                    self._db.commit()
+
+            self._stats['misses'] += 1
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        serialized = json.dumps(value)
+        with self._lock:
+            self._remember(key, serialized, expires_at)
+            self._stats['stores'] += 1
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO results (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                    (self.name, key, serialized, expires_at, now)
+                )
+                # Drop expired rows, then the least recently used ones beyond the size bound
+                self._db.execute('DELETE FROM results WHERE namespace = ? AND expires_at <= ?', (self.name, now))
+                self._db.execute(
+                    'DELETE FROM results WHERE namespace = ? AND key IN ('
+                    'SELECT key FROM results WHERE namespace = ? ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self.name, self.name, self.db_max_entries)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, serialized: str, expires_at: float):
+        self._memory[key] = (serialized, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats['memory_hits'] + self._stats['disk_hits'] + self._stats['misses']
+            hits = lookups - self._stats['misses']
+            return {
+                **self._stats,
+                'memory_entries': len(self._memory),
+                'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+            }
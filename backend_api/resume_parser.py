@@ -1,12 +1,84 @@
 import json
-import boto3
-import re
-from typing import Dict, Any
+import os
+from collections import Counter
+from typing import Dict, Any, List
+from aws_executor import run_blocking
+from aws_clients import lazy_client
+from local_resume_parser import LOCAL_PARSER_VERSION, RESUME_FIELDS, parse_resume_locally
+from result_cache import CACHE_ENABLED, ResultCache, make_cache_key, normalize_text
+from structured_output import conform, json_messages, parse_completion
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name='us-west-2')
+bedrock_runtime = lazy_client('bedrock-runtime')
+
+# Bump these whenever a prompt below changes so stale cached results are not served
+RESUME_PROMPT_VERSION = 'resume-v2'
+JOB_PROMPT_VERSION = 'job-v2'
+
+# 'hybrid' parses locally first and asks Claude only for fields the rules couldn't fill; 'llm' always asks Claude
+RESUME_PARSER_MODE = os.getenv('RESUME_PARSER_MODE', 'hybrid').lower()
+
+RESUME_FIELD_SCHEMAS = {
+    'name': '"name": "candidate name"',
+    'skills': '"skills": ["list of technical skills"]',
+    'soft_skills': '"soft_skills": ["list of soft skills"]',
+    'experience': '"experience": [\n    {"company": "name", "position": "title", "duration": "time", "responsibilities": ["list"]}\n  ]',
+    'projects': '"projects": [\n    {"name": "project name", "technologies": ["tech used"], "description": "brief desc"}\n  ]',
+    'education': '"education": [\n    {"degree": "degree name", "institution": "school", "year": "year"}\n  ]'
+}
+RESUME_SCHEMA = {'name': str, 'skills': [str], 'soft_skills': [str], 'experience': [dict], 'projects': [dict], 'education': [dict]}
+EMPTY_RESUME = {'name': '', 'skills': [], 'soft_skills': [], 'experience': [], 'projects': [], 'education': []}
+JOB_SCHEMA = {
+    'title': str,
+    'required_skills': [str],
+    'preferred_skills': [str],
+    'responsibilities': [str],
+    'company_values': [str],
+    'experience_level': str
+}
+
+resume_cache = ResultCache('resume') if CACHE_ENABLED else None
+job_cache = ResultCache('job_description') if CACHE_ENABLED else None
+# How each resume parse was answered: 'local', 'partial_llm' or 'llm'
+parse_sources = Counter()
 
 def parse_resume(resume_text: str, model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
-    """Parse resume text into structured data"""
+    """Parse resume text into structured data, reusing the cached result for a previously seen resume"""
+    version = RESUME_PROMPT_VERSION if RESUME_PARSER_MODE == 'llm' else f"{RESUME_PROMPT_VERSION}+{LOCAL_PARSER_VERSION}"
+    key = make_cache_key(version, model_id, normalize_text(resume_text))
+    if resume_cache:
+        cached = resume_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    result = _parse_resume_uncached(resume_text, model_id)
+    if resume_cache and 'error' not in result:
+        resume_cache.set(key, result)
+    return result
+
+def _parse_resume_uncached(resume_text: str, model_id: str) -> Dict[str, Any]:
+    if RESUME_PARSER_MODE != 'hybrid':
+        parse_sources['llm'] += 1
+        result = _parse_resume_llm(resume_text, model_id, RESUME_FIELDS)
+        return result if 'error' in result else conform(result, RESUME_SCHEMA, EMPTY_RESUME)
+    
+    local, missing = parse_resume_locally(resume_text)
+    if not missing:
+        parse_sources['local'] += 1
+        return local
+    
+    # Empty optional fields ride along, since the round trip is being paid anyway
+    fields = [field for field in RESUME_FIELDS if field in missing or not local[field]]
+    parse_sources['partial_llm' if len(fields) < len(RESUME_FIELDS) else 'llm'] += 1
+    print(f"Resume parsed locally; asking Claude for {fields}")
+    result = _parse_resume_llm(resume_text, model_id, fields)
+    if 'error' in result:
+        return result
+    # Fields Claude left out or mistyped keep the local value
+    result = conform(result, {field: RESUME_SCHEMA[field] for field in fields}, local)
+    return {**local, **{field: result[field] for field in fields}}
+
+def _parse_resume_llm(resume_text: str, model_id: str, fields: List[str]) -> Dict[str, Any]:
+    schema = ',\n  '.join(RESUME_FIELD_SCHEMAS[field] for field in fields)
     prompt = f"""Extract structured information from this resume and return as JSON:
 
 Resume:
@@ -14,18 +86,7 @@ Resume:
 
 Return a JSON object with these keys:
 {{
-  "name": "candidate name",
-  "skills": ["list of technical skills"],
-  "soft_skills": ["list of soft skills"],
-  "experience": [
-    {{"company": "name", "position": "title", "duration": "time", "responsibilities": ["list"]}}
-  ],
-  "projects": [
-    {{"name": "project name", "technologies": ["tech used"], "description": "brief desc"}}
-  ],
-  "education": [
-    {{"degree": "degree name", "institution": "school", "year": "year"}}
-  ]
+  {schema}
 }}"""
     
     try:
@@ -37,25 +98,30 @@ Return a JSON object with these keys:
                 'anthropic_version': 'bedrock-2023-05-31',
                 'max_tokens': 1500,
                 'temperature': 0.3,
-                'messages': [{'role': 'user', 'content': prompt}]
+                'messages': json_messages(prompt)
             })
         )
         
         response_body = json.loads(response['body'].read())
-        content = response_body['content'][0]['text'].strip()
-        
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return {"error": "Failed to parse resume"}
+        result = parse_completion(response_body['content'][0]['text'])
+        return result if result is not None else {"error": "Failed to parse resume"}
     except Exception as e:
         return {"error": f"Resume parsing failed: {str(e)}"}
 
 def parse_job_description(job_desc: str, job_title: str, model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
-    """Parse job description into structured data"""
+    """Parse job description into structured data, reusing the cached result for a previously seen posting"""
+    key = make_cache_key(JOB_PROMPT_VERSION, model_id, normalize_text(job_title), normalize_text(job_desc))
+    if job_cache:
+        cached = job_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    result = _parse_job_description_uncached(job_desc, job_title, model_id)
+    if job_cache and 'error' not in result:
+        job_cache.set(key, result)
+    return result
+
+def _parse_job_description_uncached(job_desc: str, job_title: str, model_id: str) -> Dict[str, Any]:
     prompt = f"""Extract structured information from this job description and return as JSON:
 
 Job Title: {job_title}
@@ -81,19 +147,31 @@ Return a JSON object with these keys:
                 'anthropic_version': 'bedrock-2023-05-31',
                 'max_tokens': 1000,
                 'temperature': 0.3,
-                'messages': [{'role': 'user', 'content': prompt}]
+                'messages': json_messages(prompt)
             })
         )
         
         response_body = json.loads(response['body'].read())
-        content = response_body['content'][0]['text'].strip()
-        
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+        result = parse_completion(response_body['content'][0]['text'])
+        if result is None:
             return {"error": "Failed to parse job description"}
+        return conform(result, JOB_SCHEMA, {**{field: [] for field in JOB_SCHEMA}, 'title': job_title, 'experience_level': ''})
     except Exception as e:
         return {"error": f"Job description parsing failed: {str(e)}"}
+
+async def parse_resume_async(resume_text: str, model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
+    """Async variant of parse_resume for use in FastAPI handlers"""
+    return await run_blocking(parse_resume, resume_text, model_id, service='bedrock')
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the resume and job description caches"""
+    return {
+        'resume': resume_cache.stats() if resume_cache else None,
+        'job_description': job_cache.stats() if job_cache else None,
+        'resume_parse_sources': dict(parse_sources),
+        'resume_parser_mode': RESUME_PARSER_MODE
+    }
+
+async def parse_job_description_async(job_desc: str, job_title: str, model_id: str = 'anthropic.claude-3-5-sonnet-20241022-v2:0') -> Dict[str, Any]:
+    """Async variant of parse_job_description for use in FastAPI handlers"""
+    return await run_blocking(parse_job_description, job_desc, job_title, model_id, service='bedrock')
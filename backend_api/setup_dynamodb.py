@@ -1,8 +1,14 @@
-import boto3
+from dotenv import load_dotenv
+
+# Before dynamodb_service reads BODY_LANGUAGE_TABLE
+load_dotenv()
+
+from aws_clients import get_resource  # noqa: E402
+from dynamodb_service import BODY_LANGUAGE_TABLE_NAME, BODY_LANGUAGE_KEY_SCHEMA, BODY_LANGUAGE_ATTRIBUTES  # noqa: E402
 
 def setup_dynamodb():
-    """Create DynamoDB table for interview sessions"""
-    dynamodb = boto3.resource('dynamodb', region_name='us-west-2')
+    """Create DynamoDB tables for interview sessions and body language frames"""
+    dynamodb = get_resource('dynamodb')
     
     try:
         table = dynamodb.create_table(
@@ -24,6 +30,23 @@ def setup_dynamodb():
         print("✅ Table 'InterviewSessions' already exists")
     except Exception as e:
         print(f"❌ Error: {e}")
+    
+    try:
+        table = dynamodb.create_table(
+            TableName=BODY_LANGUAGE_TABLE_NAME,
+            KeySchema=BODY_LANGUAGE_KEY_SCHEMA,
+            AttributeDefinitions=BODY_LANGUAGE_ATTRIBUTES,
+            BillingMode='PAY_PER_REQUEST'
+        )
+        
+        print("Creating body language table...")
+        table.wait_until_exists()
+        print(f"✅ DynamoDB table '{BODY_LANGUAGE_TABLE_NAME}' created successfully!")
+        
+    except dynamodb.meta.client.exceptions.ResourceInUseException:
+        print(f"✅ Table '{BODY_LANGUAGE_TABLE_NAME}' already exists")
+    except Exception as e:
+        print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
     setup_dynamodb()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Modules in backend/shared are packaged into the Lambdas as well; the API imports them from the checkout
+SHARED_MODULES_DIR = os.getenv('SHARED_MODULES_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend', 'shared'))
+if SHARED_MODULES_DIR not in sys.path:
+    sys.path.append(SHARED_MODULES_DIR)
@@ -0,0 +1,162 @@
+import abc
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, Optional
+
+from aws_executor import run_blocking
+
+# aws (S3 + Amazon Transcribe) or faster-whisper (local CPU decoding)
+TRANSCRIPTION_ENGINE = os.getenv('TRANSCRIPTION_ENGINE', 'aws')
+
+# Exponential backoff between Transcribe status checks
+POLL_INITIAL_DELAY = float(os.getenv('TRANSCRIBE_POLL_INITIAL_DELAY', '1.0'))
+POLL_MAX_DELAY = float(os.getenv('TRANSCRIBE_POLL_MAX_DELAY', '10.0'))
+POLL_BACKOFF = float(os.getenv('TRANSCRIBE_POLL_BACKOFF', '1.5'))
+JOB_TIMEOUT_SECONDS = float(os.getenv('TRANSCRIBE_JOB_TIMEOUT', '600'))
+
+# Same variables and defaults as backend/lambda/audio_processor/handler.py (the Lambda can't import this
+# module) - change both together so the API and the Lambda decode identically.
+# Multilingual by default because the Lambda also transcribes es/fr/de
+WHISPER_MODEL_SIZE = os.getenv('WHISPER_MODEL_SIZE', 'base')
+WHISPER_COMPUTE_TYPE = os.getenv('WHISPER_COMPUTE_TYPE', 'int8')
+WHISPER_CPU_THREADS = int(os.getenv('WHISPER_CPU_THREADS', '0'))  # 0 = let CTranslate2 decide
+WHISPER_BEAM_SIZE = int(os.getenv('WHISPER_BEAM_SIZE', '1'))
+WHISPER_VAD_FILTER = os.getenv('WHISPER_VAD_FILTER', 'true').lower() == 'true'
+# Seconds of audio decoded per window; partial transcripts are published after each window
+WHISPER_CHUNK_SECONDS = int(os.getenv('WHISPER_CHUNK_SECONDS', '30'))
+# Interview answers are English (AwsTranscribeEngine uses en-US); naming it skips language detection
+WHISPER_LANGUAGE = os.getenv('WHISPER_LANGUAGE', 'en')
+
+PartialCallback = Callable[[str], None]
+
+def fetch_json(uri: str) -> Dict[str, Any]:
+    with urllib.request.urlopen(uri) as response:
+        return json.loads(response.read())
+
+class TranscriptionEngine(abc.ABC):
+    """Turns recorded answer audio into text"""
+    name = 'base'
+
+    @abc.abstractmethod
+    async def transcribe(self, job_id: str, audio_bytes: bytes, media_format: str,
+                         on_partial: Optional[PartialCallback] = None) -> str:
+        """Transcript of the audio, calling on_partial with the text so far if the engine can"""
+
+class AwsTranscribeEngine(TranscriptionEngine):
+    """Uploads to S3 and runs an Amazon Transcribe batch job"""
+    name = 'aws'
+
+    def __init__(self, s3_client, transcribe_client, bucket: str):
+        self.s3 = s3_client
+        self.transcribe_client = transcribe_client
+        self.bucket = bucket
+
+    async def transcribe(self, job_id: str, audio_bytes: bytes, media_format: str,
+                         on_partial: Optional[PartialCallback] = None) -> str:
+        s3_key = f"audio/{job_id}.{media_format}"
+        started = False
+        try:
+            await run_blocking(self.s3.put_object, Bucket=self.bucket, Key=s3_key, Body=audio_bytes)
+            await run_blocking(
+                self.transcribe_client.start_transcription_job,
+                TranscriptionJobName=job_id,
+                Media={'MediaFileUri': f's3://{self.bucket}/{s3_key}'},
+                MediaFormat=media_format,
+                LanguageCode='en-US'
+            )
+            started = True
+
+            delay = POLL_INITIAL_DELAY
+            deadline = time.monotonic() + JOB_TIMEOUT_SECONDS
+            while True:
+                status = await run_blocking(self.transcribe_client.get_transcription_job, TranscriptionJobName=job_id)
+                job_status = status['TranscriptionJob']['TranscriptionJobStatus']
+                if job_status in ('COMPLETED', 'FAILED'):
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Transcription did not finish within {JOB_TIMEOUT_SECONDS:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+            if job_status != 'COMPLETED':
+                raise RuntimeError(status['TranscriptionJob'].get('FailureReason', 'Transcription failed'))
+            transcript_data = await run_blocking(fetch_json, status['TranscriptionJob']['Transcript']['TranscriptFileUri'])
+            return transcript_data['results']['transcripts'][0]['transcript']
+        finally:
+            # Cleanup
+            try:
+                if started:
+                    await run_blocking(self.transcribe_client.delete_transcription_job, TranscriptionJobName=job_id)
+                await run_blocking(self.s3.delete_object, Bucket=self.bucket, Key=s3_key)
+            except Exception as cleanup_error:
+                print(f"Transcription cleanup error for {job_id}: {cleanup_error}")
+
+class FasterWhisperEngine(TranscriptionEngine):
+    """Decodes locally on CPU with faster-whisper; no S3 or Transcribe round trip"""
+    name = 'faster-whisper'
+
+    def __init__(self, model_size: str = WHISPER_MODEL_SIZE, compute_type: str = WHISPER_COMPUTE_TYPE,
+                 cpu_threads: int = WHISPER_CPU_THREADS, beam_size: int = WHISPER_BEAM_SIZE,
+                 vad_filter: bool = WHISPER_VAD_FILTER, chunk_seconds: int = WHISPER_CHUNK_SECONDS,
+                 language: str = WHISPER_LANGUAGE):
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        self.chunk_seconds = chunk_seconds
+        # English-only *.en models take no language argument
+        self.language = None if model_size.endswith('.en') else language
+        self._model = None
+        # Up to STT_MAX_CONCURRENCY first jobs arrive together; only one of them loads the model
+        self._load_lock = threading.Lock()
+
+    def load(self):
+        """Load the model on first use; it takes seconds and hundreds of MB"""
+        with self._load_lock:
+            if self._model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError:
+                    raise RuntimeError("TRANSCRIPTION_ENGINE=faster-whisper requires `pip install faster-whisper`")
+                self._model = WhisperModel(self.model_size, device='cpu', compute_type=self.compute_type, cpu_threads=self.cpu_threads)
+        return self._model
+
+    def transcribe_blocking(self, audio, on_partial: Optional[PartialCallback] = None) -> str:
+        """Decode audio (path, file object or bytes), reporting the transcript so far after each segment"""
+        if isinstance(audio, (bytes, bytearray)):
+            audio = io.BytesIO(audio)
+        segments, _info = self.load().transcribe(
+            audio,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=self.vad_filter,
+            chunk_length=self.chunk_seconds,
+            condition_on_previous_text=False
+        )
+        # segments is a generator: decoding happens window by window as we iterate
+        parts = []
+        for segment in segments:
+            parts.append(segment.text.strip())
+            if on_partial:
+                on_partial(' '.join(parts))
+        return ' '.join(parts)
+
+    async def transcribe(self, job_id: str, audio_bytes: bytes, media_format: str,
+                         on_partial: Optional[PartialCallback] = None) -> str:
+        loop = asyncio.get_running_loop()
+        publish = (lambda text: loop.call_soon_threadsafe(on_partial, text)) if on_partial else None
+        return await run_blocking(self.transcribe_blocking, audio_bytes, publish, service='stt')
+
+def create_engine(s3_client=None, transcribe_client=None, bucket: str = '') -> TranscriptionEngine:
+    """Build the engine selected by TRANSCRIPTION_ENGINE"""
+    if TRANSCRIPTION_ENGINE == 'faster-whisper':
+        return FasterWhisperEngine()
+    if TRANSCRIPTION_ENGINE == 'aws':
+        return AwsTranscribeEngine(s3_client, transcribe_client, bucket)
+    raise ValueError(f"Unknown TRANSCRIPTION_ENGINE: {TRANSCRIPTION_ENGINE}")
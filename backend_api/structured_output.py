@@ -0,0 +1,38 @@
+import copy
+from typing import Any, Dict, List, Optional
+
+import shared_modules  # noqa: F401
+# The feedback_generator Lambda parses its replies with the same function
+from json_extraction import extract_json
+
+# Claude's reply is prefilled with the opening brace, so it can't start with prose
+JSON_PREFILL = '{'
+
+def json_messages(content: Any) -> List[Dict[str, Any]]:
+    """User turn plus the assistant turn that opens the JSON object"""
+    return [
+        {'role': 'user', 'content': content},
+        {'role': 'assistant', 'content': JSON_PREFILL}
+    ]
+
+def parse_completion(text: str) -> Optional[Dict[str, Any]]:
+    """JSON object from a completion requested with json_messages; also accepts replies that repeat the brace"""
+    return extract_json(JSON_PREFILL + text)
+
+def _matches(value: Any, expected: Any) -> bool:
+    if isinstance(expected, list):
+        return isinstance(value, list) and all(_matches(item, expected[0]) for item in value)
+    if expected in (int, float):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    return isinstance(value, expected)
+
+def schema_errors(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
+    """Fields that are missing or have the wrong type; schema maps field -> type, or [type] for a list"""
+    return [field for field, expected in schema.items() if field not in data or not _matches(data[field], expected)]
+
+def conform(data: Dict[str, Any], schema: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """data with every schema field well-typed, taking defaults for the fields Claude got wrong or left out"""
+    invalid = schema_errors(data, schema)
+    if invalid:
+        print(f"Structured output missing or mistyped {invalid}; using defaults")
+    return {**data, **{field: copy.deepcopy(defaults[field]) for field in invalid}}
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Tests import the API modules the way main.py does, from backend_api/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
@@ -0,0 +1,58 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+from moto import mock_aws
+from moto.dynamodb.models import DynamoDBBackend
+
+import dynamodb_service
+
+WRITERS = 50
+
+
+def serialized(method, lock):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return method(*args, **kwargs)
+    return wrapper
+
+
+@pytest.fixture
+def sessions_table(monkeypatch):
+    """The real sessions table schema under moto, which evaluates add_conversation's UpdateExpression"""
+    # DynamoDB applies each request atomically; moto's in-memory backend doesn't, so each request holds a
+    # lock. Separate get_item/put_item requests can still interleave and lose turns, as they would on AWS
+    lock = threading.Lock()
+    for name in ('get_item', 'put_item', 'update_item'):
+        monkeypatch.setattr(DynamoDBBackend, name, serialized(getattr(DynamoDBBackend, name), lock))
+    for name in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN'):
+        monkeypatch.setenv(name, 'testing')
+    with mock_aws():
+        monkeypatch.setattr(dynamodb_service, 'dynamodb', boto3.resource('dynamodb', region_name='us-west-2'))
+        assert dynamodb_service.create_table_if_not_exists()
+        yield dynamodb_service.dynamodb.Table(dynamodb_service.TABLE_NAME)
+
+
+def test_parallel_writers_keep_every_turn(sessions_table):
+    sessions_table.put_item(Item={'session_id': 's1', 'status': 'active', 'created_at': 'then', 'conversations': []})
+
+    with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+        list(pool.map(lambda i: dynamodb_service.add_conversation('s1', f'Q{i}', f'A{i}', 'feedback', {'i': i}),
+                      range(WRITERS)))
+
+    session = dynamodb_service.get_session('s1')
+    assert sorted(turn['question'] for turn in session['conversations']) == sorted(f'Q{i}' for i in range(WRITERS))
+    assert session['created_at'] == 'then' and session['status'] == 'active'
+
+
+def test_missing_session_is_created_with_the_turn(sessions_table, capsys):
+    dynamodb_service.add_conversation('new', 'Q1', 'A1', 'feedback', {'i': 1})
+    dynamodb_service.add_conversation('new', 'Q2', 'A2', 'feedback', {'i': 2})
+
+    session = dynamodb_service.get_session('new')
+    assert [turn['question'] for turn in session['conversations']] == ['Q1', 'Q2']
+    assert session['status'] == 'active' and session['created_at'] == session['conversations'][0]['timestamp']
+    assert capsys.readouterr().out.count('not found, created minimal session') == 1
@@ -0,0 +1,60 @@
+import importlib.util
+import os
+import sys
+import threading
+import types
+
+HANDLER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'backend', 'lambda', 'audio_processor', 'handler.py')
+
+spec = importlib.util.spec_from_file_location('audio_processor_handler', HANDLER_PATH)
+audio_processor = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(audio_processor)
+
+KEY = 'interviews/i1/questions/q1/audio_20260101_120000.webm'
+
+
+class FakeS3:
+    def download_file(self, bucket, key, path):
+        with open(path, 'w') as f:
+            f.write(key)
+
+
+def test_concurrent_local_transcriptions_use_their_own_files_and_one_model(monkeypatch):
+    loads = []
+    both_decoding = threading.Barrier(2, timeout=5)
+
+    class WhisperModel:
+        def __init__(self, *args, **kwargs):
+            loads.append(args)
+
+        def transcribe(self, path, language=None, **kwargs):
+            # Both answers are on disk at once; neither may see or delete the other's file
+            both_decoding.wait()
+            with open(path) as f:
+                audio = f.read()
+            return [types.SimpleNamespace(text=f' {audio} {language} ')], None
+
+    monkeypatch.setitem(sys.modules, 'faster_whisper', types.SimpleNamespace(WhisperModel=WhisperModel))
+    monkeypatch.setattr(audio_processor, 'whisper_model', None)
+    monkeypatch.setattr(audio_processor, 'get_client', lambda service: FakeS3())
+    results, paths = [], []
+    real_mkstemp = audio_processor.tempfile.mkstemp
+    monkeypatch.setattr(audio_processor.tempfile, 'mkstemp',
+                        lambda **kwargs: paths.append(real_mkstemp(**kwargs)) or paths[-1])
+
+    threads = [threading.Thread(target=lambda: results.append(audio_processor.transcribe_locally(f's3://audio/{KEY}', 'es-US')))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [f'{KEY} es', f'{KEY} es']
+    assert len(loads) == 1
+    assert len({path for _, path in paths}) == 2 and not any(os.path.exists(path) for _, path in paths)
+
+
+def test_english_only_models_get_no_language():
+    assert audio_processor.whisper_language('base.en', 'fr-FR') is None
+    assert audio_processor.whisper_language('base', 'fr-FR') == 'fr'
@@ -0,0 +1,27 @@
+import asyncio
+
+import aws_executor
+
+
+async def contended_calls(count):
+    # More concurrent calls than the limit, so callers actually wait on the semaphore
+    return await asyncio.gather(*(aws_executor.run_blocking(lambda i=i: i, service='polly') for i in range(count)))
+
+
+def test_run_blocking_works_across_event_loops():
+    count = aws_executor.POLLY_MAX_CONCURRENCY * 2
+    for _ in range(3):
+        assert asyncio.run(contended_calls(count)) == list(range(count))
+
+
+def test_semaphores_are_per_loop():
+    async def semaphore():
+        return aws_executor._get_semaphore('bedrock')
+
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        assert loop_a.run_until_complete(semaphore()) is loop_a.run_until_complete(semaphore())
+        assert loop_a.run_until_complete(semaphore()) is not loop_b.run_until_complete(semaphore())
+    finally:
+        loop_a.close()
+        loop_b.close()
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import dynamodb_service
+import main
+
+
+class FrameTable:
+    """Frames keyed like the real table: (session_id, frame_id), put_item overwrites on the same key"""
+
+    def __init__(self):
+        self.items = {}
+
+    def put_item(self, Item):
+        self.items[(Item['session_id'], Item['frame_id'])] = Item
+
+    def query(self, KeyConditionExpression):
+        frames = [item for (_, frame_id), item in sorted(self.items.items()) if frame_id >= 0]
+        return {'Items': frames}
+
+    def Table(self, name):
+        return self
+
+
+def frame(timestamp, tip):
+    return {'timestamp': Decimal(str(timestamp)), 'feedback': {'actionable_tip': tip}, 'question': 'Q1'}
+
+
+def test_frames_sharing_a_client_timestamp_are_all_kept(monkeypatch):
+    table = FrameTable()
+    monkeypatch.setattr(dynamodb_service, 'dynamodb', table)
+
+    dynamodb_service.put_body_language_frame('s1', frame(10, 'first'))
+    dynamodb_service.put_body_language_frame('s1', frame(10, 'retry'))
+    dynamodb_service.put_body_language_frame('s1', frame(5, 'second tab'))
+
+    frames = dynamodb_service.get_body_language_frames('s1')
+    assert len(frames) == 3
+    assert [f['timestamp'] for f in frames] == [5, 10, 10]
+    assert {f['feedback']['actionable_tip'] for f in frames[1:]} == {'first', 'retry'}
+
+
+class SummaryTable:
+    """Applies just the critical-moment parts of the summary updates"""
+
+    def __init__(self):
+        self.count = 0
+        self.moments = {}
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues, ExpressionAttributeNames=None, **kwargs):
+        if 'critical_moment_count :one' in UpdateExpression:
+            self.count += 1
+            return {'Attributes': {'critical_moment_count': Decimal(self.count)}}
+        if 'critical_moments.#slot' in UpdateExpression:
+            self.moments[ExpressionAttributeNames['#slot']] = ExpressionAttributeValues[':moment']
+        return {}
+
+    def Table(self, name):
+        return self
+
+
+def test_critical_moments_keep_only_the_most_recent(monkeypatch):
+    table = SummaryTable()
+    monkeypatch.setattr(dynamodb_service, 'dynamodb', table)
+    monkeypatch.setattr(dynamodb_service, 'MAX_CRITICAL_MOMENTS', 3)
+
+    for second in range(5):
+        dynamodb_service.update_body_language_summary('s1', {
+            'timestamp': Decimal(second), 'feedback': {'severity_level': 'high', 'actionable_tip': f'tip {second}'}})
+
+    assert sorted(moment['issue'] for moment in table.moments.values()) == ['tip 2', 'tip 3', 'tip 4']
+
+
+def test_negative_client_timestamp_is_an_ordinary_frame(monkeypatch):
+    table = FrameTable()
+    monkeypatch.setattr(dynamodb_service, 'dynamodb', table)
+
+    dynamodb_service.put_body_language_frame('s1', frame(-1, 'clock skew'))
+    dynamodb_service.put_body_language_frame('s1', frame(3, 'later'))
+
+    frames = dynamodb_service.get_body_language_frames('s1')
+    assert [f['feedback']['actionable_tip'] for f in frames] == ['clock skew', 'later']
+    assert all(key[1] != dynamodb_service.SUMMARY_FRAME_ID for key in table.items)
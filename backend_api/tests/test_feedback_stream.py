@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+import main
+
+CHUNKS = ["**Content Analysis:**\nClear ", "example.\n\n**Strengths:**\n- Quantified ", "result\n\n**Score: 7/10**"]
+
+
+def delta(text):
+    return {'chunk': {'bytes': json.dumps({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': text}}).encode()}}
+
+
+def stream_events(chunks, error=None):
+    yield {'chunk': {'bytes': json.dumps({'type': 'message_start'}).encode()}}
+    for text in chunks:
+        yield delta(text)
+    if error:
+        raise error
+    yield {'chunk': {'bytes': json.dumps({'type': 'message_stop'}).encode()}}
+
+
+class FakeBedrock:
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    def invoke_model_with_response_stream(self, modelId, body):
+        return {'body': stream_events(self.chunks, self.error)}
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    turns = []
+
+    async def add_conversation_async(session_id, question, response, feedback, metrics):
+        turns.append(feedback)
+
+    monkeypatch.setattr(main, 'add_conversation_async', add_conversation_async)
+    return turns
+
+
+def collect(req):
+    async def run():
+        return [event async for event in main.feedback_event_stream(req)]
+
+    events = []
+    for raw in asyncio.run(run()):
+        name, data = raw.strip().split('\n')
+        events.append((name[len('event: '):], json.loads(data[len('data: '):])))
+    return events
+
+
+def request():
+    return main.FeedbackRequest(session_id='s1', question='Tell me about a project.', response='I built...',
+                                word_count=120, duration=60)
+
+
+def test_stream_emits_deltas_then_sections_then_complete(monkeypatch, stored):
+    monkeypatch.setattr(main, 'bedrock', FakeBedrock(CHUNKS))
+
+    events = collect(request())
+
+    assert [name for name, _ in events] == ['delta', 'delta', 'section', 'delta', 'section', 'complete']
+    assert [data['text'] for name, data in events if name == 'delta'] == CHUNKS
+    assert [data for name, data in events if name == 'section'] == [
+        {'title': 'Content Analysis', 'content': 'Clear example.'},
+        {'title': 'Strengths', 'content': '- Quantified result\n\n**Score: 7/10**'},
+    ]
+    complete = events[-1][1]
+    assert complete['feedback'] == ''.join(CHUNKS)
+    assert complete['score'] == 7
+    assert complete['pace_wpm'] == 120
+    assert stored == [''.join(CHUNKS)]
+
+
+def test_stream_error_falls_back_to_canned_feedback(monkeypatch, stored):
+    monkeypatch.setattr(main, 'bedrock', FakeBedrock(CHUNKS[:1], error=RuntimeError('throttled')))
+
+    events = collect(request())
+
+    assert [name for name, _ in events] == ['delta', 'complete']
+    complete = events[-1][1]
+    fallback, score, _ = main.fallback_feedback(request(), 120, complete['pace_assessment'])
+    assert complete['feedback'] == fallback
+    assert complete['score'] == score
+    assert stored == [fallback]
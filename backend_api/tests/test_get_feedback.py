@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+import main
+from structured_output import JSON_PREFILL
+
+MARKDOWN = "**Content Analysis:**\nSpecific example.\n\n**Expected Answer:**\nA STAR story.\n\n**Score: 7/10**"
+
+
+class FakeClaude:
+    def __init__(self, completion):
+        self.completion = completion
+        self.requests = []
+
+    def __call__(self, request_body):
+        self.requests.append(request_body)
+        return self.completion
+
+
+@pytest.fixture
+def stubs(monkeypatch):
+    followups = []
+
+    async def add_conversation_async(*args):
+        pass
+
+    async def get_job_context_async(session_id):
+        return 'Backend Engineer - Python on AWS'
+
+    async def generate_followup_question_async(question, answer, job_context):
+        followups.append(question)
+        return 'What would you change?'
+
+    monkeypatch.setattr(main, 'add_conversation_async', add_conversation_async)
+    monkeypatch.setattr(main, 'get_job_context_async', get_job_context_async)
+    monkeypatch.setattr(main, 'generate_followup_question_async', generate_followup_question_async)
+    return followups
+
+
+def feedback(claude, monkeypatch, request_followup):
+    monkeypatch.setattr(main, 'invoke_claude', claude)
+    req = main.FeedbackRequest(session_id='s1', question='Tell me about a project.', response='I built...',
+                               word_count=120, duration=60, request_followup=request_followup)
+    return asyncio.run(main.get_feedback(req))
+
+
+def prefilled(request_body):
+    return request_body['messages'][-1] == {'role': 'assistant', 'content': JSON_PREFILL}
+
+
+def test_feedback_without_followup_is_plain_markdown(monkeypatch, stubs):
+    claude = FakeClaude(MARKDOWN)
+
+    result = feedback(claude, monkeypatch, request_followup=False)
+
+    assert not prefilled(claude.requests[0])
+    assert result['feedback'] == MARKDOWN
+    assert result['score'] == 7 and result['expected_answer'] == 'A STAR story.'
+    assert result['followup_question'] is None
+
+
+def test_fused_disabled_uses_markdown_and_a_separate_followup(monkeypatch, stubs):
+    monkeypatch.setattr(main, 'FUSED_FEEDBACK_ENABLED', False)
+    claude = FakeClaude(MARKDOWN)
+
+    result = feedback(claude, monkeypatch, request_followup=True)
+
+    assert len(claude.requests) == 1 and not prefilled(claude.requests[0])
+    assert result['feedback'] == MARKDOWN
+    assert result['followup_question'] == 'What would you change?' and stubs == ['Tell me about a project.']
+
+
+def test_fused_feedback_and_followup_in_one_call(monkeypatch, stubs):
+    monkeypatch.setattr(main, 'FUSED_FEEDBACK_ENABLED', True)
+    completion = json.dumps({'feedback': MARKDOWN, 'score': 7, 'expected_answer': 'A STAR story.',
+                             'followup_question': 'Why Lambda?'})[1:]
+    claude = FakeClaude(completion)
+
+    result = feedback(claude, monkeypatch, request_followup=True)
+
+    assert prefilled(claude.requests[0])
+    assert result['feedback'] == MARKDOWN and result['followup_question'] == 'Why Lambda?' and stubs == []
+
+
+def test_truncated_fused_json_falls_back_to_unescaped_feedback(monkeypatch, stubs):
+    monkeypatch.setattr(main, 'FUSED_FEEDBACK_ENABLED', True)
+    # Cut off at max_tokens in the middle of the feedback string, after the prefilled '{'
+    completion = json.dumps({'feedback': MARKDOWN + "\n\nCafé answers run long"})[1:-12]
+    claude = FakeClaude(completion)
+
+    result = feedback(claude, monkeypatch, request_followup=True)
+
+    assert result['feedback'].startswith(MARKDOWN)
+    assert '\\n' not in result['feedback'] and '"feedback"' not in result['feedback']
+    assert result['score'] == 7
+    assert result['followup_question'] == 'What would you change?'
+
+
+@pytest.mark.parametrize('content, expected', [
+    ('\n  "feedback": "**Score:** line one\\nline two\\u00e9', '**Score:** line one\nline twoé'),
+    ('"feedback": "cut mid escape \\u00', 'cut mid escape'),
+    ('"feedback": "ends on a backslash \\', 'ends on a backslash'),
+    ('**Content Analysis:**\nPlain Markdown', '**Content Analysis:**\nPlain Markdown'),
+])
+def test_partial_feedback(content, expected):
+    assert main.partial_feedback(content) == expected
@@ -0,0 +1,21 @@
+import shared_modules  # noqa: F401
+import lambda_clients
+
+
+def test_clients_are_shared_per_read_timeout(monkeypatch):
+    monkeypatch.delenv('AWS_READ_TIMEOUT', raising=False)
+    monkeypatch.setattr(lambda_clients, '_clients', {})
+
+    default = lambda_clients.get_client('s3')
+    claude = lambda_clients.get_client('s3', read_timeout=120)
+
+    assert lambda_clients.get_client('s3') is default
+    assert default is not claude
+    assert (default.meta.config.read_timeout, claude.meta.config.read_timeout) == (60, 120)
+
+
+def test_read_timeout_can_be_overridden(monkeypatch):
+    monkeypatch.setenv('AWS_READ_TIMEOUT', '30')
+    monkeypatch.setattr(lambda_clients, '_clients', {})
+
+    assert lambda_clients.get_client('s3', read_timeout=120).meta.config.read_timeout == 30
@@ -0,0 +1,105 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+HANDLER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'backend', 'lambda', 'interview_orchestrator', 'handler.py')
+
+spec = importlib.util.spec_from_file_location('interview_orchestrator_handler', HANDLER_PATH)
+orchestrator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(orchestrator)
+
+SAVE = {'action': 'save_response', 'session_id': 's1', 'question': 'Tell me about a project.', 'feedback': 'Good'}
+
+
+@pytest.fixture
+def inline_inprocess(monkeypatch):
+    monkeypatch.setattr(orchestrator, 'DISPATCH_MODE', 'inprocess')
+    monkeypatch.setattr(orchestrator, 'MOCK_MODE', False)
+    # Inside Lambda the background call runs inline, which keeps the test synchronous
+    monkeypatch.setenv('AWS_LAMBDA_FUNCTION_NAME', 'interview-orchestrator')
+    monkeypatch.setattr(orchestrator.time, 'sleep', lambda seconds: None)
+
+
+def test_failed_save_is_retried_and_logged(monkeypatch, capsys, inline_inprocess):
+    results = [{'statusCode': 500, 'body': json.dumps({'error': 'throttled'})}, {'statusCode': 200, 'body': '{}'}]
+    calls = []
+    monkeypatch.setattr(orchestrator, 'invoke_lambda', lambda name, payload: calls.append(payload) or results.pop(0))
+
+    orchestrator.invoke_lambda_async('feedback_generator', SAVE)
+
+    assert calls == [SAVE, SAVE]
+    log = capsys.readouterr().out
+    assert "session s1" in log and "'Tell me about a project.'" in log and 'attempt 1/2' in log
+
+
+def test_save_gives_up_after_the_configured_attempts(monkeypatch, capsys, inline_inprocess):
+    calls = []
+    monkeypatch.setattr(orchestrator, 'invoke_lambda', lambda name, payload: calls.append(payload) or {'statusCode': 500})
+
+    orchestrator.invoke_lambda_async('feedback_generator', SAVE)
+
+    assert len(calls) == orchestrator.BACKGROUND_ATTEMPTS
+    assert f'attempt {orchestrator.BACKGROUND_ATTEMPTS}/{orchestrator.BACKGROUND_ATTEMPTS}' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('duration, word_timings, expected', [
+    (42.5, None, 42.5),
+    (None, [{'word': 'so', 'start_time': 0.4, 'end_time': 0.7}, {'word': 'yes', 'start_time': 30.1, 'end_time': 30.6}], 30.6),
+    (0, [{'word': 'so', 'start': 0.2, 'end': 12.0}], 12.0),
+    (None, [{'word': 'so', 'start_time': 8.0}], 8.0),
+    (None, None, None),
+    (-3, [], None),
+    (True, None, None),
+])
+def test_answer_duration(duration, word_timings, expected):
+    assert orchestrator.answer_duration(duration, word_timings) == expected
+
+
+class SessionTable:
+    def Table(self, name):
+        return self
+
+    def get_item(self, Key):
+        return {'Item': {'session_id': Key['session_id'], 'current_question': {'question': 'Tell me about a project.'}}}
+
+
+@pytest.fixture
+def answer_calls(monkeypatch):
+    """process_response against the real audio_processor handler and a canned feedback_generator"""
+    monkeypatch.setattr(orchestrator, 'DISPATCH_MODE', 'inprocess')
+    monkeypatch.setattr(orchestrator, 'MOCK_MODE', False)
+    monkeypatch.setattr(orchestrator, 'get_client', lambda service_name, kind='client': SessionTable())
+    calls = []
+
+    def invoke_lambda(function_name, payload):
+        calls.append((function_name, payload))
+        if function_name == 'audio_processor':
+            return orchestrator.get_handler(function_name)(payload, None)
+        return {'statusCode': 200, 'body': json.dumps({'feedback': 'Good'})}
+
+    monkeypatch.setattr(orchestrator, 'invoke_lambda', invoke_lambda)
+    monkeypatch.setattr(orchestrator, 'invoke_lambda_async', lambda function_name, payload: None)
+    return calls
+
+
+def test_answer_without_a_duration_gets_metrics_without_pace(answer_calls):
+    result = orchestrator.process_response({'session_id': 's1', 'transcript': 'Um, I led the migration.'})
+
+    assert result['statusCode'] == 200
+    metrics = json.loads(result['body'])['metrics']
+    assert metrics['filler_count'] == 1 and metrics['word_count'] == 5
+    assert 'pace_wpm' not in metrics
+    feedback_payload = next(payload for name, payload in answer_calls if payload['action'] == 'analyze_response')
+    assert feedback_payload['metrics'] == metrics
+
+
+def test_audio_is_rejected_before_upload_when_transcripts_are_not_inline(monkeypatch, answer_calls):
+    monkeypatch.setattr(orchestrator, 'TRANSCRIPTION_ENGINE', 'aws')
+
+    result = orchestrator.process_response({'session_id': 's1', 'audio_data': 'UklGRg==', 'duration': 30})
+
+    assert result['statusCode'] == 400
+    assert answer_calls == []
@@ -0,0 +1,32 @@
+import asyncio
+
+import question_pool
+
+JOB = {'title': 'Backend Engineer', 'required_skills': ['Python', 'AWS'], 'preferred_skills': ['Docker']}
+
+
+def resume(name, skills):
+    return {'name': name, 'email': f'{name}@example.com', 'skills': skills,
+            'experience': [{'company': 'Acme', 'position': 'Engineer'}]}
+
+
+def test_variants_are_generated_from_the_job_and_skill_profile_only(monkeypatch):
+    calls = []
+
+    async def generate(resume_data, job_data):
+        calls.append(resume_data)
+        return {'technical_questions': ['Q'], 'behavioral_questions': [], 'rationale': ''}
+
+    monkeypatch.setattr(question_pool, 'generate_interview_questions_async', generate)
+    monkeypatch.setattr(question_pool, '_pools', question_pool.OrderedDict())
+
+    async def start(candidate, description):
+        await question_pool.get_question_set(candidate, JOB, 'Backend Engineer', description)
+        await asyncio.gather(*question_pool._refill_tasks)
+
+    asyncio.run(start(resume('ana', ['Python', 'AWS', 'Go']), 'Build  Python services on AWS.'))
+    # Same bucket and the same posting modulo whitespace/case: served from the pool
+    asyncio.run(start(resume('ben', ['aws', 'python', 'Rust']), 'build python services\non AWS.'))
+
+    assert len(question_pool._pools) == 1
+    assert calls and all(call == {'skills': ['aws', 'python'], 'seniority': 'some'} for call in calls)
@@ -0,0 +1,44 @@
+import importlib.util
+import os
+
+import pytest
+
+import local_resume_parser
+
+HANDLER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'backend', 'lambda', 'resume_analyzer', 'handler.py')
+
+
+def load_resume_analyzer():
+    spec = importlib.util.spec_from_file_location('resume_analyzer_handler', HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+resume_analyzer = load_resume_analyzer()
+
+
+def lambda_skills(text):
+    return {skill for _, skill in resume_analyzer.find_skills(text, resume_analyzer.SKILL_INDEX)}
+
+
+def api_skills(text):
+    return {skill for _, skill in local_resume_parser.find_skills(text)}
+
+
+@pytest.mark.parametrize('skills', [lambda_skills, api_skills])
+@pytest.mark.parametrize('text, expected', [
+    ('Built APIs with Node.js and Express', {'Node.js', 'Express'}),
+    ('Frontends in React.js and Vue.js', {'React', 'Vue.js'}),
+    ('Express.js services', {'Express'}),
+    ('Tuned SQL Server queries', {'SQL Server'}),
+    ('Wrote JS and SQL', {'JavaScript', 'SQL'}),
+])
+def test_longest_skill_wins(skills, text, expected):
+    assert skills(text) == expected
+
+
+def test_api_and_lambda_share_the_matcher():
+    assert local_resume_parser.find_skill_mentions is resume_analyzer.find_skills
+    assert local_resume_parser.SKILL_TAXONOMY == resume_analyzer.SKILL_TAXONOMY
@@ -0,0 +1,39 @@
+import importlib.util
+import os
+
+import json_extraction
+import structured_output
+from json_extraction import MAX_OBJECT_STARTS
+
+HANDLER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'backend', 'lambda', 'feedback_generator', 'handler.py')
+
+spec = importlib.util.spec_from_file_location('feedback_generator_handler', HANDLER_PATH)
+feedback_generator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(feedback_generator)
+
+
+def test_extract_json_skips_preambles_and_fences():
+    assert structured_output.extract_json('Sure! {not json} ```json\n{"a": {"b": 1}}\n``` done {"c": 2}') == {'a': {'b': 1}}
+
+
+def test_extract_json_gives_up_after_a_bounded_number_of_braces(monkeypatch):
+    assert structured_output.extract_json('{' * MAX_OBJECT_STARTS + '{"a": 1}') is None
+    # Every brace opens an object that runs to the end of the text, so trying them all is quadratic
+    malformed = ('{"a": [' + '1, ' * 50) * 500
+    attempts = []
+    real_decode = json_extraction._decoder.raw_decode
+    monkeypatch.setattr(json_extraction._decoder, 'raw_decode', lambda *args: attempts.append(args) or real_decode(*args))
+    assert structured_output.extract_json(malformed) is None
+    assert len(attempts) == MAX_OBJECT_STARTS
+
+
+def test_extract_json_survives_deeply_nested_truncated_replies():
+    assert structured_output.extract_json('{"a": [' * 5000) is None
+
+
+def test_parse_questions_uses_the_shared_extractor():
+    text = 'Here you go:\n```json\n{"leadership": " Tell me about leading a team. ", "teamwork": 3}\n```\nNote {x}'
+    assert feedback_generator.extract_json is structured_output.extract_json
+    assert feedback_generator.parse_questions(text, ['leadership', 'teamwork', 'adaptability']) == {
+        'leadership': 'Tell me about leading a team.'}
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from speech_to_text import TranscriptionEngine
+
+# Finished jobs are kept this long for clients to fetch
+JOB_RETENTION_SECONDS = float(os.getenv('TRANSCRIBE_JOB_RETENTION', '3600'))
+
+class TranscriptionJobManager:
+    """Runs transcriptions as background asyncio tasks so request handlers return immediately"""
+
+    def __init__(self, engine: TranscriptionEngine):
+        self.engine = engine
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._done: Dict[str, asyncio.Event] = {}
+        self._tasks = set()
+
+    def submit(self, audio_bytes: bytes, media_format: str = 'wav') -> Dict[str, Any]:
+        """Register a job and start processing it in the background"""
+        self._evict_finished()
+        job_id = f"interview-{uuid.uuid4()}"
+        now = time.time()
+        self._jobs[job_id] = {'job_id': job_id, 'status': 'QUEUED', 'engine': self.engine.name, 'created_at': now, 'updated_at': now}
+        self._done[job_id] = asyncio.Event()
+        task = asyncio.create_task(self._run(job_id, audio_bytes, media_format))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return dict(self._jobs[job_id])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Long-poll: return once the job finishes or the timeout elapses"""
+        done = self._done.get(job_id)
+        if done is None:
+            return None
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        return counts
+
+    def _update(self, job_id: str, **fields):
+        self._jobs[job_id].update(fields, updated_at=time.time())
+        if fields.get('status') in ('COMPLETED', 'FAILED'):
+            self._done[job_id].set()
+
+    def _evict_finished(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job_id in [j for j, job in self._jobs.items() if job['status'] in ('COMPLETED', 'FAILED') and job['updated_at'] < cutoff]:
+            del self._jobs[job_id]
+            del self._done[job_id]
+
+    async def _run(self, job_id: str, audio_bytes: bytes, media_format: str):
+        self._update(job_id, status='IN_PROGRESS')
+        try:
+            transcript = await self.engine.transcribe(
+                job_id, audio_bytes, media_format,
+                on_partial=lambda text: self._update(job_id, partial_transcript=text)
+            )
+            self._update(job_id, status='COMPLETED', transcript=transcript)
+        except Exception as e:
+            print(f"Transcription job {job_id} error: {e}")
+            self._update(job_id, status='FAILED', error=str(e))
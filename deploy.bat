@@ -8,11 +8,14 @@ REM Configuration
 set STACK_NAME=interview-coach-stack
 set ENVIRONMENT=dev
 set AWS_REGION=us-west-2
+REM inprocess deploys the orchestrator as a monolith that calls the audio and feedback handlers directly
+if not defined DISPATCH_MODE set DISPATCH_MODE=lambda
 
 echo 📋 Deployment Configuration:
 echo    Stack Name: %STACK_NAME%
 echo    Environment: %ENVIRONMENT%
 echo    Region: %AWS_REGION%
+echo    Dispatch Mode: %DISPATCH_MODE%
 echo.
 
 REM Check AWS CLI
@@ -37,22 +40,32 @@ REM Step 1: Package Lambda functions
 echo.
 echo 📦 Step 1: Packaging Lambda functions...
 
+REM Every handler imports lambda_clients.py from backend\shared
 cd backend\lambda\interview_orchestrator
-powershell -Command "Compress-Archive -Path * -DestinationPath function.zip -Force"
+powershell -Command "Compress-Archive -Path *,..\..\shared\lambda_clients.py -DestinationPath function.zip -Force"
 cd ..\..\..
 
 cd backend\lambda\audio_processor
-powershell -Command "Compress-Archive -Path * -DestinationPath function.zip -Force"
+powershell -Command "Compress-Archive -Path *,..\..\shared\lambda_clients.py -DestinationPath function.zip -Force"
 cd ..\..\..
 
 cd backend\lambda\resume_analyzer
-powershell -Command "Compress-Archive -Path * -DestinationPath function.zip -Force"
+REM skill_matching.py and the taxonomy are shared with the API and live in backend\shared
+powershell -Command "Compress-Archive -Path *,..\..\shared\lambda_clients.py,..\..\shared\skill_matching.py,..\..\shared\skills_taxonomy.json -DestinationPath function.zip -Force"
 cd ..\..\..
 
 cd backend\lambda\feedback_generator
-powershell -Command "Compress-Archive -Path * -DestinationPath function.zip -Force"
+REM json_extraction.py is shared with the API and lives in backend\shared
+powershell -Command "Compress-Archive -Path *,..\..\shared\lambda_clients.py,..\..\shared\json_extraction.py -DestinationPath function.zip -Force"
 cd ..\..\..
 
+REM A monolith orchestrator also carries the handlers it calls, in the subdirectories get_handler
+REM looks in, plus the shared modules they import that the orchestrator doesn't
+if /I "%DISPATCH_MODE%"=="inprocess" (
+    echo    Bundling audio-processor and feedback-generator into interview-orchestrator...
+    powershell -Command "$s = Join-Path $env:TEMP 'orchestrator-monolith'; Remove-Item $s -Recurse -Force -ErrorAction SilentlyContinue; New-Item -ItemType Directory -Path $s\audio_processor,$s\feedback_generator | Out-Null; Copy-Item backend\lambda\audio_processor\handler.py $s\audio_processor; Copy-Item backend\lambda\feedback_generator\handler.py $s\feedback_generator; Compress-Archive -Path $s\audio_processor,$s\feedback_generator,backend\shared\json_extraction.py -DestinationPath backend\lambda\interview_orchestrator\function.zip -Update"
+)
+
 echo ✅ Lambda functions packaged
 
 REM Step 2: Deploy CloudFormation Stack
@@ -62,7 +75,7 @@ echo 📤 Step 2: Deploying CloudFormation stack...
 aws cloudformation deploy ^
     --template-file infrastructure\cloudformation\interview-coach-stack.yaml ^
     --stack-name %STACK_NAME% ^
-    --parameter-overrides Environment=%ENVIRONMENT% ^
+    --parameter-overrides Environment=%ENVIRONMENT% DispatchMode=%DISPATCH_MODE% ^
     --capabilities CAPABILITY_NAMED_IAM ^
     --region %AWS_REGION%
 
@@ -12,6 +12,8 @@ echo "=========================================="
 STACK_NAME="interview-coach-stack"
 ENVIRONMENT="dev"
 AWS_REGION="${AWS_REGION:-us-west-2}"
+# 'inprocess' deploys the orchestrator as a monolith that calls the audio and feedback handlers directly
+DISPATCH_MODE="${DISPATCH_MODE:-lambda}"
 # Validate AWS CLI and credentials
 if ! command -v aws &> /dev/null; then
     echo "❌ AWS CLI not found. Please install AWS CLI first."
@@ -29,6 +31,7 @@ echo "📋 Deployment Configuration:"
 echo "   Stack Name: $STACK_NAME"
 echo "   Environment: $ENVIRONMENT"
 echo "   Region: $AWS_REGION"
+echo "   Dispatch Mode: $DISPATCH_MODE"
 echo "   Account ID: $ACCOUNT_ID"
 echo ""
 
@@ -46,6 +49,10 @@ package_lambda() {
     # Create deployment package
     rm -f function.zip
     zip -r function.zip . -x "*.pyc" "__pycache__/*" "*.git/*" "tests/*"
+    # Files from backend/shared, flattened next to handler.py; every handler needs lambda_clients.py
+    for shared_file in lambda_clients.py "${@:3}"; do
+        zip -j function.zip "../../shared/$shared_file"
+    done
     
     cd - > /dev/null
     
@@ -55,8 +62,18 @@ package_lambda() {
 # Package each Lambda function
 package_lambda "interview-orchestrator" "backend/lambda/interview_orchestrator"
 package_lambda "audio-processor" "backend/lambda/audio_processor"
-package_lambda "resume-analyzer" "backend/lambda/resume_analyzer"
-package_lambda "feedback-generator" "backend/lambda/feedback_generator"
+package_lambda "resume-analyzer" "backend/lambda/resume_analyzer" skill_matching.py skills_taxonomy.json
+package_lambda "feedback-generator" "backend/lambda/feedback_generator" json_extraction.py
+
+# A monolith orchestrator also carries the handlers it calls, in the subdirectories get_handler
+# looks in, plus the shared modules they import that the orchestrator doesn't
+if [ "$DISPATCH_MODE" = "inprocess" ]; then
+    echo "   Bundling audio-processor and feedback-generator into interview-orchestrator..."
+    cd backend/lambda
+    zip interview_orchestrator/function.zip audio_processor/handler.py feedback_generator/handler.py
+    zip -j interview_orchestrator/function.zip ../shared/json_extraction.py
+    cd - > /dev/null
+fi
 
 echo ""
 
@@ -66,7 +83,7 @@ echo "📤 Step 2: Deploying CloudFormation stack..."
 aws cloudformation deploy \
     --template-file infrastructure/cloudformation/interview-coach-stack.yaml \
     --stack-name "$STACK_NAME" \
-    --parameter-overrides Environment="$ENVIRONMENT" \
+    --parameter-overrides Environment="$ENVIRONMENT" DispatchMode="$DISPATCH_MODE" \
     --capabilities CAPABILITY_NAMED_IAM \
     --region "$AWS_REGION"
 